@@ -31,7 +31,9 @@ class AppSettings:
             "confirm_exit": True,
             "default_site": "",
             "window_positions": {},
-            "dropdown_options": {}  # For customizable dropdowns
+            "dropdown_options": {},  # For customizable dropdowns
+            # Minutes an open event chain may go without a new log
+            "sla_thresholds": {"default_minutes": 15, "sites": {}, "call_types": {}}
         }
         
         if os.path.exists(self.config_file):
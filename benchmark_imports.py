@@ -0,0 +1,101 @@
+"""
+Measure the import time and resident memory of the panel modules.
+
+Each module is imported in a fresh interpreter, which reports how long
+the import took, its peak resident set size and whether pandas,
+NumPy or openpyxl were loaded along the way. The same is measured for
+pandas on its own, which is what a panel saves by not importing it.
+
+Usage::
+
+    python benchmark_imports.py                  # the logging panels
+    python benchmark_imports.py ui.stats_ui --repeat 5
+
+Set ``QT_QPA_PLATFORM=offscreen`` to run without a display.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules measured when none are given
+DEFAULT_MODULES = [
+    "ui.email_ui", "ui.phone_ui", "ui.radio_ui", "ui.everbridge_ui",
+    "ui.logs_viewer_ui", "ui.home", "log_manager",
+]
+# Heavy libraries whose presence after the import is reported
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl")
+
+# Runs in the child interpreter; prints one JSON line
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+except ImportError:
+    try:
+        import psutil
+        rss_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        rss_mb = None
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "rss_mb": rss_mb,
+    "loaded": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def probe(module: str) -> dict:
+    """Import ``module`` in a new interpreter and return its measurements."""
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(module: str, repeat: int) -> dict:
+    """Return the median import time and peak RSS over ``repeat`` runs."""
+    runs = [probe(module) for _ in range(repeat)]
+    rss = [run["rss_mb"] for run in runs if run["rss_mb"] is not None]
+    return {
+        "ms": statistics.median(run["ms"] for run in runs),
+        "rss_mb": statistics.median(rss) if rss else None,
+        "loaded": runs[-1]["loaded"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="modules to import")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module")
+    args = parser.parse_args()
+
+    print(f"{'module':<22} {'import ms':>10} {'peak RSS MB':>12}  heavy modules loaded")
+    for module in ["pandas", *args.modules]:
+        try:
+            result = measure(module, args.repeat)
+        except RuntimeError as e:
+            print(f"{module:<22} failed: {e}")
+            continue
+        rss = "n/a" if result["rss_mb"] is None else f"{result['rss_mb']:.1f}"
+        print(f"{module:<22} {result['ms']:10.1f} {rss:>12}  "
+              f"{', '.join(result['loaded']) or '-'}")
+    print("\nThe pandas row is the import time and memory a module saves by not loading it.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
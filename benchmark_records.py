@@ -0,0 +1,144 @@
+"""
+Benchmark the memory held by cached log rows as dicts vs. records.
+
+Fills an in-memory database shaped like the log tables and reads it
+back the way ``logic.event_handler`` does:
+
+* **before** - one dict per row with the source label and table name
+  as fetched (a new string object per row), as ``load_all_logs`` and
+  ``get_event_chains`` used to return.
+* **after** - ``LogRef`` and ``ChainSummary`` records, with the log
+  table stored as a small integer code.
+
+Memory is what ``tracemalloc`` sees allocated for the result list, so
+it excludes the interpreter and SQLite. Read times come from a
+separate, untraced run.
+
+Usage::
+
+    python benchmark_records.py                 # 1,000,000 logs
+    python benchmark_records.py --logs 200000 --chains 20000
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from database import LOG_TABLES
+from logic.records import SOURCE_CODES, ChainSummary, LogRef
+
+SITES = ["FSP", "HQ", "NRC", "WH2", "DC1", "LAB"]
+
+
+def make_database(logs: int, chains: int) -> sqlite3.Connection:
+    """Return an in-memory database with ``logs`` logs and ``chains`` chains."""
+    conn = sqlite3.connect(":memory:")
+    start = datetime(2025, 1, 1)
+    rng = random.Random(0)
+    tables = list(LOG_TABLES)
+    for table in tables:
+        conn.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, timestamp TEXT, summary TEXT)")
+    rows = {table: [] for table in tables}
+    for i in range(logs):
+        table = tables[i % len(tables)]
+        timestamp = (start + timedelta(seconds=37 * i)).strftime("%Y-%m-%d %H:%M:%S")
+        rows[table].append((timestamp, f"{LOG_TABLES[table]}: {rng.choice(SITES)} #{i}"))
+    for table, values in rows.items():
+        conn.executemany(f"INSERT INTO {table} (timestamp, summary) VALUES (?, ?)", values)
+    conn.execute(
+        "CREATE TABLE event_chains (id INTEGER PRIMARY KEY, title TEXT, created_at TEXT, "
+        "link_count INTEGER, first_ts TEXT, last_ts TEXT, last_activity TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO event_chains (title, created_at, link_count, first_ts, last_ts, last_activity) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (f"{rng.choice(SITES)} chain {i}", ts, 3, ts, ts, ts)
+            for i in range(chains)
+            for ts in [(start + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S")]
+        ),
+    )
+    return conn
+
+
+def read_logs_as_dicts(conn):
+    union = " UNION ALL ".join(
+        f"SELECT '{label}', '{table}', id, timestamp, summary FROM {table}"
+        for table, label in LOG_TABLES.items()
+    )
+    return [
+        {"source": label, "table": table, "id": row_id, "timestamp": timestamp,
+         "summary": summary or ""}
+        for label, table, row_id, timestamp, summary in conn.execute(f"{union} ORDER BY timestamp")
+    ]
+
+
+def read_logs_as_records(conn):
+    union = " UNION ALL ".join(
+        f"SELECT {SOURCE_CODES[table]}, id, timestamp, COALESCE(summary, '') FROM {table}"
+        for table in LOG_TABLES
+    )
+    return list(map(LogRef._make, conn.execute(f"{union} ORDER BY timestamp")))
+
+
+CHAIN_QUERY = """
+    SELECT id, title, created_at, link_count, first_ts, last_ts, last_activity
+    FROM event_chains ORDER BY created_at DESC
+"""
+CHAIN_KEYS = ("id", "title", "created_at", "link_count", "first_ts", "last_ts", "last_activity")
+
+
+def read_chains_as_dicts(conn):
+    return [dict(zip(CHAIN_KEYS, row)) for row in conn.execute(CHAIN_QUERY)]
+
+
+def read_chains_as_records(conn):
+    return list(map(ChainSummary._make, conn.execute(CHAIN_QUERY)))
+
+
+def measure(read, conn) -> tuple[float, float, int]:
+    """Return ``(MB held, seconds, rows)`` for the list ``read(conn)`` builds."""
+    start = time.perf_counter()
+    read(conn)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = read(conn)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    rows = len(result)
+    del result
+    return held / (1024 * 1024), elapsed, rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logs", type=int, default=1_000_000, help="log rows")
+    parser.add_argument("--chains", type=int, default=100_000, help="event chains")
+    args = parser.parse_args()
+
+    conn = make_database(args.logs, args.chains)
+    for what, variants in (
+        ("logs", (("before (dicts)", read_logs_as_dicts), ("after (LogRef)", read_logs_as_records))),
+        ("chains", (("before (dicts)", read_chains_as_dicts),
+                    ("after (ChainSummary)", read_chains_as_records))),
+    ):
+        results = []
+        for name, read in variants:
+            mb, elapsed, rows = measure(read, conn)
+            results.append(mb)
+            print(f"{what:<7}{name:<22} {mb:8.1f} MB  {mb * 1024 * 1024 / max(rows, 1):6.0f} B/row  "
+                  f"{elapsed * 1000:8.0f} ms  ({rows} rows)")
+        before, after = results
+        if after > 0:
+            print(f"{what:<7}memory saved: {before - after:.1f} MB ({before / after:.1f}x smaller)\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Benchmark event timeline rendering with per-row buttons vs. a delegate.
+
+Builds a synthetic chain timeline and times how long it takes to
+populate and paint it:
+
+* **before** - a ``QTableWidget`` with one styled ``QPushButton`` per row
+  installed through ``setCellWidget`` (the old Event Manager timeline).
+* **after** - a ``QTableView`` over ``PagedTableModel`` with the View
+  action painted by ``ButtonDelegate`` (the current timeline).
+
+Usage::
+
+    python benchmark_timeline.py            # 1,000 links
+    python benchmark_timeline.py --links 5000 --repeat 5
+
+Set ``QT_QPA_PLATFORM=offscreen`` to run without a display.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from PyQt6.QtWidgets import (
+    QApplication, QHeaderView, QPushButton, QTableView, QTableWidget, QTableWidgetItem
+)
+
+from ui.styles import Fonts, Colors, TABLE_STYLE, get_button_style
+from ui.table_models import PagedTableModel, list_fetch
+from ui.delegates import ButtonDelegate
+
+TABLES = ["email_logs", "phone_logs", "radio_logs", "everbridge_logs"]
+
+
+def make_timeline(links: int) -> list[dict]:
+    """Return ``links`` synthetic timeline rows."""
+    rows = []
+    for i in range(links):
+        table = TABLES[i % len(TABLES)]
+        rows.append({
+            "table": table,
+            "id": i + 1,
+            "timestamp": f"2025-01-01 {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}",
+            "source": table.replace("_logs", "").title(),
+            "summary": f"Synthetic {table} entry number {i + 1} for the benchmark",
+        })
+    return rows
+
+
+def render(app: QApplication, widget) -> None:
+    """Show ``widget``, let Qt lay it out and force a full paint."""
+    widget.resize(1000, 700)
+    widget.show()
+    app.processEvents()
+    widget.grab()
+    app.processEvents()
+
+
+def bench_cell_widgets(app: QApplication, timeline: list[dict]) -> float:
+    start = time.perf_counter()
+    table = QTableWidget()
+    table.setFont(Fonts.NORMAL)
+    table.setStyleSheet(TABLE_STYLE)
+    table.setColumnCount(4)
+    table.setHorizontalHeaderLabels(["Time", "Type", "Summary", "Actions"])
+    table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+    for log in timeline:
+        row = table.rowCount()
+        table.insertRow(row)
+        table.setItem(row, 0, QTableWidgetItem(log["timestamp"]))
+        table.setItem(row, 1, QTableWidgetItem(log["source"]))
+        table.setItem(row, 2, QTableWidgetItem(log["summary"]))
+        view_btn = QPushButton("👁️ View")
+        view_btn.setFont(Fonts.BUTTON)
+        view_btn.setStyleSheet(get_button_style(Colors.INFO, 35))
+        view_btn.clicked.connect(lambda checked, t=log["table"], i=log["id"]: None)
+        table.setCellWidget(row, 3, view_btn)
+    table.resizeRowsToContents()
+    render(app, table)
+    elapsed = time.perf_counter() - start
+    table.deleteLater()
+    app.processEvents()
+    return elapsed
+
+
+def bench_delegate(app: QApplication, timeline: list[dict]) -> float:
+    start = time.perf_counter()
+    model = PagedTableModel(
+        [("Time", "timestamp"), ("Type", "source"), ("Summary", "summary"), ("Actions", None)],
+        page_size=len(timeline),
+    )
+    view = QTableView()
+    view.setModel(model)
+    view.setFont(Fonts.NORMAL)
+    view.setStyleSheet(TABLE_STYLE)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    view.verticalHeader().setDefaultSectionSize(45)
+    view.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+    view.setMouseTracking(True)
+    delegate = ButtonDelegate("👁️ View", Fonts.BUTTON, parent=view)
+    view.setItemDelegateForColumn(3, delegate)
+    model.set_fetch(list_fetch(timeline))
+    render(app, view)
+    elapsed = time.perf_counter() - start
+    view.deleteLater()
+    app.processEvents()
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--links", type=int, default=1000, help="links in the chain")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per variant")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    timeline = make_timeline(args.links)
+
+    results = {}
+    for name, bench in (("before (cell widgets)", bench_cell_widgets),
+                        ("after (delegate)", bench_delegate)):
+        runs = [bench(app, timeline) for _ in range(args.repeat)]
+        results[name] = statistics.median(runs)
+        print(f"{name:<24} median {results[name] * 1000:8.1f} ms "
+              f"over {args.repeat} runs of {args.links} links")
+
+    before, after = results.values()
+    if after > 0:
+        print(f"speed-up: {before / after:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
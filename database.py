@@ -10,9 +10,13 @@ encountered during database operations are logged via the
 
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
 from logger import get_logger
+from log_summary import summarize_log
+from query_cache import QueryCache
 
 # Compute the path to the SQLite database. Storing the database
 # within the ``data`` folder keeps user data separate from source
@@ -26,6 +30,66 @@ DB_PATH = os.path.join("data", "ops_logger.db")
 # file. Handlers are added lazily by ``get_logger``.
 logger = get_logger(__name__)
 
+# Log source tables and their display labels
+LOG_TABLES = {
+    "email_logs": "Email",
+    "phone_logs": "Phone",
+    "radio_logs": "Radio",
+    "everbridge_logs": "Everbridge",
+}
+
+# Site and category columns counted in the ``activity_hourly`` cube
+# for each log table; ``None`` where the table has no such column
+ACTIVITY_COLUMNS = {
+    "email_logs": (None, "log_type"),
+    "phone_logs": ("site_code", "call_type"),
+    "radio_logs": ("location", "reason"),
+    "everbridge_logs": ("site_code", None),
+}
+
+# strftime pattern truncating a log timestamp to its hour bucket
+ACTIVITY_HOUR_FORMAT = "%Y-%m-%d %H:00"
+
+# Length of the ``YYYY-MM-DD`` prefix of a timestamp; the day a
+# response gap is bucketed under in ``response_gap_daily``
+GAP_DAY_LENGTH = 10
+
+# Columns ``update_log`` never sets from caller-supplied fields
+PROTECTED_LOG_COLUMNS = frozenset({"id", "summary", "created_at"})
+
+# Tables whose writes bump their counter in ``data_versions``
+VERSIONED_TABLES = (*LOG_TABLES, "event_chains", "event_links")
+
+# Callbacks invoked as ``callback(table, log_id)`` after a log row
+# is modified, so in-process caches can drop stale entries
+_row_change_listeners: list = []
+
+def add_row_change_listener(callback) -> None:
+    """Register ``callback(table, log_id)`` to run after a log row changes."""
+    _row_change_listeners.append(callback)
+
+def _notify_row_change(table: str, log_id: int) -> None:
+    for callback in _row_change_listeners:
+        try:
+            callback(table, log_id)
+        except Exception:
+            logger.exception("Row change listener failed for %s id %s", table, log_id)
+
+# Callbacks invoked as ``callback(table, log_id)`` after a new log row
+# is committed, so in-process views can show it without reloading
+_log_insert_listeners: list = []
+
+def add_log_insert_listener(callback) -> None:
+    """Register ``callback(table, log_id)`` to run after a log is inserted."""
+    _log_insert_listeners.append(callback)
+
+def _notify_log_insert(table: str, log_id: int) -> None:
+    for callback in _log_insert_listeners:
+        try:
+            callback(table, log_id)
+        except Exception:
+            logger.exception("Log insert listener failed for %s id %s", table, log_id)
+
 def init_db() -> None:
     """Initialize the SQLite database and create required tables.
 
@@ -51,7 +115,8 @@ def init_db() -> None:
                     timestamp TEXT,
                     extra_field TEXT,
                     msg_path TEXT,
-                    created_at TEXT
+                    created_at TEXT,
+                    summary TEXT
                 )
                 """
             )
@@ -71,7 +136,8 @@ def init_db() -> None:
                     issue_subtype TEXT,
                     message TEXT,
                     timestamp TEXT,
-                    created_at TEXT
+                    created_at TEXT,
+                    summary TEXT
                 )
                 """
             )
@@ -87,7 +153,8 @@ def init_db() -> None:
                     arrived BOOLEAN,
                     departed BOOLEAN,
                     timestamp TEXT,
-                    created_at TEXT
+                    created_at TEXT,
+                    summary TEXT
                 )
                 """
             )
@@ -100,19 +167,26 @@ def init_db() -> None:
                     site_code TEXT,
                     message TEXT,
                     timestamp TEXT,
-                    created_at TEXT
+                    created_at TEXT,
+                    summary TEXT
                 )
                 """
             )
 
-            # Event chains table
+            # Event chains table. ``link_count``, ``first_ts``, ``last_ts``
+            # and ``last_activity`` are denormalized from ``event_links``
+            # and kept current by the triggers created below.
             c.execute(
                 """
                 CREATE TABLE IF NOT EXISTS event_chains (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     title TEXT,
                     description TEXT,
-                    created_at TEXT
+                    created_at TEXT,
+                    link_count INTEGER NOT NULL DEFAULT 0,
+                    first_ts TEXT,
+                    last_ts TEXT,
+                    last_activity TEXT
                 )
                 """
             )
@@ -150,6 +224,32 @@ def init_db() -> None:
             c.execute(
                 "CREATE INDEX IF NOT EXISTS idx_event_links_event_id ON event_links(event_id)"
             )
+            # Reverse lookup from a log to its links, used by the
+            # "unlinked logs" anti-join in the Event Manager
+            c.execute(
+                "CREATE INDEX IF NOT EXISTS idx_event_links_source ON event_links(source_table, source_id)"
+            )
+            # Composite (key, timestamp) indexes used by the correlation
+            # engine for equality-plus-range scans
+            c.execute(
+                "CREATE INDEX IF NOT EXISTS idx_phone_logs_site_ts ON phone_logs(site_code, timestamp)"
+            )
+            c.execute(
+                "CREATE INDEX IF NOT EXISTS idx_phone_logs_caller_ts ON phone_logs(caller_name, timestamp)"
+            )
+            c.execute(
+                "CREATE INDEX IF NOT EXISTS idx_everbridge_logs_site_ts ON everbridge_logs(site_code, timestamp)"
+            )
+            c.execute(
+                "CREATE INDEX IF NOT EXISTS idx_radio_logs_location_ts ON radio_logs(location, timestamp)"
+            )
+
+            _migrate_event_chain_metrics(c)
+            _migrate_log_summaries(c)
+            _migrate_unique_event_links(c)
+            _migrate_activity_cube(c)
+            _migrate_response_gap_buckets(c)
+            _migrate_data_versions(c)
 
             # Commit occurs automatically on context exit
             logger.info("Database initialized successfully and indexes created")
@@ -157,6 +257,572 @@ def init_db() -> None:
         logger.exception("Failed to initialize database")
         raise
 
+def _add_column_if_missing(c: sqlite3.Cursor, table: str, column: str, definition: str) -> bool:
+    """Add ``column`` to ``table`` unless it already exists.
+
+    Returns ``True`` when the column was added, which callers use to
+    decide whether existing rows need to be backfilled.
+    """
+    c.execute(f"PRAGMA table_info({table})")
+    if column in (col[1] for col in c.fetchall()):
+        return False
+    c.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    return True
+
+
+def _migrate_event_chain_metrics(c: sqlite3.Cursor) -> None:
+    """Add and maintain the denormalized link metrics on ``event_chains``.
+
+    Older databases are upgraded in place: the metric columns are
+    added and backfilled from ``event_links`` once. From then on the
+    triggers keep them current, so readers never need a per-chain
+    aggregate query.
+    """
+    added = False
+    for column, definition in (
+        ("link_count", "INTEGER NOT NULL DEFAULT 0"),
+        ("first_ts", "TEXT"),
+        ("last_ts", "TEXT"),
+        ("last_activity", "TEXT"),
+    ):
+        added = _add_column_if_missing(c, "event_chains", column, definition) or added
+
+    if added:
+        c.execute(
+            """
+            UPDATE event_chains SET
+                link_count = (SELECT COUNT(*) FROM event_links el WHERE el.event_id = event_chains.id),
+                first_ts = (SELECT MIN(timestamp) FROM event_links el WHERE el.event_id = event_chains.id),
+                last_ts = (SELECT MAX(timestamp) FROM event_links el WHERE el.event_id = event_chains.id),
+                last_activity = COALESCE(
+                    (SELECT MAX(timestamp) FROM event_links el WHERE el.event_id = event_chains.id),
+                    created_at
+                )
+            """
+        )
+        logger.info("Backfilled event chain metrics for %d chains", c.rowcount)
+
+    # New links only ever widen the chain's time span, so the insert
+    # trigger updates the metrics without rescanning the chain.
+    c.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_event_links_after_insert
+        AFTER INSERT ON event_links
+        BEGIN
+            UPDATE event_chains SET
+                link_count = link_count + 1,
+                first_ts = CASE WHEN first_ts IS NULL OR NEW.timestamp < first_ts
+                                THEN NEW.timestamp ELSE first_ts END,
+                last_ts = CASE WHEN last_ts IS NULL OR NEW.timestamp > last_ts
+                               THEN NEW.timestamp ELSE last_ts END,
+                last_activity = CASE WHEN last_ts IS NULL OR NEW.timestamp > last_ts
+                                     THEN NEW.timestamp ELSE last_ts END
+            WHERE id = NEW.event_id;
+        END
+        """
+    )
+    # Deletes and updates can shrink the span, so recompute the
+    # affected chains from their (indexed) links.
+    c.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_event_links_after_delete
+        AFTER DELETE ON event_links
+        BEGIN
+            UPDATE event_chains SET
+                link_count = (SELECT COUNT(*) FROM event_links el WHERE el.event_id = OLD.event_id),
+                first_ts = (SELECT MIN(timestamp) FROM event_links el WHERE el.event_id = OLD.event_id),
+                last_ts = (SELECT MAX(timestamp) FROM event_links el WHERE el.event_id = OLD.event_id),
+                last_activity = COALESCE(
+                    (SELECT MAX(timestamp) FROM event_links el WHERE el.event_id = OLD.event_id),
+                    created_at
+                )
+            WHERE id = OLD.event_id;
+        END
+        """
+    )
+    c.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_event_links_after_update
+        AFTER UPDATE OF event_id, timestamp ON event_links
+        BEGIN
+            UPDATE event_chains SET
+                link_count = (SELECT COUNT(*) FROM event_links el WHERE el.event_id = event_chains.id),
+                first_ts = (SELECT MIN(timestamp) FROM event_links el WHERE el.event_id = event_chains.id),
+                last_ts = (SELECT MAX(timestamp) FROM event_links el WHERE el.event_id = event_chains.id),
+                last_activity = COALESCE(
+                    (SELECT MAX(timestamp) FROM event_links el WHERE el.event_id = event_chains.id),
+                    created_at
+                )
+            WHERE id IN (OLD.event_id, NEW.event_id);
+        END
+        """
+    )
+
+def _migrate_unique_event_links(c: sqlite3.Cursor) -> None:
+    """Make each log linkable to a chain at most once.
+
+    Duplicate links left by older versions are removed (keeping the
+    earliest) before the unique index is created, which lets
+    ``link_logs_to_event`` rely on ``INSERT OR IGNORE``.
+    """
+    c.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_event_links_unique'"
+    )
+    if c.fetchone():
+        return
+    c.execute(
+        """
+        DELETE FROM event_links WHERE id NOT IN (
+            SELECT MIN(id) FROM event_links
+            GROUP BY event_id, source_table, source_id
+        )
+        """
+    )
+    if c.rowcount:
+        logger.info("Removed %d duplicate event links", c.rowcount)
+    c.execute(
+        """
+        CREATE UNIQUE INDEX idx_event_links_unique
+        ON event_links(event_id, source_table, source_id)
+        """
+    )
+
+def _activity_key(table: str, row: str) -> tuple[str, str, str]:
+    """SQL expressions for the hour, site and category of ``row`` (NEW or OLD)."""
+    site_col, category_col = ACTIVITY_COLUMNS[table]
+    hour = f"strftime('{ACTIVITY_HOUR_FORMAT}', {row}.timestamp)"
+    site = f"COALESCE(TRIM({row}.{site_col}), '')" if site_col else "''"
+    category = f"COALESCE(TRIM({row}.{category_col}), '')" if category_col else "''"
+    return hour, site, category
+
+def _migrate_activity_cube(c: sqlite3.Cursor) -> None:
+    """Create and maintain the hour-by-site-by-type ``activity_hourly`` cube.
+
+    Each log insert, delete or re-keying update adjusts a single cube
+    cell through triggers, so reading activity for a time range never
+    touches the log tables. A newly created cube is backfilled once
+    from the existing logs.
+    """
+    c.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'activity_hourly'"
+    )
+    exists = c.fetchone() is not None
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS activity_hourly (
+            hour TEXT NOT NULL,
+            site TEXT NOT NULL,
+            source TEXT NOT NULL,
+            category TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (hour, site, source, category)
+        ) WITHOUT ROWID
+        """
+    )
+
+    for table, (site_col, category_col) in ACTIVITY_COLUMNS.items():
+        new_hour, new_site, new_category = _activity_key(table, "NEW")
+        old_hour, old_site, old_category = _activity_key(table, "OLD")
+        increment = f"""
+            INSERT INTO activity_hourly (hour, site, source, category, count)
+            VALUES ({new_hour}, {new_site}, '{table}', {new_category}, 1)
+            ON CONFLICT (hour, site, source, category) DO UPDATE SET count = count + 1;
+        """
+        decrement = f"""
+            UPDATE activity_hourly SET count = count - 1
+            WHERE hour = {old_hour} AND site = {old_site}
+              AND source = '{table}' AND category = {old_category};
+        """
+        keyed = ", ".join(col for col in ("timestamp", site_col, category_col) if col)
+        # Rows whose timestamp cannot be bucketed are left out of the cube
+        c.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_activity_insert
+            AFTER INSERT ON {table}
+            WHEN {new_hour} IS NOT NULL
+            BEGIN {increment} END
+            """
+        )
+        c.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_activity_delete
+            AFTER DELETE ON {table}
+            WHEN {old_hour} IS NOT NULL
+            BEGIN {decrement} END
+            """
+        )
+        c.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_activity_update_old
+            AFTER UPDATE OF {keyed} ON {table}
+            WHEN {old_hour} IS NOT NULL
+            BEGIN {decrement} END
+            """
+        )
+        c.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_activity_update_new
+            AFTER UPDATE OF {keyed} ON {table}
+            WHEN {new_hour} IS NOT NULL
+            BEGIN {increment} END
+            """
+        )
+
+    if not exists:
+        # Imported here: logic.activity depends on this module
+        from logic.activity import backfill_activity_cube
+        cells = backfill_activity_cube(c)
+        logger.info("Backfilled activity cube with %d cells", cells)
+
+def _gap_minutes(link: str) -> str:
+    """SQL expression for the minutes between ``link`` and the link before it.
+
+    Links of a chain are ordered by ``(timestamp, id)``, as the
+    ``LAG()`` window in ``logic.analytics`` orders them.
+    """
+    previous = f"""(
+        SELECT p.timestamp FROM event_links p
+        WHERE p.event_id = {link}.event_id
+          AND (p.timestamp, p.id) < ({link}.timestamp, {link}.id)
+        ORDER BY p.timestamp DESC, p.id DESC LIMIT 1
+    )"""
+    return f"(strftime('%s', {link}.timestamp) - strftime('%s', {previous})) / 60.0"
+
+def _next_link_day(link: str) -> str:
+    """SQL expression for the day of the link following ``link`` in its chain."""
+    return f"""(
+        SELECT substr(n.timestamp, 1, {GAP_DAY_LENGTH}) FROM event_links n
+        WHERE n.event_id = {link}.event_id
+          AND (n.timestamp, n.id) > ({link}.timestamp, {link}.id)
+        ORDER BY n.timestamp, n.id LIMIT 1
+    )"""
+
+def _refresh_gap_day(day: str) -> str:
+    """SQL statements recomputing the ``response_gap_daily`` row of ``day``.
+
+    Only the links of that day are read, each with the one link before
+    it in its chain.
+    """
+    return f"""
+        DELETE FROM response_gap_daily WHERE day = {day};
+        INSERT INTO response_gap_daily (day, count, total_minutes, max_minutes)
+        SELECT {day}, COUNT(gap), SUM(gap), MAX(gap) FROM (
+            SELECT {_gap_minutes("l")} AS gap
+            FROM event_links l
+            WHERE l.timestamp >= {day} AND l.timestamp < date({day}, '+1 day')
+        )
+        HAVING COUNT(gap) > 0;
+    """
+
+def _migrate_response_gap_buckets(c: sqlite3.Cursor) -> None:
+    """Create and maintain the per-day ``response_gap_daily`` buckets.
+
+    Each row holds the count, total and maximum of the gaps between
+    consecutive links of a chain whose later link falls on that day,
+    so the response time trend is read without scanning
+    ``event_links``. A link appended after the newest one of its chain
+    adds its gap to one bucket. Links inserted between others, deleted
+    or moved change their neighbour's gap too, and a maximum cannot be
+    decremented, so the affected days are recomputed from their links.
+    A newly created table is backfilled once from the existing links.
+    """
+    c.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'response_gap_daily'"
+    )
+    exists = c.fetchone() is not None
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS response_gap_daily (
+            day TEXT PRIMARY KEY,
+            count INTEGER NOT NULL,
+            total_minutes REAL NOT NULL,
+            max_minutes REAL NOT NULL
+        ) WITHOUT ROWID
+        """
+    )
+    # Previous/next link lookups and the per-day link range
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_event_links_event_ts ON event_links(event_id, timestamp, id)"
+    )
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_event_links_timestamp ON event_links(timestamp)"
+    )
+
+    new_day = f"substr(NEW.timestamp, 1, {GAP_DAY_LENGTH})"
+    old_day = f"substr(OLD.timestamp, 1, {GAP_DAY_LENGTH})"
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_event_links_gap_append
+        AFTER INSERT ON event_links
+        WHEN {_next_link_day("NEW")} IS NULL
+        BEGIN
+            INSERT INTO response_gap_daily (day, count, total_minutes, max_minutes)
+            SELECT {new_day}, 1, gap, gap FROM (SELECT {_gap_minutes("NEW")} AS gap)
+            WHERE gap IS NOT NULL
+            ON CONFLICT (day) DO UPDATE SET
+                count = count + 1,
+                total_minutes = total_minutes + excluded.total_minutes,
+                max_minutes = MAX(max_minutes, excluded.max_minutes);
+        END
+        """
+    )
+    # A refresh only writes response_gap_daily, so both refreshes find
+    # the same next link
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_event_links_gap_insert
+        AFTER INSERT ON event_links
+        WHEN {_next_link_day("NEW")} IS NOT NULL
+        BEGIN
+            {_refresh_gap_day(new_day)}
+            {_refresh_gap_day(_next_link_day("NEW"))}
+        END
+        """
+    )
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_event_links_gap_delete
+        AFTER DELETE ON event_links
+        BEGIN
+            {_refresh_gap_day(old_day)}
+            {_refresh_gap_day(_next_link_day("OLD"))}
+        END
+        """
+    )
+    c.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_event_links_gap_update
+        AFTER UPDATE OF event_id, timestamp ON event_links
+        BEGIN
+            {_refresh_gap_day(old_day)}
+            {_refresh_gap_day(_next_link_day("OLD"))}
+            {_refresh_gap_day(new_day)}
+            {_refresh_gap_day(_next_link_day("NEW"))}
+        END
+        """
+    )
+
+    if not exists:
+        # Imported here: logic.analytics depends on this module
+        from logic.analytics import backfill_response_gap_buckets
+        days = backfill_response_gap_buckets(c)
+        logger.info("Backfilled response gap buckets for %d days", days)
+
+def _migrate_data_versions(c: sqlite3.Cursor) -> None:
+    """Keep a write counter per table in ``data_versions``.
+
+    Every insert, update or delete on a ``VERSIONED_TABLES`` table
+    bumps its counter through triggers, so readers can tell whether a
+    cached result is still current with a primary-key lookup.
+    """
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS data_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    c.executemany(
+        "INSERT OR IGNORE INTO data_versions (name) VALUES (?)",
+        [(table,) for table in VERSIONED_TABLES],
+    )
+    for table in VERSIONED_TABLES:
+        for action in ("INSERT", "UPDATE", "DELETE"):
+            c.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{action.lower()}
+                AFTER {action} ON {table}
+                BEGIN
+                    UPDATE data_versions SET version = version + 1 WHERE name = '{table}';
+                END
+                """
+            )
+
+# Per-thread connection reused by ``get_data_versions``
+_version_reader = threading.local()
+
+def get_data_versions(tables=VERSIONED_TABLES) -> tuple:
+    """Return the current write counters of ``tables``, in order.
+
+    Two equal results mean none of the tables was written to in
+    between. Tables without a counter report ``None``.
+
+    Every cache lookup calls this, so each thread keeps one connection
+    open for it instead of connecting per call. The counters are still
+    read from the database, so writes by other processes are seen.
+    """
+    conn = getattr(_version_reader, "conn", None)
+    try:
+        if conn is None:
+            conn = _version_reader.conn = sqlite3.connect(DB_PATH)
+        versions = dict(conn.execute("SELECT name, version FROM data_versions"))
+    except Exception:
+        logger.exception("Failed to read data versions")
+        if conn is not None:
+            conn.close()
+        _version_reader.conn = None
+        versions = {}
+    return tuple(versions.get(table) for table in tables)
+
+# Shared cache of read results, invalidated through ``data_versions``
+query_cache = QueryCache(get_data_versions)
+
+def _migrate_log_summaries(c: sqlite3.Cursor) -> None:
+    """Add the persisted ``summary`` column to each log table.
+
+    Rows written before the column existed are summarized once here
+    with the same ``summarize_log`` used at insert time.
+    """
+    for table in LOG_TABLES:
+        if not _add_column_if_missing(c, table, "summary", "TEXT"):
+            continue
+        c.execute(f"SELECT * FROM {table}")
+        columns = [col[0] for col in c.description]
+        updates = [
+            (summarize_log(table, dict(zip(columns, row))), row[0])
+            for row in c.fetchall()
+        ]
+        c.executemany(f"UPDATE {table} SET summary = ? WHERE id = ?", updates)
+        logger.info("Backfilled summaries for %d rows in %s", len(updates), table)
+
+class UnitOfWork:
+    """Stage several writes on one connection and commit them together.
+
+    Obtain one from ``unit_of_work()``. Every generated row ID is
+    recorded in ``generated`` (table name to list of IDs) so a
+    workflow can report or reuse them after the commit. Callbacks
+    registered with ``after_commit`` run only once the transaction
+    has been committed, which keeps in-process caches from seeing
+    writes that were rolled back.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.cursor = conn.cursor()
+        self.generated: dict[str, list[int]] = {}
+        self._after_commit: list = []
+
+    def after_commit(self, callback) -> None:
+        """Run ``callback()`` after the unit of work commits."""
+        self._after_commit.append(callback)
+
+    def _record(self, table: str, row_id: int) -> int:
+        self.generated.setdefault(table, []).append(row_id)
+        return row_id
+
+    def insert_log(self, table: str, fields: dict) -> int:
+        """Insert a row into one of ``LOG_TABLES`` and return its ID.
+
+        ``created_at`` and the stored ``summary`` are filled in here so
+        every insert path produces identical rows.
+        """
+        if table not in LOG_TABLES:
+            raise ValueError(f"Unknown log table '{table}'")
+        row = dict(fields)
+        row["created_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        row["summary"] = summarize_log(table, fields)
+        columns = ", ".join(row)
+        placeholders = ", ".join("?" for _ in row)
+        self.cursor.execute(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+            tuple(row.values()),
+        )
+        log_id = self._record(table, self.cursor.lastrowid)
+        self.after_commit(lambda: _notify_log_insert(table, log_id))
+        return log_id
+
+    def insert_email_log(self, log_type, sender, recipient, subject, timestamp,
+                         extra_field, msg_path) -> int:
+        return self.insert_log(
+            "email_logs",
+            {
+                "log_type": log_type,
+                "sender": sender,
+                "recipient": recipient,
+                "subject": subject,
+                "timestamp": timestamp,
+                "extra_field": extra_field,
+                "msg_path": msg_path,
+            },
+        )
+
+    def insert_phone_log(self, call_type, caller_name, site_code, ticket_number,
+                         address, alarm_type, issue_type, issue_subtype,
+                         message, timestamp) -> int:
+        return self.insert_log(
+            "phone_logs",
+            {
+                "call_type": call_type,
+                "caller_name": caller_name,
+                "site_code": site_code,
+                "ticket_number": ticket_number,
+                "address": address,
+                "alarm_type": alarm_type,
+                "issue_type": issue_type,
+                "issue_subtype": issue_subtype,
+                "message": message,
+                "timestamp": timestamp,
+            },
+        )
+
+    def insert_radio_log(self, unit, location, reason, arrived, departed, timestamp) -> int:
+        return self.insert_log(
+            "radio_logs",
+            {
+                "unit": unit,
+                "location": location,
+                "reason": reason,
+                "arrived": int(arrived),
+                "departed": int(departed),
+                "timestamp": timestamp,
+            },
+        )
+
+    def insert_everbridge_log(self, site_code, message, timestamp) -> int:
+        return self.insert_log(
+            "everbridge_logs",
+            {"site_code": site_code, "message": message, "timestamp": timestamp},
+        )
+
+
+@contextmanager
+def unit_of_work(factory=UnitOfWork):
+    """Open a connection, yield a unit of work and commit it once.
+
+    Any exception rolls back every staged write and is re-raised.
+
+    Parameters
+    ----------
+    factory: type
+        The ``UnitOfWork`` subclass to create. ``logic.event_handler``
+        passes one that can also stage event chains and links.
+
+    Example
+    -------
+    ::
+
+        with unit_of_work() as uow:
+            log_id = uow.insert_phone_log(...)
+        print(uow.generated)
+    """
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        uow = factory(conn)
+        try:
+            yield uow
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    finally:
+        conn.close()
+    for callback in uow._after_commit:
+        try:
+            callback()
+        except Exception:
+            logger.exception("After-commit callback failed")
+
 # Email insert already exists
 def insert_email_log(
     log_type: str,
@@ -166,8 +832,8 @@ def insert_email_log(
     timestamp: str,
     extra_field: str | None,
     msg_path: str,
-) -> None:
-    """Insert a new email log into the database.
+) -> int:
+    """Insert a new email log into the database and return its ID.
 
     Parameters
     ----------
@@ -187,27 +853,12 @@ def insert_email_log(
         The original path to the .msg file or ``"Manual Entry"``.
     """
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute(
-                """
-                INSERT INTO email_logs (
-                    log_type, sender, recipient, subject, timestamp,
-                    extra_field, msg_path, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    log_type,
-                    sender,
-                    recipient,
-                    subject,
-                    timestamp,
-                    extra_field,
-                    msg_path,
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                ),
+        with unit_of_work() as uow:
+            log_id = uow.insert_email_log(
+                log_type, sender, recipient, subject, timestamp, extra_field, msg_path
             )
         logger.info("Inserted email log of type '%s'", log_type)
+        return log_id
     except Exception:
         logger.exception("Failed to insert email log")
         raise
@@ -226,36 +877,16 @@ def insert_phone_log(
 ) -> int | None:
     """Insert a new phone call log into the database and return its ID."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute(
-                """
-                INSERT INTO phone_logs (
-                    call_type, caller_name, site_code, ticket_number, address,
-                    alarm_type, issue_type, issue_subtype, message, timestamp, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    call_type,
-                    caller_name,
-                    site_code,
-                    ticket_number,
-                    address,
-                    alarm_type,
-                    issue_type,
-                    issue_subtype,
-                    message,
-                    timestamp,
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                ),
+        with unit_of_work() as uow:
+            log_id = uow.insert_phone_log(
+                call_type, caller_name, site_code, ticket_number, address,
+                alarm_type, issue_type, issue_subtype, message, timestamp,
             )
-            log_id = c.lastrowid
         logger.info("Inserted phone log of type '%s' with ID %s", call_type, log_id)
         return log_id
     except Exception:
         logger.exception("Failed to insert phone log")
         return None
-        raise
 
 def insert_radio_log(
     unit: str,
@@ -264,28 +895,13 @@ def insert_radio_log(
     arrived: bool,
     departed: bool,
     timestamp: str,
-) -> None:
-    """Insert a new radio dispatch log into the database."""
+) -> int:
+    """Insert a new radio dispatch log into the database and return its ID."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute(
-                """
-                INSERT INTO radio_logs (
-                    unit, location, reason, arrived, departed, timestamp, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    unit,
-                    location,
-                    reason,
-                    int(arrived),
-                    int(departed),
-                    timestamp,
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                ),
-            )
+        with unit_of_work() as uow:
+            log_id = uow.insert_radio_log(unit, location, reason, arrived, departed, timestamp)
         logger.info("Inserted radio log for unit '%s'", unit)
+        return log_id
     except Exception:
         logger.exception("Failed to insert radio log")
         raise
@@ -294,28 +910,73 @@ def insert_everbridge_log(
     site_code: str,
     message: str,
     timestamp: str,
-) -> None:
-    """Insert a new Everbridge alert log into the database."""
+) -> int:
+    """Insert a new Everbridge alert log into the database and return its ID."""
+    try:
+        with unit_of_work() as uow:
+            log_id = uow.insert_everbridge_log(site_code, message, timestamp)
+        logger.info("Inserted Everbridge log for site '%s'", site_code)
+        return log_id
+    except Exception:
+        logger.exception("Failed to insert Everbridge log")
+        raise
+
+def update_log(table: str, log_id: int, fields: dict) -> None:
+    """Update columns of an existing log entry and refresh its summary.
+
+    The stored ``summary`` is recomputed from the updated row in the
+    same transaction so it never goes stale.
+
+    Parameters
+    ----------
+    table: str
+        One of the log tables in ``LOG_TABLES``.
+    log_id: int
+        The primary key of the log entry.
+    fields: dict
+        Column names mapped to their new values.
+
+    Raises
+    ------
+    ValueError
+        If ``table`` is not a log table, or a key of ``fields`` is not
+        one of its columns or is ``id``, ``summary`` or ``created_at``.
+    """
+    if table not in LOG_TABLES:
+        raise ValueError(f"Unknown log table '{table}'")
     try:
         with sqlite3.connect(DB_PATH) as conn:
+            conn.row_factory = sqlite3.Row
             c = conn.cursor()
+            if fields:
+                # Keys become SQL identifiers, so only real, editable
+                # columns of the table are accepted
+                columns = {row["name"] for row in c.execute(f"PRAGMA table_info({table})")}
+                invalid = [
+                    key for key in fields
+                    if key not in columns or key in PROTECTED_LOG_COLUMNS
+                ]
+                if invalid:
+                    raise ValueError(f"Cannot update column(s) {invalid} of {table}")
+                assignments = ", ".join(f"{column} = ?" for column in fields)
+                c.execute(
+                    f"UPDATE {table} SET {assignments} WHERE id = ?",
+                    (*fields.values(), log_id),
+                )
+            c.execute(f"SELECT * FROM {table} WHERE id = ?", (log_id,))
+            row = c.fetchone()
+            if row is None:
+                logger.warning("Cannot update missing log id %s in %s", log_id, table)
+                return
             c.execute(
-                """
-                INSERT INTO everbridge_logs (
-                    site_code, message, timestamp, created_at
-                ) VALUES (?, ?, ?, ?)
-                """,
-                (
-                    site_code,
-                    message,
-                    timestamp,
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                ),
+                f"UPDATE {table} SET summary = ? WHERE id = ?",
+                (summarize_log(table, dict(row)), log_id),
             )
-        logger.info("Inserted Everbridge log for site '%s'", site_code)
+        logger.info("Updated log id %s in %s", log_id, table)
     except Exception:
-        logger.exception("Failed to insert Everbridge log")
+        logger.exception("Failed to update log id %s in %s", log_id, table)
         raise
+    _notify_row_change(table, log_id)
 
 # New helper function to get log details (for the improved Event Manager)
 def get_log_details(table: str, log_id: int) -> dict | None:
@@ -324,7 +985,8 @@ def get_log_details(table: str, log_id: int) -> dict | None:
     This helper queries the given table for the row matching
     ``log_id`` and returns a dictionary keyed by column names. If
     the row does not exist or an error occurs, ``None`` is
-    returned.
+    returned. Results are served from ``query_cache`` until the table
+    is written to.
 
     Parameters
     ----------
@@ -340,27 +1002,33 @@ def get_log_details(table: str, log_id: int) -> dict | None:
         entry cannot be found.
     """
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            # Configure row factory to return rows as dictionaries
-            conn.row_factory = sqlite3.Row
-            c = conn.cursor()
+        return query_cache.get_or_load(
+            ("log_details", table, log_id), (table,),
+            lambda: _read_log_details(table, log_id),
+        )
+    except Exception:
+        logger.exception("Failed to get log details for table '%s' id %s", table, log_id)
+        return None
 
-            # Ensure the requested table exists by checking its info
-            c.execute(f"PRAGMA table_info({table})")
-            columns_info = c.fetchall()
-            if not columns_info:
-                logger.warning("Table '%s' does not exist", table)
-                return None
-            columns = [col[1] for col in columns_info]
+def _read_log_details(table: str, log_id: int) -> dict | None:
+    with sqlite3.connect(DB_PATH) as conn:
+        # Configure row factory to return rows as dictionaries
+        conn.row_factory = sqlite3.Row
+        c = conn.cursor()
 
-            c.execute(f"SELECT * FROM {table} WHERE id = ?", (log_id,))
-            row = c.fetchone()
-            if row:
-                # ``row`` acts like a mapping thanks to row_factory
-                return {col: row[col] for col in columns}
+        # Ensure the requested table exists by checking its info
+        c.execute(f"PRAGMA table_info({table})")
+        columns_info = c.fetchall()
+        if not columns_info:
+            logger.warning("Table '%s' does not exist", table)
             return None
-    except Exception:
-        logger.exception("Failed to get log details for table '%s' id %s", table, log_id)
+        columns = [col[1] for col in columns_info]
+
+        c.execute(f"SELECT * FROM {table} WHERE id = ?", (log_id,))
+        row = c.fetchone()
+        if row:
+            # ``row`` acts like a mapping thanks to row_factory
+            return {col: row[col] for col in columns}
         return None
 
 
@@ -1,13 +1,20 @@
 """
 Log manager for creating and updating Excel log files from database entries
+
+Rows are handled as ``logic.rows.RowSet`` tables and written with
+openpyxl, which is imported on first write; pandas is not needed.
+Saving a log loads the workbook with openpyxl, appends the row and
+saves it, without the pandas read_excel/concat/to_excel round trip.
 """
 
 import os
-import pandas as pd
 from datetime import datetime
 import sqlite3
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+
+from logic.rows import RowSet
+
+# Widest automatic column width in a log workbook (characters)
+MAX_COLUMN_WIDTH = 50
 
 
 class LogManager:
@@ -37,61 +44,92 @@ class LogManager:
         for filename, columns in log_files.items():
             filepath = os.path.join(self.logs_dir, filename)
             if not os.path.exists(filepath):
-                df = pd.DataFrame(columns=columns)
-                self.save_with_formatting(df, filepath)
+                self.save_with_formatting(RowSet(columns), filepath)
+    
+    def save_with_formatting(self, rows, filepath):
+        """Save a RowSet to Excel with formatting"""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, PatternFill, Alignment
+        
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = 'Log Data'
+        worksheet.append(rows.columns)
+        for row in rows:
+            worksheet.append(row)
+        
+        # Format headers
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        
+        for cell in worksheet[1]:
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+        
+        # Auto-adjust column widths
+        for column in worksheet.columns:
+            max_length = max(len(str(cell.value)) for cell in column)
+            column_letter = column[0].column_letter
+            worksheet.column_dimensions[column_letter].width = min(max_length + 2, MAX_COLUMN_WIDTH)
+        
+        # Add borders
+        border = self._border()
+        for row in worksheet.iter_rows():
+            for cell in row:
+                cell.border = border
+        workbook.save(filepath)
+    
+    @staticmethod
+    def _border():
+        from openpyxl.styles import Border, Side
+        return Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
     
-    def save_with_formatting(self, df, filepath):
-        """Save DataFrame to Excel with formatting"""
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Log Data')
-            
-            # Get the workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['Log Data']
-            
-            # Format headers
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_alignment = Alignment(horizontal="center", vertical="center")
-            
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            # Add borders
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
+    def append_row(self, filepath, columns, new_row):
+        """Append one entry to a log workbook, creating it if needed
+        
+        Values are placed under the workbook's own headers; keys it has
+        no header for get a new column.
+        """
+        if not os.path.exists(filepath):
+            self.save_with_formatting(
+                RowSet(columns, [tuple(new_row.get(c) for c in columns)]), filepath
             )
-            for row in worksheet.iter_rows():
-                for cell in row:
-                    cell.border = border
+            return
+        
+        from openpyxl import load_workbook
+        from openpyxl.utils import get_column_letter
+        
+        workbook = load_workbook(filepath)
+        worksheet = workbook.active
+        headers = [cell.value for cell in worksheet[1]]
+        for key in new_row:
+            if key not in headers:
+                headers.append(key)
+                worksheet.cell(row=1, column=len(headers), value=key)
+        worksheet.append([new_row.get(header) for header in headers])
+        
+        # Format the new row like the rest and widen columns it overflows
+        border = self._border()
+        for cell in worksheet[worksheet.max_row]:
+            cell.border = border
+            dimension = worksheet.column_dimensions[get_column_letter(cell.column)]
+            width = min(len(str(cell.value)) + 2, MAX_COLUMN_WIDTH)
+            if (dimension.width or 0) < width:
+                dimension.width = width
+        workbook.save(filepath)
     
     def add_email_log(self, email_data):
         """Add entry to email log"""
         filepath = os.path.join(self.logs_dir, "email_logs.xlsx")
         
-        # Load existing data
-        if os.path.exists(filepath):
-            df = pd.read_excel(filepath)
-        else:
-            df = pd.DataFrame(columns=["Date", "Time", "From", "Subject", "Category", "Site", "Priority", "Notes", "Logged By"])
+        columns = ["Date", "Time", "From", "Subject", "Category", "Site", "Priority", "Notes", "Logged By"]
         
         # Add new row
         new_row = {
@@ -106,18 +144,13 @@ class LogManager:
             "Logged By": os.environ.get('USERNAME', 'User')
         }
         
-        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        self.save_with_formatting(df, filepath)
-        return df
+        self.append_row(filepath, columns, new_row)
     
     def add_phone_log(self, phone_data):
         """Add entry to phone log"""
         filepath = os.path.join(self.logs_dir, "phone_logs.xlsx")
         
-        if os.path.exists(filepath):
-            df = pd.read_excel(filepath)
-        else:
-            df = pd.DataFrame(columns=["Date", "Time", "Caller", "Number", "Company", "Type", "Duration", "Summary", "Action Items", "Logged By"])
+        columns = ["Date", "Time", "Caller", "Number", "Company", "Type", "Duration", "Summary", "Action Items", "Logged By"]
         
         new_row = {
             "Date": datetime.now().strftime("%Y-%m-%d"),
@@ -132,18 +165,13 @@ class LogManager:
             "Logged By": os.environ.get('USERNAME', 'User')
         }
         
-        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        self.save_with_formatting(df, filepath)
-        return df
+        self.append_row(filepath, columns, new_row)
     
     def add_radio_log(self, radio_data):
         """Add entry to radio log"""
         filepath = os.path.join(self.logs_dir, "radio_logs.xlsx")
         
-        if os.path.exists(filepath):
-            df = pd.read_excel(filepath)
-        else:
-            df = pd.DataFrame(columns=["Date", "Time", "Unit", "Location", "Type", "Message", "Priority", "Response", "Logged By"])
+        columns = ["Date", "Time", "Unit", "Location", "Type", "Message", "Priority", "Response", "Logged By"]
         
         new_row = {
             "Date": datetime.now().strftime("%Y-%m-%d"),
@@ -157,18 +185,13 @@ class LogManager:
             "Logged By": os.environ.get('USERNAME', 'User')
         }
         
-        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        self.save_with_formatting(df, filepath)
-        return df
+        self.append_row(filepath, columns, new_row)
     
     def add_everbridge_log(self, everbridge_data):
         """Add entry to Everbridge log"""
         filepath = os.path.join(self.logs_dir, "everbridge_logs.xlsx")
         
-        if os.path.exists(filepath):
-            df = pd.read_excel(filepath)
-        else:
-            df = pd.DataFrame(columns=["Date", "Time", "Alert Type", "Severity", "Subject", "Message", "Recipients", "Response Rate", "Logged By"])
+        columns = ["Date", "Time", "Alert Type", "Severity", "Subject", "Message", "Recipients", "Response Rate", "Logged By"]
         
         new_row = {
             "Date": datetime.now().strftime("%Y-%m-%d"),
@@ -182,18 +205,13 @@ class LogManager:
             "Logged By": os.environ.get('USERNAME', 'User')
         }
         
-        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        self.save_with_formatting(df, filepath)
-        return df
+        self.append_row(filepath, columns, new_row)
     
     def add_parking_log(self, parking_data):
         """Add entry to parking log"""
         filepath = os.path.join(self.logs_dir, "parking_logs.xlsx")
         
-        if os.path.exists(filepath):
-            df = pd.read_excel(filepath)
-        else:
-            df = pd.DataFrame(columns=["Date", "Time", "Vehicle", "License Plate", "Location", "Issue", "Action Taken", "Officer", "Logged By"])
+        columns = ["Date", "Time", "Vehicle", "License Plate", "Location", "Issue", "Action Taken", "Officer", "Logged By"]
         
         new_row = {
             "Date": datetime.now().strftime("%Y-%m-%d"),
@@ -207,9 +225,7 @@ class LogManager:
             "Logged By": os.environ.get('USERNAME', 'User')
         }
         
-        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        self.save_with_formatting(df, filepath)
-        return df
+        self.append_row(filepath, columns, new_row)
     
     def get_recent_logs(self, log_type, limit=10):
         """Get recent log entries for display"""
@@ -228,14 +244,21 @@ class LogManager:
         
         filename = log_files.get(log_type)
         if not filename:
-            return pd.DataFrame()
+            return RowSet(())
         
         filepath = os.path.join(self.logs_dir, filename)
         if os.path.exists(filepath):
-            df = pd.read_excel(filepath)
+            from openpyxl import load_workbook
+            workbook = load_workbook(filepath, read_only=True)
+            try:
+                values = workbook.active.iter_rows(values_only=True)
+                columns = next(values, ())
+                rows = RowSet(columns, values)
+            finally:
+                workbook.close()
             # Return most recent entries
-            return df.tail(limit)
-        return pd.DataFrame()
+            return rows[-limit:]
+        return RowSet(())
     
     def sync_from_database(self):
         """Sync all logs from database to Excel files"""
@@ -246,7 +269,7 @@ class LogManager:
         
         # Sync email logs
         try:
-            email_df = pd.read_sql_query("""
+            email_rows = RowSet.from_query(conn, """
                 SELECT 
                     date(timestamp) as Date,
                     time(timestamp) as Time,
@@ -259,15 +282,15 @@ class LogManager:
                     logged_by as 'Logged By'
                 FROM email_logs
                 ORDER BY timestamp DESC
-            """, conn)
-            if not email_df.empty:
-                self.save_with_formatting(email_df, os.path.join(self.logs_dir, "email_logs.xlsx"))
+            """)
+            if len(email_rows):
+                self.save_with_formatting(email_rows, os.path.join(self.logs_dir, "email_logs.xlsx"))
         except:
             pass
         
         # Sync phone logs
         try:
-            phone_df = pd.read_sql_query("""
+            phone_rows = RowSet.from_query(conn, """
                 SELECT 
                     date(timestamp) as Date,
                     time(timestamp) as Time,
@@ -281,15 +304,15 @@ class LogManager:
                     logged_by as 'Logged By'
                 FROM phone_logs
                 ORDER BY timestamp DESC
-            """, conn)
-            if not phone_df.empty:
-                self.save_with_formatting(phone_df, os.path.join(self.logs_dir, "phone_logs.xlsx"))
+            """)
+            if len(phone_rows):
+                self.save_with_formatting(phone_rows, os.path.join(self.logs_dir, "phone_logs.xlsx"))
         except:
             pass
         
         # Sync radio logs
         try:
-            radio_df = pd.read_sql_query("""
+            radio_rows = RowSet.from_query(conn, """
                 SELECT 
                     date(timestamp) as Date,
                     time(timestamp) as Time,
@@ -302,9 +325,9 @@ class LogManager:
                     logged_by as 'Logged By'
                 FROM radio_logs
                 ORDER BY timestamp DESC
-            """, conn)
-            if not radio_df.empty:
-                self.save_with_formatting(radio_df, os.path.join(self.logs_dir, "radio_logs.xlsx"))
+            """)
+            if len(radio_rows):
+                self.save_with_formatting(radio_rows, os.path.join(self.logs_dir, "radio_logs.xlsx"))
         except:
             pass
         
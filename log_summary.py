@@ -0,0 +1,38 @@
+"""
+Shared one-line summaries for log entries.
+
+Summaries are computed once when a log is written and stored in the
+row's ``summary`` column, so every view that lists logs (the Event
+Manager timeline, the available-logs table, the stats panels) shows
+the same text without re-reading the full row.
+"""
+
+
+def summarize_log(table: str, details: dict) -> str:
+    """Return a concise, human-readable summary for a log row.
+
+    Parameters
+    ----------
+    table: str
+        The source table of the log (e.g. ``'phone_logs'``).
+    details: dict
+        The row's column values keyed by column name.
+    """
+    if table == "email_logs":
+        return f"{details.get('log_type', 'Email')}: {details.get('subject', 'No subject')} from {details.get('sender', 'Unknown')}"
+    elif table == "phone_logs":
+        caller = details.get('caller_name', 'Unknown caller')
+        call_type = details.get('call_type', 'Phone')
+        if call_type == "Facilities" and details.get('issue_type'):
+            return f"{call_type}: {caller} - {details['issue_type']}/{details.get('issue_subtype', '')}"
+        elif details.get('site_code'):
+            return f"{call_type}: {caller} - Site {details['site_code']}"
+        else:
+            return f"{call_type}: {caller}"
+    elif table == "radio_logs":
+        return f"Radio: {details.get('unit', 'Unknown')} to {details.get('location', 'Unknown')} - {details.get('reason', '')}"
+    elif table == "everbridge_logs":
+        message = details.get('message') or ''
+        return f"Everbridge: Site {details.get('site_code', 'Unknown')} - {message[:50]}..."
+    else:
+        return f"{table} #{details.get('id', '')}"
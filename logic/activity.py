@@ -0,0 +1,261 @@
+"""
+Hourly activity cube queries and anomaly detection.
+
+``activity_hourly`` holds one count per hour, site, log table and
+category and is kept current by triggers (see
+``database._migrate_activity_cube``). The functions here read only the
+slice of the cube for the hours being viewed plus a trailing baseline,
+turn it into a dense series-by-hour matrix and score every hour
+against the rolling mean and standard deviation of the hours before
+it. All of the scoring is vectorized with NumPy.
+
+``activity_series`` rolls the cube up into hourly or daily volumes for
+the trend charts.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from database import ACTIVITY_COLUMNS, ACTIVITY_HOUR_FORMAT, DB_PATH
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+HOUR_FORMAT = "%Y-%m-%d %H:00"
+
+# Trailing hours an hour is compared against
+BASELINE_HOURS = 7 * 24
+# Standard deviations above the baseline that make an hour anomalous
+Z_THRESHOLD = 3.0
+# Hours with fewer logs than this are never flagged
+MIN_COUNT = 3
+# Floor for the baseline deviation, so a quiet series does not flag
+# its first busy hour on an almost-zero deviation
+MIN_STD = 1.0
+
+# Cube dimensions a series can be keyed by
+DIMENSIONS = ("site", "source", "category")
+
+
+def backfill_activity_cube(cursor: sqlite3.Cursor) -> int:
+    """Count every existing log into ``activity_hourly``.
+
+    Keys are factorized and counted with ``numpy.bincount`` instead of
+    a ``GROUP BY`` per table. Returns the number of cube cells written.
+    """
+    cells = 0
+    for table, (site_col, category_col) in ACTIVITY_COLUMNS.items():
+        hour = f"strftime('{ACTIVITY_HOUR_FORMAT}', timestamp)"
+        site = f"COALESCE(TRIM({site_col}), '')" if site_col else "''"
+        category = f"COALESCE(TRIM({category_col}), '')" if category_col else "''"
+        cursor.execute(f"SELECT {hour}, {site}, {category} FROM {table} WHERE {hour} IS NOT NULL")
+        rows = cursor.fetchall()
+        if not rows:
+            continue
+
+        columns = np.array(rows, dtype=object).T
+        labels, codes = zip(*(np.unique(col.astype(str), return_inverse=True) for col in columns))
+        # Mixed-radix code of (hour, site, category), then dense ids
+        code = (codes[0].astype(np.int64) * len(labels[1]) + codes[1]) * len(labels[2]) + codes[2]
+        keys, dense = np.unique(code, return_inverse=True)
+        counts = np.bincount(dense)
+
+        hours, rest = np.divmod(keys, len(labels[1]) * len(labels[2]))
+        sites, categories = np.divmod(rest, len(labels[2]))
+        cursor.executemany(
+            """
+            INSERT INTO activity_hourly (hour, site, source, category, count)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (hour, site, source, category) DO UPDATE SET count = count + excluded.count
+            """,
+            [
+                (labels[0][h], labels[1][s], table, labels[2][c], int(n))
+                for h, s, c, n in zip(hours, sites, categories, counts)
+            ],
+        )
+        cells += len(keys)
+    return cells
+
+
+def load_activity(start: datetime, end: datetime) -> list[tuple]:
+    """Return ``(hour, site, source, category, count)`` cube rows in ``[start, end)``.
+
+    This is a range scan on the cube's primary key, so its cost depends
+    on the hours requested rather than on the size of the log tables.
+    """
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            return conn.execute(
+                """
+                SELECT hour, site, source, category, count FROM activity_hourly
+                WHERE hour >= ? AND hour < ? AND count > 0
+                """,
+                (start.strftime(HOUR_FORMAT), end.strftime(HOUR_FORMAT)),
+            ).fetchall()
+    except Exception:
+        logger.exception("Failed to load hourly activity")
+        return []
+
+
+def rolling_baseline(matrix: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Mean and standard deviation of the ``window`` hours before each hour.
+
+    Computed for every row at once from cumulative sums of the counts
+    and of their squares. Hours with fewer than ``window`` predecessors
+    use as many as are available.
+    """
+    hours = matrix.shape[1]
+    zeros = np.zeros((matrix.shape[0], 1))
+    total = np.concatenate([zeros, np.cumsum(matrix, axis=1)], axis=1)
+    squares = np.concatenate([zeros, np.cumsum(matrix ** 2, axis=1)], axis=1)
+    t = np.arange(hours)
+    lo = np.maximum(t - window, 0)
+    n = np.maximum(t - lo, 1)
+    mean = (total[:, t] - total[:, lo]) / n
+    var = (squares[:, t] - squares[:, lo]) / n - mean ** 2
+    return mean, np.sqrt(np.maximum(var, 0.0))
+
+
+def detect_anomalies(start: datetime, end: datetime, group_by=("site", "source"),
+                     baseline_hours: int = BASELINE_HOURS, z_threshold: float = Z_THRESHOLD,
+                     min_count: int = MIN_COUNT) -> dict:
+    """Flag hours in ``[start, end)`` that are unusually busy.
+
+    Parameters
+    ----------
+    start, end: datetime
+        The hours to score; truncated to whole hours.
+    group_by: tuple of str
+        Cube dimensions (from ``DIMENSIONS``) identifying one series;
+        the counts of other dimensions are summed.
+    baseline_hours: int
+        Length of the trailing baseline window.
+    z_threshold: float
+        Minimum z-score of a flagged hour.
+    min_count: int
+        Minimum count of a flagged hour.
+
+    Returns
+    -------
+    dict
+        ``anomalies``: one dict per flagged hour, highest z-score
+        first, with ``hour``, the ``group_by`` keys, ``count``,
+        ``mean``, ``std`` and ``z``.
+        ``hotspots``: ``(site, excess)`` pairs ordered by the number
+        of logs above baseline across the site's flagged hours.
+    """
+    start = start.replace(minute=0, second=0, microsecond=0)
+    end = end.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    load_start = start - timedelta(hours=baseline_hours)
+    rows = load_activity(load_start, end)
+    if not rows:
+        return {"anomalies": [], "hotspots": []}
+
+    columns = np.array(rows, dtype=object).T
+    dims = {name: columns[i + 1].astype(str) for i, name in enumerate(DIMENSIONS)}
+    counts = columns[4].astype(float)
+
+    # Hour index of every cube row on a dense hourly axis
+    origin = np.datetime64(load_start.strftime("%Y-%m-%dT%H"), "h")
+    stamps = np.array([h.replace(" ", "T") for h in columns[0]], dtype="datetime64[h]")
+    hour_idx = (stamps - origin).astype(np.int64)
+    n_hours = int((np.datetime64(end.strftime("%Y-%m-%dT%H"), "h") - origin).astype(np.int64))
+
+    # One series per distinct combination of the group_by keys
+    keys = np.array(["\x1f".join(parts) for parts in zip(*(dims[d] for d in group_by))])
+    series, series_idx = np.unique(keys, return_inverse=True)
+    matrix = np.bincount(
+        series_idx * n_hours + hour_idx, weights=counts, minlength=len(series) * n_hours
+    ).reshape(len(series), n_hours)
+
+    mean, std = rolling_baseline(matrix, baseline_hours)
+    z = (matrix - mean) / np.maximum(std, MIN_STD)
+    first_viewed = baseline_hours
+    flagged = (matrix >= min_count) & (z >= z_threshold)
+    flagged[:, :first_viewed] = False
+
+    rows_idx, hours_idx = np.nonzero(flagged)
+    order = np.argsort(-z[rows_idx, hours_idx], kind="stable")
+    anomalies = []
+    for r, h in zip(rows_idx[order], hours_idx[order]):
+        entry = dict(zip(group_by, series[r].split("\x1f")))
+        entry.update({
+            "hour": (load_start + timedelta(hours=int(h))).strftime(HOUR_FORMAT),
+            "count": int(matrix[r, h]),
+            "mean": float(mean[r, h]),
+            "std": float(std[r, h]),
+            "z": float(z[r, h]),
+        })
+        anomalies.append(entry)
+
+    hotspots = {}
+    if "site" in group_by:
+        for entry in anomalies:
+            hotspots[entry["site"]] = hotspots.get(entry["site"], 0.0) + entry["count"] - entry["mean"]
+    return {
+        "anomalies": anomalies,
+        "hotspots": sorted(hotspots.items(), key=lambda item: item[1], reverse=True),
+    }
+
+
+# Cube prefix length and NumPy unit for each chart bucket size
+BUCKETS = {"hour": (13, "h"), "day": (10, "D")}
+
+
+def activity_series(start: datetime | None = None, end: datetime | None = None,
+                    bucket: str = "day") -> tuple[np.ndarray, dict]:
+    """Return log volumes per source table on a dense time axis.
+
+    Parameters
+    ----------
+    start, end: datetime or None
+        Range to cover; ``None`` extends to the first or last hour in
+        the cube.
+    bucket: str
+        ``"hour"`` or ``"day"``.
+
+    Returns
+    -------
+    tuple
+        ``(times, counts)`` where ``times`` is a ``datetime64`` array of
+        bucket starts and ``counts`` maps each source table to an array
+        of the same length. Both are empty when there is no activity.
+    """
+    length, unit = BUCKETS[bucket]
+    where, params = [], []
+    if start is not None:
+        where.append("hour >= ?")
+        params.append(start.strftime(HOUR_FORMAT))
+    if end is not None:
+        where.append("hour < ?")
+        params.append(end.strftime(HOUR_FORMAT))
+    clause = f"WHERE {' AND '.join(where)}" if where else ""
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT substr(hour, 1, {length}), source, SUM(count)
+                FROM activity_hourly {clause}
+                GROUP BY 1, 2
+                """,
+                params,
+            ).fetchall()
+    except Exception:
+        logger.exception("Failed to load activity series")
+        rows = []
+    if not rows:
+        return np.array([], dtype=f"datetime64[{unit}]"), {}
+
+    columns = np.array(rows, dtype=object).T
+    stamps = np.array([b.replace(" ", "T") for b in columns[0]], dtype=f"datetime64[{unit}]")
+    first, last = stamps.min(), stamps.max()
+    times = np.arange(first, last + 1)
+    index = (stamps - first).astype(np.int64)
+    sources = columns[1].astype(str)
+    totals = columns[2].astype(float)
+    return times, {
+        source: np.bincount(index[sources == source], weights=totals[sources == source], minlength=len(times))
+        for source in np.unique(sources)
+    }
@@ -0,0 +1,254 @@
+"""
+Response-time analytics over event chains.
+
+A *response gap* is the time between two consecutive logs of one event
+chain. All gaps, for every chain, come from a single query that runs
+``LAG()`` over ``event_links`` partitioned by chain and ordered by
+timestamp, so SQLite does the pairing and date arithmetic instead of a
+Python loop per chain. The gaps are then grouped per chain, per source
+transition (e.g. Phone → Radio) and per site, and summarized with
+NumPy percentiles.
+
+The daily trend reads ``response_gap_daily`` instead, which holds the
+count, total and maximum gap of each day and is kept current by
+triggers (see ``database._migrate_response_gap_buckets``).
+"""
+
+import sqlite3
+
+import numpy as np
+
+from database import DB_PATH, GAP_DAY_LENGTH, LOG_TABLES
+from logic.correlation import KEY_COLUMNS
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Percentiles reported for every group of gaps
+PERCENTILES = (50, 90, 99)
+
+
+def _site_expr(table_column: str, id_column: str) -> str:
+    """SQL expression looking up the site of the log ``(table, id)``."""
+    branches = "\n".join(
+        f"            WHEN '{table}' THEN (SELECT {column} FROM {table} WHERE id = {id_column})"
+        for table, column in KEY_COLUMNS["site"]
+    )
+    return f"CASE {table_column}\n{branches}\n        END"
+
+
+# Every gap between consecutive links of a chain. Links with the same
+# timestamp keep the order in which they were linked. The site of a gap
+# is the site of the responding log, or of the log it responded to when
+# the responding log has none (e.g. an email).
+_GAPS_QUERY = f"""
+    WITH ordered AS (
+        SELECT l.event_id, l.source_table, l.source_id, l.timestamp,
+               LAG(l.source_table) OVER w AS prev_table,
+               LAG(l.source_id) OVER w AS prev_id,
+               (strftime('%s', l.timestamp) - strftime('%s', LAG(l.timestamp) OVER w)) / 60.0 AS gap_minutes
+        FROM event_links l
+        {{where}}
+        WINDOW w AS (PARTITION BY l.event_id ORDER BY l.timestamp, l.id)
+    )
+    SELECT o.event_id, o.prev_table, o.prev_id, o.source_table, o.source_id,
+           o.timestamp, o.gap_minutes,
+           COALESCE(
+               NULLIF(TRIM({_site_expr("o.source_table", "o.source_id")}), ''),
+               NULLIF(TRIM({_site_expr("o.prev_table", "o.prev_id")}), '')
+           ) AS site
+    FROM ordered o
+    WHERE o.prev_table IS NOT NULL AND o.gap_minutes IS NOT NULL
+    ORDER BY o.event_id, o.timestamp
+"""
+
+
+def get_response_gaps(event_id: int | None = None) -> list[dict]:
+    """Return the gaps between consecutive logs of event chains.
+
+    Parameters
+    ----------
+    event_id: int or None
+        Restrict the result to one chain; ``None`` returns every chain.
+
+    Returns
+    -------
+    list of dict
+        One dict per gap with ``event_id``, ``from_table``, ``from_id``,
+        ``to_table``, ``to_id``, ``timestamp`` (of the responding log),
+        ``minutes`` and ``site`` (``None`` when unknown), ordered by
+        chain and time.
+    """
+    where, params = ("WHERE l.event_id = ?", (event_id,)) if event_id is not None else ("", ())
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            rows = conn.execute(_GAPS_QUERY.format(where=where), params).fetchall()
+    except Exception:
+        logger.exception("Failed to compute response gaps")
+        return []
+    return [
+        {
+            "event_id": row[0],
+            "from_table": row[1],
+            "from_id": row[2],
+            "to_table": row[3],
+            "to_id": row[4],
+            "timestamp": row[5],
+            "minutes": row[6],
+            "site": row[7],
+        }
+        for row in rows
+    ]
+
+
+def summarize_minutes(minutes) -> dict:
+    """Summarize response gaps given in minutes.
+
+    Returns
+    -------
+    dict
+        ``count``, ``mean``, ``min``, ``max`` and ``p50``/``p90``/``p99``
+        (linear interpolation). All but ``count`` are ``None`` when
+        there are no gaps.
+    """
+    values = np.asarray(minutes, dtype=float)
+    if values.size == 0:
+        summary = {"count": 0, "mean": None, "min": None, "max": None}
+        summary.update({f"p{p}": None for p in PERCENTILES})
+        return summary
+    summary = {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "min": float(values.min()),
+        "max": float(values.max()),
+    }
+    for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f"p{p}"] = float(value)
+    return summary
+
+
+def group_response_stats(keys, minutes) -> dict:
+    """Summarize ``minutes`` per distinct value of the parallel ``keys``."""
+    if len(keys) == 0:
+        return {}
+    keys = np.asarray(keys, dtype=object)
+    values = np.asarray(minutes, dtype=float)
+    # Sort once and split into runs of equal keys
+    order = np.argsort(keys.astype(str), kind="stable")
+    sorted_keys = keys[order]
+    sorted_values = values[order]
+    _labels, starts = np.unique(sorted_keys.astype(str), return_index=True)
+    bounds = list(starts) + [len(sorted_keys)]
+    return {
+        sorted_keys[start]: summarize_minutes(sorted_values[start:end])
+        for start, end in zip(bounds[:-1], bounds[1:])
+    }
+
+
+def transition_label(from_table: str, to_table: str) -> str:
+    """Return a readable transition name such as ``"Phone → Radio"``."""
+    return f"{LOG_TABLES.get(from_table, from_table)} → {LOG_TABLES.get(to_table, to_table)}"
+
+
+def response_time_report() -> dict:
+    """Summarize response gaps across every chain.
+
+    Returns
+    -------
+    dict
+        ``overall`` holds the summary of every gap; ``by_chain`` maps
+        event id, ``by_transition`` maps a ``transition_label`` and
+        ``by_site`` maps a site code to the summary of their gaps.
+        Gaps without a known site are grouped under ``"Unknown"``.
+    """
+    gaps = get_response_gaps()
+    minutes = [g["minutes"] for g in gaps]
+    return {
+        "overall": summarize_minutes(minutes),
+        "by_chain": group_response_stats([g["event_id"] for g in gaps], minutes),
+        "by_transition": group_response_stats(
+            [transition_label(g["from_table"], g["to_table"]) for g in gaps], minutes
+        ),
+        "by_site": group_response_stats([g["site"] or "Unknown" for g in gaps], minutes),
+    }
+
+
+# Every gap with the day of its responding link, for the one-time
+# backfill of ``response_gap_daily``
+_GAP_DAYS_QUERY = f"""
+    WITH ordered AS (
+        SELECT substr(l.timestamp, 1, {GAP_DAY_LENGTH}) AS day,
+               (strftime('%s', l.timestamp) - strftime('%s', LAG(l.timestamp) OVER w)) / 60.0 AS gap_minutes
+        FROM event_links l
+        WINDOW w AS (PARTITION BY l.event_id ORDER BY l.timestamp, l.id)
+    )
+    SELECT day, gap_minutes FROM ordered WHERE gap_minutes IS NOT NULL
+"""
+
+
+def backfill_response_gap_buckets(cursor: sqlite3.Cursor) -> int:
+    """Summarize every existing gap into ``response_gap_daily``.
+
+    Gaps are grouped by day with ``numpy.unique`` and reduced with
+    ``numpy.add.reduceat``/``numpy.maximum.reduceat``. Returns the
+    number of days written.
+    """
+    cursor.execute(_GAP_DAYS_QUERY)
+    rows = cursor.fetchall()
+    if not rows:
+        return 0
+    days, minutes = zip(*rows)
+    days = np.asarray(days, dtype=str)
+    minutes = np.asarray(minutes, dtype=float)
+    order = np.argsort(days, kind="stable")
+    labels, starts, counts = np.unique(days[order], return_index=True, return_counts=True)
+    sorted_minutes = minutes[order]
+    totals = np.add.reduceat(sorted_minutes, starts)
+    maxes = np.maximum.reduceat(sorted_minutes, starts)
+    cursor.executemany(
+        """
+        INSERT OR REPLACE INTO response_gap_daily (day, count, total_minutes, max_minutes)
+        VALUES (?, ?, ?, ?)
+        """,
+        [
+            (str(day), int(count), float(total), float(peak))
+            for day, count, total, peak in zip(labels, counts, totals, maxes)
+        ],
+    )
+    return len(labels)
+
+
+def response_time_trend(since: str = "") -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return daily response times for chart display.
+
+    Read from the ``response_gap_daily`` buckets, one row per day,
+    which triggers keep current as links change.
+
+    Parameters
+    ----------
+    since: str
+        Earliest ``YYYY-MM-DD`` day to include; empty for all.
+
+    Returns
+    -------
+    tuple
+        ``(days, mean_minutes, max_minutes)``: a ``datetime64[D]``
+        array of the days with at least one response and the mean and
+        maximum gap on each.
+    """
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            rows = conn.execute(
+                """
+                SELECT day, total_minutes / count, max_minutes FROM response_gap_daily
+                WHERE day >= ? ORDER BY day
+                """,
+                (since,),
+            ).fetchall()
+    except Exception:
+        logger.exception("Failed to compute response time trend")
+        rows = []
+    if not rows:
+        return np.array([], dtype="datetime64[D]"), np.array([]), np.array([])
+    days, means, maxes = zip(*rows)
+    return np.array(days, dtype="datetime64[D]"), np.array(means, dtype=float), np.array(maxes, dtype=float)
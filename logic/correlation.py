@@ -0,0 +1,202 @@
+"""
+Time-window correlation of logs for event chain suggestions.
+
+Given an event chain, the functions in this module collect the sites,
+radio locations and callers of its linked logs and look for other logs
+sharing one of those keys within a sliding window around the chain's
+timestamps. Every lookup is an equality-plus-range scan on one of the
+``(key, timestamp)`` indexes created by ``init_db``, so the cost per
+chain is proportional to the number of matching rows rather than the
+size of the log tables.
+"""
+
+import bisect
+import math
+import sqlite3
+from datetime import datetime, timedelta
+
+from database import DB_PATH, LOG_TABLES
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Default half-width of the window searched around each linked log
+DEFAULT_WINDOW = timedelta(hours=2)
+
+# Candidate columns searched for each key kind, as (table, column).
+# Radio locations and site codes share one key space because
+# dispatchers record the site code as the unit's location.
+KEY_COLUMNS = {
+    "site": [
+        ("phone_logs", "site_code"),
+        ("everbridge_logs", "site_code"),
+        ("radio_logs", "location"),
+    ],
+    "caller": [
+        ("phone_logs", "caller_name"),
+    ],
+}
+
+# Relative weight of a match on each key kind
+KEY_WEIGHTS = {"site": 1.0, "caller": 0.8}
+
+# Placeholder values that should never correlate two logs
+IGNORED_VALUES = {"", "unknown", "n/a", "none"}
+
+# Queries returning the timestamp and key values of the chain's linked
+# logs of one table, paired with the key kind of each value column
+_SEED_QUERIES = [
+    (
+        """
+        SELECT p.timestamp, p.site_code, p.caller_name
+        FROM event_links l JOIN phone_logs p ON p.id = l.source_id
+        WHERE l.event_id = ? AND l.source_table = 'phone_logs'
+        """,
+        ("site", "caller"),
+    ),
+    (
+        """
+        SELECT e.timestamp, e.site_code
+        FROM event_links l JOIN everbridge_logs e ON e.id = l.source_id
+        WHERE l.event_id = ? AND l.source_table = 'everbridge_logs'
+        """,
+        ("site",),
+    ),
+    (
+        """
+        SELECT r.timestamp, r.location
+        FROM event_links l JOIN radio_logs r ON r.id = l.source_id
+        WHERE l.event_id = ? AND l.source_table = 'radio_logs'
+        """,
+        ("site",),
+    ),
+]
+
+
+def _parse(timestamp: str) -> datetime | None:
+    try:
+        return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def _merge_windows(times: list[datetime], window: timedelta) -> list[tuple[datetime, datetime]]:
+    """Collapse overlapping ``[t - window, t + window]`` ranges."""
+    merged: list[list[datetime]] = []
+    for t in sorted(times):
+        start, end = t - window, t + window
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def _nearest_gap(times: list[datetime], t: datetime) -> float:
+    """Seconds between ``t`` and the closest entry of sorted ``times``."""
+    i = bisect.bisect_left(times, t)
+    neighbors = times[max(i - 1, 0):i + 1]
+    return min(abs((t - s).total_seconds()) for s in neighbors)
+
+
+def _collect_seeds(c: sqlite3.Cursor, event_id: int) -> dict[tuple[str, str], list[datetime]]:
+    """Return the chain's correlation keys mapped to their timestamps."""
+    seeds: dict[tuple[str, str], list[datetime]] = {}
+    for query, kinds in _SEED_QUERIES:
+        c.execute(query, (event_id,))
+        for timestamp, *values in c.fetchall():
+            t = _parse(timestamp)
+            if t is None:
+                continue
+            for kind, value in zip(kinds, values):
+                if value is None or value.strip().lower() in IGNORED_VALUES:
+                    continue
+                seeds.setdefault((kind, value), []).append(t)
+    return seeds
+
+
+def suggest_links(event_id: int, window: timedelta = DEFAULT_WINDOW,
+                  limit: int = 10) -> list[dict]:
+    """Return ranked candidate logs for an event chain.
+
+    Parameters
+    ----------
+    event_id: int
+        The chain to find candidates for.
+    window: datetime.timedelta
+        How far before and after each linked log to search.
+    limit: int
+        Maximum number of suggestions returned.
+
+    Returns
+    -------
+    list of dict
+        Each suggestion has the keys ``source``, ``table``, ``id``,
+        ``timestamp``, ``summary``, ``score`` and ``reasons``, sorted
+        by descending score. Logs already linked to the chain are
+        excluded.
+    """
+    # A match loses half its weight every quarter of the window
+    half_life = max(window.total_seconds() / 4, 1.0)
+    candidates: dict[tuple[str, int], dict] = {}
+
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            c = conn.cursor()
+            seeds = _collect_seeds(c, event_id)
+            if not seeds:
+                return []
+
+            c.execute(
+                "SELECT source_table, source_id FROM event_links WHERE event_id = ?",
+                (event_id,),
+            )
+            linked = set(c.fetchall())
+
+            for (kind, value), times in seeds.items():
+                times.sort()
+                for start, end in _merge_windows(times, window):
+                    for table, column in KEY_COLUMNS[kind]:
+                        c.execute(
+                            f"""
+                            SELECT id, timestamp, summary FROM {table}
+                            WHERE {column} = ? AND timestamp BETWEEN ? AND ?
+                            """,
+                            (
+                                value,
+                                start.strftime(TIMESTAMP_FORMAT),
+                                end.strftime(TIMESTAMP_FORMAT),
+                            ),
+                        )
+                        for row_id, timestamp, summary in c.fetchall():
+                            if (table, row_id) in linked:
+                                continue
+                            t = _parse(timestamp)
+                            if t is None:
+                                continue
+                            gap = _nearest_gap(times, t)
+                            score = KEY_WEIGHTS[kind] * math.pow(0.5, gap / half_life)
+                            entry = candidates.setdefault(
+                                (table, row_id),
+                                {
+                                    "source": LOG_TABLES[table],
+                                    "table": table,
+                                    "id": row_id,
+                                    "timestamp": timestamp,
+                                    "summary": summary or "",
+                                    "score": 0.0,
+                                    "reasons": [],
+                                },
+                            )
+                            reason = f"{kind.title()} {value}"
+                            if reason not in entry["reasons"]:
+                                entry["score"] += score
+                                entry["reasons"].append(reason)
+    except Exception:
+        logger.exception("Failed to correlate logs for event chain %s", event_id)
+        return []
+
+    ranked = sorted(candidates.values(), key=lambda s: (-s["score"], s["timestamp"]))
+    return ranked[:limit]
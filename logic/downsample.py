@@ -0,0 +1,69 @@
+"""
+Downsampling of long time series for display.
+
+A chart can only show about one point per horizontal pixel, so series
+longer than that are reduced before they are drawn:
+
+* ``minmax_decimate`` keeps the minimum and maximum of each pixel
+  bucket. It is fully vectorized and never hides a spike, which suits
+  dense count series.
+* ``lttb`` (Largest-Triangle-Three-Buckets) keeps the point of each
+  bucket that best preserves the visual shape of the line.
+
+Both take and return NumPy arrays of x and y values sorted by x.
+"""
+
+import numpy as np
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a series to the min and max point of ``buckets`` equal-count buckets.
+
+    Returns at most ``2 * buckets`` points in x order. Series that are
+    already short enough are returned unchanged.
+    """
+    n = len(x)
+    if buckets <= 0 or n <= 2 * buckets:
+        return x, y
+    # Pad to a whole number of buckets with copies of the last point
+    size = -(-n // buckets)
+    pad = size * buckets - n
+    ys = np.concatenate([y, np.repeat(y[-1:], pad)]).reshape(buckets, size)
+    base = np.arange(buckets) * size
+    lo = np.minimum(base + ys.argmin(axis=1), n - 1)
+    hi = np.minimum(base + ys.argmax(axis=1), n - 1)
+    idx = np.unique(np.concatenate([lo, hi]))
+    return x[idx], y[idx]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a series to ``threshold`` points with LTTB.
+
+    The first and last points are always kept. Series that are already
+    short enough are returned unchanged.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Bucket edges for the n - 2 interior points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third vertex
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            cx, cy = x[nxt].mean(), y[nxt].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        bx, by = x[start:stop], y[start:stop]
+        area = np.abs((x[a] - cx) * (by - y[a]) - (x[a] - bx) * (cy - y[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return x[selected], y[selected]
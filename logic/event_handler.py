@@ -8,63 +8,326 @@ database access and logs errors using the application logger.
 """
 
 import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from database import DB_PATH, get_log_details
+from database import (
+    DB_PATH, LOG_TABLES, UnitOfWork, add_row_change_listener, query_cache, unit_of_work
+)
 from logger import get_logger
+from logic.records import SOURCE_CODES, ChainSummary, LogRef, intern_text
 
 logger = get_logger(__name__)
 
+# Number of chain timelines kept in memory
+TIMELINE_CACHE_SIZE = 64
+
+
+class TimelineCache:
+    """LRU cache of materialized event chain timelines.
+
+    Timelines are lists of ``LogRef`` records. Besides the timelines
+    themselves, the cache keeps a reverse map from each linked
+    ``(table, source_id)`` to the chains that contain it, so a change
+    to one log row only evicts the timelines that actually display it.
+    """
+
+    def __init__(self, max_entries: int = TIMELINE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, list] = OrderedDict()
+        self._chains_by_row: dict[tuple[str, int], set[int]] = {}
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so a timeline read from the
+        # database before an invalidation is never stored after it
+        self.generation = 0
+
+    def __contains__(self, event_id: int) -> bool:
+        with self._lock:
+            return event_id in self._entries
+
+    def get(self, event_id: int) -> list | None:
+        """Return the cached timeline for ``event_id`` or ``None``."""
+        with self._lock:
+            rows = self._entries.get(event_id)
+            if rows is not None:
+                self._entries.move_to_end(event_id)
+            return rows
+
+    def put(self, event_id: int, rows: list, generation: int) -> None:
+        """Store a timeline read while the cache was at ``generation``."""
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._drop(event_id)
+            self._entries[event_id] = rows
+            for row in rows:
+                self._chains_by_row.setdefault((row.table, row.id), set()).add(event_id)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, event_id: int) -> None:
+        """Drop the timeline of a single chain."""
+        with self._lock:
+            self.generation += 1
+            self._drop(event_id)
+
+    def invalidate_row(self, table: str, source_id: int) -> None:
+        """Drop every cached timeline that contains the given log row."""
+        with self._lock:
+            self.generation += 1
+            for event_id in list(self._chains_by_row.get((table, source_id), ())):
+                self._drop(event_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._chains_by_row.clear()
+
+    def _drop(self, event_id: int) -> None:
+        rows = self._entries.pop(event_id, None)
+        if rows is None:
+            return
+        for row in rows:
+            key = (row.table, row.id)
+            chains = self._chains_by_row.get(key)
+            if chains is not None:
+                chains.discard(event_id)
+                if not chains:
+                    del self._chains_by_row[key]
+
+
+timeline_cache = TimelineCache()
+add_row_change_listener(timeline_cache.invalidate_row)
+
+# Callbacks run after new links are committed to a chain
+_link_listeners: list = []
+
+
+def add_link_listener(callback) -> None:
+    """Register ``callback(event_id, refs)`` to run after links are committed.
+
+    ``refs`` are the ``(table, source_id, timestamp)`` tuples that were
+    linked. Callbacks run on the thread that committed the links.
+    """
+    _link_listeners.append(callback)
+
+
+def _notify_links(event_id: int, refs: list[tuple[str, int, str]]) -> None:
+    for callback in _link_listeners:
+        try:
+            callback(event_id, refs)
+        except Exception:
+            logger.exception("Link listener failed for event %s", event_id)
+
+
+class EventUnitOfWork(UnitOfWork):
+    """Unit of work that can also stage event chains and links.
+
+    Used by multi-step workflows (log a call, open a chain, link the
+    call to it) so the whole workflow commits once::
+
+        with event_unit_of_work() as uow:
+            log_id = uow.insert_phone_log(...)
+            chain_id = uow.create_event_chain(title)
+            uow.link_log(chain_id, "phone_logs", log_id, timestamp)
+    """
+
+    def create_event_chain(self, title: str, description: str = "") -> int:
+        """Stage a new event chain and return its ID."""
+        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.cursor.execute(
+            """
+            INSERT INTO event_chains (title, description, created_at, last_activity)
+            VALUES (?, ?, ?, ?)
+            """,
+            (title, description, created_at, created_at),
+        )
+        return self._record("event_chains", self.cursor.lastrowid)
+
+    def link_logs(self, event_id: int, refs: list[tuple[str, int, str]]) -> int:
+        """Stage links from ``(table, source_id, timestamp)`` refs to a chain.
+
+        Returns the number of new links; logs already in the chain are
+        skipped by the unique index on ``event_links``.
+        """
+        self.cursor.executemany(
+            """
+            INSERT OR IGNORE INTO event_links (event_id, source_table, source_id, timestamp)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(event_id, table, source_id, timestamp) for table, source_id, timestamp in refs],
+        )
+        # executemany sums the rows inserted by each statement, so
+        # ignored duplicates are not counted
+        added = self.cursor.rowcount
+        self.after_commit(lambda: timeline_cache.invalidate(event_id))
+        if added:
+            refs = list(refs)
+            self.after_commit(lambda: _notify_links(event_id, refs))
+        return added
+
+    def link_log(self, event_id: int, table: str, source_id: int, timestamp: str) -> int:
+        """Stage a single link; see ``link_logs``."""
+        return self.link_logs(event_id, [(table, source_id, timestamp)])
+
+
+def event_unit_of_work():
+    """Return a ``unit_of_work`` context that yields an ``EventUnitOfWork``."""
+    return unit_of_work(EventUnitOfWork)
+
 # Load all logs with timestamp from all tables
-def load_all_logs() -> list[dict]:
+def load_all_logs() -> list[LogRef]:
     """Load all logs from every source table.
 
-    Returns a list of dictionaries with the keys ``source``,
-    ``table``, ``id`` and ``timestamp``. Logs are sorted by
-    timestamp. Errors encountered during database access are
-    logged and result in an empty list being returned.
+    Returns a list of ``LogRef`` records (``source``, ``table``,
+    ``id``, ``timestamp`` and ``summary``) sorted by timestamp. The
+    list is cached and shared between callers, so it must not be
+    modified. Errors encountered during database access are logged
+    and result in an empty list being returned.
     """
-    logs: list[dict] = []
-    sources = {
-        "email_logs": "Email",
-        "phone_logs": "Phone",
-        "radio_logs": "Radio",
-        "everbridge_logs": "Everbridge",
-    }
     try:
+        return _read_all_logs()
+    except Exception:
+        logger.exception("Failed to load logs from database")
+        return []
+
+@query_cache.cached(*LOG_TABLES)
+def _read_all_logs() -> list[LogRef]:
+    union = " UNION ALL ".join(
+        f"SELECT {SOURCE_CODES[table]}, id, timestamp, COALESCE(summary, '') FROM {table}"
+        for table in LOG_TABLES
+    )
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute(f"{union} ORDER BY timestamp")
+        return list(map(LogRef._make, c))
+
+# Link filters accepted by ``get_available_logs``
+LINK_FILTER_ALL = "all"
+LINK_FILTER_UNLINKED = "unlinked"
+LINK_FILTER_NOT_IN_CHAIN = "not_in_chain"
+
+# Load one page of logs that can still be attached to a chain
+def get_available_logs(
+    sources: list[str] | None = None,
+    since: str | None = None,
+    link_filter: str = LINK_FILTER_UNLINKED,
+    event_id: int | None = None,
+    limit: int = 200,
+    after: LogRef | None = None,
+    search: str = "",
+) -> list[LogRef]:
+    """Return a page of logs for the Event Manager, newest first.
+
+    Filtering by source, time window and link state all happens in
+    SQL. Link state is an anti-join (``NOT EXISTS``) against
+    ``event_links``, answered from the ``(source_table, source_id)``
+    index for unlinked logs and the unique
+    ``(event_id, source_table, source_id)`` index for logs missing
+    from one chain. Pages are cached in ``query_cache`` until a log
+    table or ``event_links`` changes.
+
+    Logs are ordered by ``(timestamp, code, id)``, newest first, and a
+    page starts right after the ``after`` log (keyset paging). Each
+    page is then an index range scan whatever its depth, and logs
+    inserted or linked while the view is open don't shift later pages.
+
+    Parameters
+    ----------
+    sources: list of str or None
+        Log tables to include; ``None`` includes all of ``LOG_TABLES``.
+    since: str or None
+        Only include logs at or after this ``YYYY-MM-DD HH:MM:SS``
+        timestamp.
+    link_filter: str
+        ``LINK_FILTER_ALL``, ``LINK_FILTER_UNLINKED`` (not in any
+        chain) or ``LINK_FILTER_NOT_IN_CHAIN`` (not in ``event_id``).
+    event_id: int or None
+        The chain used by ``LINK_FILTER_NOT_IN_CHAIN``.
+    limit: int
+        Page size.
+    after: LogRef or None
+        The last log of the previous page; ``None`` for the first page.
+    search: str
+        Whitespace-separated terms that must all appear in the log's
+        stored summary (case-insensitive).
+
+    Returns
+    -------
+    list of LogRef
+        Records like those from ``load_all_logs``.
+    """
+    if link_filter == LINK_FILTER_NOT_IN_CHAIN and event_id is None:
+        link_filter = LINK_FILTER_ALL
+
+    terms = [
+        "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        for term in dict.fromkeys(search.lower().split())
+    ]
+
+    selects = []
+    params: list = []
+    for table in sources or LOG_TABLES:
+        code = SOURCE_CODES[table]
+        conditions = []
+        if since:
+            conditions.append("t.timestamp >= ?")
+            params.append(since)
+        for term in terms:
+            conditions.append("t.summary LIKE ? ESCAPE '\\'")
+            params.append(term)
+        if link_filter == LINK_FILTER_UNLINKED:
+            conditions.append(
+                f"NOT EXISTS (SELECT 1 FROM event_links l "
+                f"WHERE l.source_table = '{table}' AND l.source_id = t.id)"
+            )
+        elif link_filter == LINK_FILTER_NOT_IN_CHAIN:
+            conditions.append(
+                f"NOT EXISTS (SELECT 1 FROM event_links l WHERE l.event_id = ? "
+                f"AND l.source_table = '{table}' AND l.source_id = t.id)"
+            )
+            params.append(event_id)
+        if after is not None and after.timestamp is None:
+            conditions.append(f"t.timestamp IS NULL AND ({code}, t.id) < (?, ?)")
+            params.extend([after.code, after.id])
+        elif after is not None:
+            # The plain bound lets SQLite range-scan the timestamp index
+            conditions.append(
+                f"(t.timestamp <= ? AND (t.timestamp, {code}, t.id) < (?, ?, ?) "
+                f"OR t.timestamp IS NULL)"
+            )
+            params.extend([after.timestamp, after.timestamp, after.code, after.id])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        selects.append(
+            f"SELECT {code}, t.id, t.timestamp, COALESCE(t.summary, '') "
+            f"FROM {table} t {where}"
+        )
+    if not selects:
+        return []
+    params.append(limit)
+    query = f"{' UNION ALL '.join(selects)} ORDER BY 3 DESC, 1 DESC, 2 DESC LIMIT ?"
+
+    def read():
         with sqlite3.connect(DB_PATH) as conn:
             c = conn.cursor()
-            for table, label in sources.items():
-                c.execute(f"SELECT id, timestamp FROM {table}")
-                rows = c.fetchall()
-                for row_id, timestamp in rows:
-                    logs.append(
-                        {
-                            "source": label,
-                            "table": table,
-                            "id": row_id,
-                            "timestamp": timestamp,
-                        }
-                    )
-        logs.sort(key=lambda x: x["timestamp"])
-        return logs
+            c.execute(query, params)
+            return list(map(LogRef._make, c))
+
+    try:
+        return query_cache.get_or_load(
+            (query, tuple(params)), (*(sources or LOG_TABLES), "event_links"), read
+        )
     except Exception:
-        logger.exception("Failed to load logs from database")
+        logger.exception("Failed to load available logs")
         return []
 
 # Create a new event chain
 def create_event_chain(title: str, description: str = "") -> int:
     """Create a new event chain and return its ID."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute(
-                """
-                INSERT INTO event_chains (title, description, created_at)
-                VALUES (?, ?, ?)
-                """,
-                (title, description, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-            )
-            event_id = c.lastrowid
+        with event_unit_of_work() as uow:
+            event_id = uow.create_event_chain(title, description)
         logger.info("Created new event chain '%s' with id %s", title, event_id)
         return event_id
     except Exception:
@@ -73,95 +336,174 @@ def create_event_chain(title: str, description: str = "") -> int:
 
 # Link a log to an event chain
 def link_log_to_event(event_id: int, table: str, source_id: int, timestamp: str) -> None:
-    """Link a log entry to an event chain."""
+    """Link a log entry to an event chain.
+
+    Linking a log that is already part of the chain is a no-op.
+    """
+    link_logs_to_event(event_id, [(table, source_id, timestamp)])
+
+# Link several logs to an event chain at once
+def link_logs_to_event(event_id: int, refs: list[tuple[str, int, str]]) -> int:
+    """Link many log entries to an event chain in one transaction.
+
+    Parameters
+    ----------
+    event_id: int
+        The chain to link the logs to.
+    refs: list of tuple
+        ``(table, source_id, timestamp)`` for each log.
+
+    Returns
+    -------
+    int
+        The number of new links. Logs already in the chain are
+        skipped by the unique index on ``event_links``.
+    """
+    if not refs:
+        return 0
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute(
-                """
-                INSERT INTO event_links (event_id, source_table, source_id, timestamp)
-                VALUES (?, ?, ?, ?)
-                """,
-                (event_id, table, source_id, timestamp),
-            )
-        logger.info(
-            "Linked log id %s from %s to event chain %s", source_id, table, event_id
-        )
+        with event_unit_of_work() as uow:
+            added = uow.link_logs(event_id, refs)
+        logger.info("Linked %d of %d logs to event chain %s", added, len(refs), event_id)
+        return added
     except Exception:
-        logger.exception(
-            "Failed to link log id %s from %s to event chain %s", source_id, table, event_id
-        )
+        logger.exception("Failed to link %d logs to event chain %s", len(refs), event_id)
         raise
 
 # Get all existing event chains
-def get_event_chains() -> list[dict]:
-    """Return a list of existing event chains sorted by creation date."""
+def get_event_chains() -> list[ChainSummary]:
+    """Return a list of existing event chains sorted by creation date.
+
+    Each ``ChainSummary`` carries its denormalized link metrics (``link_count``,
+    ``first_ts``, ``last_ts`` and ``last_activity``), so callers can
+    render counts and durations without querying ``event_links``.
+    The list is cached until ``event_chains`` changes and is shared
+    between callers, so it must not be modified.
+    """
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute(
-                "SELECT id, title, created_at FROM event_chains ORDER BY created_at DESC"
-            )
-            results = c.fetchall()
-            return [
-                {"id": r[0], "title": r[1], "created_at": r[2]} for r in results
-            ]
+        return _read_event_chains()
     except Exception:
         logger.exception("Failed to load event chains")
         return []
 
+@query_cache.cached("event_chains")
+def _read_event_chains() -> list[ChainSummary]:
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute(
+            """
+            SELECT id, title, created_at, link_count, first_ts, last_ts, last_activity
+            FROM event_chains
+            ORDER BY created_at DESC
+            """
+        )
+        return list(map(ChainSummary._make, c))
+
 # Get all logs linked to a specific chain
 def get_event_chain_logs(event_id: int) -> list[tuple[str, int, str]]:
     """Return a list of (table, source_id, timestamp) entries for an event chain."""
+    try:
+        return _read_event_chain_logs(event_id)
+    except Exception:
+        logger.exception("Failed to get logs for event chain %s", event_id)
+        return []
+
+@query_cache.cached("event_links")
+def _read_event_chain_logs(event_id: int) -> list[tuple[str, int, str]]:
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute(
+            """
+            SELECT source_table, source_id, timestamp
+            FROM event_links
+            WHERE event_id = ?
+            ORDER BY timestamp
+            """,
+            (event_id,),
+        )
+        return [
+            (intern_text(table), source_id, timestamp)
+            for table, source_id, timestamp in c.fetchall()
+        ]
+
+# Get the display timeline of a chain, served from the cache when possible
+def get_event_timeline(event_id: int) -> list[LogRef]:
+    """Return the linked logs of a chain as ``LogRef`` records, oldest first.
+
+    Timelines are kept in ``timeline_cache`` and only re-read after a
+    link, chain edit or change to one of the linked rows evicts them.
+    """
+    rows = timeline_cache.get(event_id)
+    if rows is None:
+        generation = timeline_cache.generation
+        rows = _query_event_timeline(event_id)
+        if rows is not None:
+            timeline_cache.put(event_id, rows, generation)
+    return rows or []
+
+def prefetch_event_timeline(event_id: int) -> bool:
+    """Warm the timeline cache for a chain.
+
+    Returns ``True`` if a database query was made, ``False`` if the
+    timeline was already cached.
+    """
+    if event_id in timeline_cache:
+        return False
+    get_event_timeline(event_id)
+    return True
+
+def _query_event_timeline(event_id: int) -> list[LogRef] | None:
+    """Read a chain timeline with one joined query over the log tables.
+
+    Returns ``None`` on database errors so failures are not cached.
+    """
+    joins = "\n".join(
+        f"LEFT JOIN {table} ON l.source_table = '{table}' AND {table}.id = l.source_id"
+        for table in LOG_TABLES
+    )
+    summary = ", ".join(f"{table}.summary" for table in LOG_TABLES)
     try:
         with sqlite3.connect(DB_PATH) as conn:
             c = conn.cursor()
             c.execute(
-                """
-                SELECT source_table, source_id, timestamp
-                FROM event_links
-                WHERE event_id = ?
-                ORDER BY timestamp
+                f"""
+                SELECT l.source_table, l.source_id, l.timestamp,
+                       COALESCE({summary}, '(No summary available)')
+                FROM event_links l
+                {joins}
+                WHERE l.event_id = ?
+                ORDER BY l.timestamp
                 """,
                 (event_id,),
             )
-            return c.fetchall()
+            return [
+                LogRef(SOURCE_CODES[table], source_id, timestamp, summary)
+                for table, source_id, timestamp, summary in c.fetchall()
+                if table in SOURCE_CODES
+            ]
     except Exception:
-        logger.exception("Failed to get logs for event chain %s", event_id)
-        return []
+        logger.exception("Failed to get timeline for event chain %s", event_id)
+        return None
 
 # Get summary of a log by source_table and id
 def get_log_summary(table: str, log_id: int) -> str:
-    """Return a concise summary string for a given log entry.
+    """Return the stored summary string for a given log entry.
 
     If the log does not exist, a placeholder string is returned.
     """
-    details = get_log_details(table, log_id)
-    if not details:
-        return "(No summary available)"
-
+    if table not in LOG_TABLES:
+        return "(Unknown log type)"
     try:
-        if table == "email_logs":
-            return f"{details.get('log_type', 'Email')}: {details.get('subject', 'No subject')}"
-        elif table == "phone_logs":
-            caller = details.get('caller_name', 'Unknown')
-            call_type = details.get('call_type', 'Phone')
-            site_code = details.get('site_code')
-            return (
-                f"{call_type} from {caller} - Site {site_code}"
-                if site_code
-                else f"{call_type} from {caller}"
-            )
-        elif table == "radio_logs":
-            return f"{details.get('unit', 'Unit')} - {details.get('reason', 'Unknown reason')}"
-        elif table == "everbridge_logs":
-            message = details.get('message', '') or ''
-            return (message[:50] + "...") if len(message) > 50 else message
-        else:
-            return "(Unknown log type)"
+        with sqlite3.connect(DB_PATH) as conn:
+            c = conn.cursor()
+            c.execute(f"SELECT summary FROM {table} WHERE id = ?", (log_id,))
+            row = c.fetchone()
     except Exception:
         logger.exception("Failed to summarize log id %s from %s", log_id, table)
         return "(Summary unavailable)"
+    if not row or not row[0]:
+        return "(No summary available)"
+    return row[0]
 
 # Update event chain (for editing)
 def update_event_chain(event_id: int, title: str, description: str) -> None:
@@ -180,4 +522,6 @@ def update_event_chain(event_id: int, title: str, description: str) -> None:
         logger.info("Updated event chain %s", event_id)
     except Exception:
         logger.exception("Failed to update event chain %s", event_id)
-        raise
\ No newline at end of file
+        raise
+    finally:
+        timeline_cache.invalidate(event_id)
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Workbook loading helpers for the merged "All Logs" view.
+
+The Excel log files written by ``log_manager`` each use their own
+column layout. The functions in this module read a single workbook
+and map it onto a common column set so that several logs can be
+merged and sorted into one table. They are deliberately free of any
+Qt imports so they can run inside worker processes.
+
+Each workbook is sorted by date and time in its worker, so the view
+only has to merge one sorted part into the already merged rows as it
+arrives (``merge_sorted_frames``).
+"""
+
+import numpy as np
+import pandas as pd
+
+# Columns shared by every normalized log frame, in display order
+COMMON_COLUMNS = ["Date", "Time", "Log", "Type", "Party", "Location", "Summary", "Logged By"]
+
+# Candidate source columns for each common column. The first column
+# present in a workbook wins; workbooks without any candidate get an
+# empty value.
+COLUMN_CANDIDATES = {
+    "Type": ["Category", "Type", "Alert Type", "Issue Type", "Request Type", "Event Type", "Reason", "Issue"],
+    "Party": ["From", "Caller", "Unit", "Requester", "Employee Name", "Officer", "Assigned To"],
+    "Location": ["Site", "Location", "Company", "Department"],
+    "Summary": ["Subject", "Summary", "Message", "Description", "Notes", "Vehicle"],
+    "Logged By": ["Logged By"],
+}
+
+
+def normalize_log_frame(df: pd.DataFrame, label: str) -> pd.DataFrame:
+    """Map a workbook's columns onto ``COMMON_COLUMNS``.
+
+    Parameters
+    ----------
+    df: pandas.DataFrame
+        The raw frame read from a log workbook.
+    label: str
+        The display name of the log (e.g. ``"Phone Call Logs"``),
+        stored in the ``Log`` column.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A frame with exactly ``COMMON_COLUMNS`` as string columns.
+    """
+    normalized = pd.DataFrame(index=df.index)
+
+    # Dates and times are stored inconsistently (strings, datetimes or
+    # Excel time objects), so normalize them to sortable text
+    if "Date" in df.columns:
+        dates = pd.to_datetime(df["Date"], errors="coerce")
+        normalized["Date"] = dates.dt.strftime("%Y-%m-%d").fillna("")
+    else:
+        normalized["Date"] = ""
+    normalized["Time"] = df["Time"].fillna("").astype(str) if "Time" in df.columns else ""
+    normalized["Log"] = label
+
+    for column, candidates in COLUMN_CANDIDATES.items():
+        source = next((c for c in candidates if c in df.columns), None)
+        normalized[column] = df[source].fillna("").astype(str) if source else ""
+
+    return normalized[COMMON_COLUMNS]
+
+
+def read_normalized_workbook(label: str, path: str, start: str | None = None,
+                             end: str | None = None) -> pd.DataFrame:
+    """Read one log workbook and return it normalized, date-filtered and sorted.
+
+    This is the unit of work submitted to the process pool by the
+    Logs Viewer, so it must stay a picklable module-level function.
+
+    Parameters
+    ----------
+    label: str
+        The display name of the log.
+    path: str
+        Path to the ``.xlsx`` file.
+    start, end: str or None
+        Inclusive ``YYYY-MM-DD`` bounds. ``None`` leaves that side of
+        the range open.
+    """
+    frame = normalize_log_frame(pd.read_excel(path), label)
+    if start:
+        frame = frame[frame["Date"] >= start]
+    if end:
+        frame = frame[frame["Date"] <= end]
+    return frame.sort_values(["Date", "Time"], kind="mergesort", ignore_index=True)
+
+
+def merge_log_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate normalized frames and sort them by date and time."""
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=COMMON_COLUMNS)
+    merged = pd.concat(frames, ignore_index=True)
+    return merged.sort_values(["Date", "Time"], kind="mergesort", ignore_index=True)
+
+
+def _sort_keys(frame: pd.DataFrame) -> np.ndarray:
+    # Dates are fixed-width or empty, so this orders like (Date, Time)
+    return (frame["Date"] + "\x00" + frame["Time"]).to_numpy(dtype=object)
+
+
+def merge_sorted_frames(merged: pd.DataFrame | None, part: pd.DataFrame) -> pd.DataFrame:
+    """Merge ``part`` into ``merged``; both must be sorted by date and time.
+
+    New rows are placed with a binary search instead of re-sorting
+    everything, and rows already merged keep their index labels (new
+    rows get labels after them), so a view can find them again. Rows
+    with equal date and time keep arrival order, as with a stable sort.
+    """
+    if part is None or part.empty:
+        return merged
+    offset = int(merged.index.max()) + 1 if merged is not None and len(merged) else 0
+    part = part.set_axis(pd.RangeIndex(offset, offset + len(part)))
+    if merged is None or merged.empty:
+        return part
+    positions = np.searchsorted(_sort_keys(merged), _sort_keys(part), side="right")
+    order = np.insert(np.arange(len(merged)), positions,
+                      np.arange(len(merged), len(merged) + len(part)))
+    return pd.concat([merged, part]).iloc[order]
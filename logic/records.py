@@ -0,0 +1,66 @@
+"""
+Compact record types for the in-memory log and chain caches.
+
+``query_cache``, the timeline cache and the Event Manager can hold a
+row for every log in the database, so rows are kept as ``NamedTuple``
+records rather than dicts. A record is a tuple without a per-instance
+``__dict__``; its fields are read by name and it unpacks like the
+tuples it replaces.
+
+The log table a row came from is stored as a small integer ``code``
+indexing ``SOURCE_TABLES``. ``table`` and ``source`` are properties
+returning the shared table name and label, so "phone_logs" and
+"Phone" exist once rather than once per row. Other short strings that
+repeat across rows, such as site codes and call types, go through
+``intern_text``.
+"""
+
+import sys
+from typing import NamedTuple
+
+from database import LOG_TABLES
+
+# Log tables in code order; ``LogRef.code`` indexes these
+SOURCE_TABLES = tuple(LOG_TABLES)
+# Display label of each table, in the same order
+SOURCE_LABELS = tuple(LOG_TABLES.values())
+# Table name to code
+SOURCE_CODES = {table: code for code, table in enumerate(SOURCE_TABLES)}
+
+
+def intern_text(value):
+    """Return the one shared copy of a repeated string; other values unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class LogRef(NamedTuple):
+    """One log row: its table code, ID, timestamp and stored summary."""
+
+    code: int
+    id: int
+    timestamp: str
+    summary: str
+
+    @classmethod
+    def from_table(cls, table: str, log_id: int, timestamp: str, summary: str | None) -> "LogRef":
+        return cls(SOURCE_CODES[table], log_id, timestamp, summary or "")
+
+    @property
+    def table(self) -> str:
+        return SOURCE_TABLES[self.code]
+
+    @property
+    def source(self) -> str:
+        return SOURCE_LABELS[self.code]
+
+
+class ChainSummary(NamedTuple):
+    """An event chain with its denormalized link metrics."""
+
+    id: int
+    title: str
+    created_at: str
+    link_count: int
+    first_ts: str | None
+    last_ts: str | None
+    last_activity: str | None
@@ -0,0 +1,145 @@
+"""
+Compact, pandas-free row container for the interactive panels.
+
+The logging consoles only ever hold a few dozen rows, so they keep them
+in a ``RowSet``: a list of plain tuples plus the column names. Tuples
+cost a fraction of the memory of a DataFrame and need no heavy imports.
+``RowSet`` covers what the panels need from a table: free-text search,
+filtering, sorting and CSV/Excel export. Excel files are written with
+openpyxl, imported on first export. ``to_frame()`` hands the rows to
+pandas for analysis and is the only place pandas is imported.
+"""
+
+import csv
+from operator import itemgetter
+
+# Joins the cells of a row for searching; a term can never match
+# across two cells
+CELL_SEPARATOR = "\x1f"
+
+
+def parse_query(query: str) -> tuple[str, ...]:
+    """Split a query into lowercase terms that must all match."""
+    return tuple(dict.fromkeys(query.lower().split()))
+
+
+class RowSet:
+    """Immutable table of tuple rows.
+
+    Filtering and sorting return a new ``RowSet`` that shares the row
+    tuples, so the result of a search costs one list of references.
+
+    Parameters
+    ----------
+    columns: sequence of str
+        Column names.
+    rows: iterable of sequence
+        One value per column for each row.
+    """
+
+    __slots__ = ("columns", "rows", "_positions")
+
+    def __init__(self, columns, rows=()):
+        self.columns = tuple(columns)
+        self.rows = [row if isinstance(row, tuple) else tuple(row) for row in rows]
+        self._positions = {name: i for i, name in enumerate(self.columns)}
+
+    @classmethod
+    def from_query(cls, conn, query: str, params=()) -> "RowSet":
+        """Run ``query`` on ``conn`` and keep its result with its column names."""
+        cursor = conn.execute(query, params)
+        return cls([d[0] for d in cursor.description], cursor.fetchall())
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RowSet(self.columns, self.rows[index])
+        return self.rows[index]
+
+    def position(self, column: str) -> int:
+        """Return the index of ``column`` in each row."""
+        return self._positions[column]
+
+    def column(self, name: str) -> list:
+        """Return the values of one column."""
+        index = self._positions[name]
+        return [row[index] for row in self.rows]
+
+    def records(self) -> list[dict]:
+        """Return the rows as dicts keyed by column name."""
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+    def filter(self, predicate) -> "RowSet":
+        """Return the rows for which ``predicate(row)`` is true."""
+        return RowSet(self.columns, [row for row in self.rows if predicate(row)])
+
+    def where(self, column: str, predicate) -> "RowSet":
+        """Return the rows whose ``column`` value satisfies ``predicate``."""
+        index = self._positions[column]
+        return RowSet(self.columns, [row for row in self.rows if predicate(row[index])])
+
+    def search(self, query: str) -> "RowSet":
+        """Return the rows containing every term of ``query``, in any cell.
+
+        Matching is case-insensitive. An empty query returns every row.
+        """
+        terms = parse_query(query)
+        if not terms:
+            return self
+        return self.filter(
+            lambda row: all(
+                term in CELL_SEPARATOR.join("" if v is None else str(v) for v in row).lower()
+                for term in terms
+            )
+        )
+
+    def sort(self, column: str, descending: bool = False) -> "RowSet":
+        """Return the rows ordered by ``column``; empty cells go last.
+
+        Columns holding values that cannot be compared with each other
+        are ordered by their text.
+        """
+        index = self._positions[column]
+        filled = [row for row in self.rows if row[index] is not None]
+        empty = [row for row in self.rows if row[index] is None]
+        try:
+            filled = sorted(filled, key=itemgetter(index), reverse=descending)
+        except TypeError:
+            filled = sorted(filled, key=lambda row: str(row[index]), reverse=descending)
+        return RowSet(self.columns, filled + empty)
+
+    def to_csv(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(self.columns)
+            writer.writerows(("" if v is None else v for v in row) for row in self.rows)
+
+    def to_excel(self, path: str, sheet_name: str = "Sheet1") -> None:
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = sheet_name
+        sheet.append(self.columns)
+        for row in self.rows:
+            sheet.append(row)
+        workbook.save(path)
+
+    def export(self, path: str) -> None:
+        """Write the rows to ``path`` as CSV or, otherwise, Excel."""
+        if path.lower().endswith(".csv"):
+            self.to_csv(path)
+        else:
+            self.to_excel(path)
+
+    def to_frame(self):
+        """Return the rows as a pandas DataFrame, importing pandas."""
+        import pandas as pd
+
+        return pd.DataFrame(self.rows, columns=list(self.columns))
+
@@ -0,0 +1,75 @@
+"""
+Vectorized free-text filtering for the log tables.
+
+``SearchIndex`` lowercases and joins every row of a DataFrame into one
+search string when the data is loaded. Queries are then answered with
+vectorized ``Series.str.contains`` scans over that precomputed column
+instead of calling ``str(cell).lower()`` for every cell on every
+keystroke. The column keeps variable-width strings: a fixed-width NumPy
+``<U`` array would pad every row to the longest one, so a single long
+message could need gigabytes.
+"""
+
+import numpy as np
+import pandas as pd
+
+from logic.rows import CELL_SEPARATOR, parse_query
+
+
+def build_search_column(frame: pd.DataFrame) -> pd.Series:
+    """Return one lowercase, separator-joined string per row of ``frame``.
+
+    The result is indexed by row position.
+    """
+    if frame.empty:
+        return pd.Series([], dtype=object)
+    text = frame.fillna("").astype(str)
+    joined = text.iloc[:, 0]
+    if text.shape[1] > 1:
+        joined = joined.str.cat(
+            [text.iloc[:, i] for i in range(1, text.shape[1])], sep=CELL_SEPARATOR
+        )
+    return joined.str.lower().reset_index(drop=True)
+
+
+class SearchIndex:
+    """Multi-term AND search over the rows of a DataFrame.
+
+    The result of the previous query is kept. When the new query only
+    narrows it (every previous term is contained in one of the new
+    terms, as when the operator keeps typing), only the previous hits
+    are rescanned.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self._haystack = build_search_column(frame)
+        self._all = np.arange(len(frame))
+        self._last_terms: tuple[str, ...] = ()
+        self._last_hits = self._all
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def positions(self, query: str) -> np.ndarray:
+        """Return the row positions matching every term of ``query``."""
+        terms = parse_query(query)
+        if not terms:
+            hits = self._all
+        else:
+            narrows = all(any(old in new for new in terms) for old in self._last_terms)
+            hits = self._last_hits if narrows else self._all
+            # Terms already satisfied by every previous hit need no rescan
+            pending = [t for t in terms if not (narrows and t in self._last_terms)]
+            for term in pending:
+                if hits.size == 0:
+                    break
+                mask = self._haystack.iloc[hits].str.contains(term, regex=False)
+                hits = hits[mask.to_numpy(dtype=bool)]
+        self._last_terms = terms
+        self._last_hits = hits
+        return hits
+
+    def filter(self, query: str) -> pd.DataFrame:
+        """Return the rows of the indexed frame that match ``query``."""
+        return self.frame.iloc[self.positions(query)]
@@ -0,0 +1,268 @@
+"""
+Incremental SLA breach detection for open event chains.
+
+An open chain is expected to receive its next log within a threshold
+that depends on its sites and call types. ``SlaEngine`` keeps every
+open chain's deadline (last link + threshold) in a heap, so a check
+only looks at the chains whose deadline has passed and never at the
+rest of the history. The heap is seeded once from the chains active
+within ``OPEN_HORIZON`` and then updated from each new link.
+
+Thresholds come from the ``sla_thresholds`` setting::
+
+    {"default_minutes": 15,
+     "sites": {"FSP": 10},
+     "call_types": {"Alarm": 5}}
+
+When several thresholds apply to a chain the strictest one wins.
+This module has no Qt dependency; ``ui.sla_monitor`` drives it.
+"""
+
+import heapq
+import sqlite3
+from datetime import datetime, timedelta
+
+from database import DB_PATH
+from logger import get_logger
+from logic.records import intern_text
+
+logger = get_logger(__name__)
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Chains without a link for longer than this are considered closed
+OPEN_HORIZON = timedelta(hours=24)
+
+DEFAULT_THRESHOLD_MINUTES = 15
+
+# Columns holding the site and call type of each log table; ``None``
+# when the table has no such column
+SLA_KEY_COLUMNS = {
+    "phone_logs": ("site_code", "call_type"),
+    "everbridge_logs": ("site_code", None),
+    "radio_logs": ("location", None),
+}
+
+
+def _key_expr(kind: int, table_column: str, id_column: str) -> str:
+    """SQL expression for the site (``kind=0``) or call type of a log."""
+    branches = " ".join(
+        f"WHEN '{table}' THEN (SELECT {columns[kind]} FROM {table} WHERE id = {id_column})"
+        for table, columns in SLA_KEY_COLUMNS.items()
+        if columns[kind]
+    )
+    return f"CASE {table_column} {branches} END"
+
+
+_OPEN_CHAINS_QUERY = f"""
+    SELECT c.id, c.last_ts,
+           {_key_expr(0, "l.source_table", "l.source_id")},
+           {_key_expr(1, "l.source_table", "l.source_id")}
+    FROM event_chains c JOIN event_links l ON l.event_id = c.id
+    WHERE c.last_ts >= ?
+"""
+
+
+def _parse(timestamp):
+    try:
+        return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def _clean(value):
+    value = str(value).strip() if value is not None else ""
+    # Site codes and call types repeat across every open chain
+    return intern_text(value) if value else None
+
+
+class SlaThresholds:
+    """Per-site and per-call-type response thresholds in minutes."""
+
+    def __init__(self, default_minutes=DEFAULT_THRESHOLD_MINUTES, sites=None, call_types=None):
+        self.default_minutes = float(default_minutes)
+        self.sites = {k.lower(): float(v) for k, v in (sites or {}).items()}
+        self.call_types = {k.lower(): float(v) for k, v in (call_types or {}).items()}
+
+    @classmethod
+    def from_settings(cls, settings) -> "SlaThresholds":
+        """Build thresholds from the ``sla_thresholds`` setting value."""
+        settings = settings or {}
+        try:
+            return cls(
+                settings.get("default_minutes", DEFAULT_THRESHOLD_MINUTES),
+                settings.get("sites"),
+                settings.get("call_types"),
+            )
+        except (AttributeError, TypeError, ValueError):
+            logger.warning("Invalid sla_thresholds setting %r; using defaults", settings)
+            return cls()
+
+    def minutes_for(self, sites, call_types) -> float:
+        """Return the strictest threshold that applies to the given keys."""
+        candidates = [self.default_minutes]
+        candidates += [self.sites[s.lower()] for s in sites if s.lower() in self.sites]
+        candidates += [self.call_types[t.lower()] for t in call_types if t.lower() in self.call_types]
+        return min(candidates)
+
+
+class _ChainState:
+    __slots__ = ("last_ts", "sites", "call_types", "deadline", "version")
+
+    def __init__(self, last_ts):
+        self.last_ts = last_ts
+        self.sites = set()
+        self.call_types = set()
+        self.deadline = None
+        self.version = 0
+
+
+class SlaEngine:
+    """Heap of open chain deadlines with lazy deletion.
+
+    Each chain has at most one live heap entry; rescheduling a chain
+    bumps its version so older entries are skipped when they surface.
+    A chain is forgotten once it breaches and is tracked again from
+    its next link, so memory is bounded by the number of open chains.
+    """
+
+    def __init__(self, thresholds=None, horizon=OPEN_HORIZON):
+        self.thresholds = thresholds or SlaThresholds()
+        self.horizon = horizon
+        self._chains: dict[int, _ChainState] = {}
+        self._heap: list[tuple[datetime, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._chains)
+
+    def seed(self, rows, now=None) -> None:
+        """Load ``(event_id, last_ts, site, call_type)`` rows, one per link.
+
+        Chains whose deadline has already passed are not tracked: they
+        went overdue before the engine started and would otherwise all
+        be reported as new breaches on every launch.
+        """
+        for event_id, last_ts, site, call_type in rows:
+            self._update(event_id, last_ts, site, call_type)
+        now = now or datetime.now()
+        for event_id in list(self._chains):
+            self._schedule(event_id, now, report_overdue=False)
+
+    def on_link(self, event_id, timestamp, site=None, call_type=None, now=None) -> None:
+        """Record a newly linked log and reschedule its chain.
+
+        A chain is only tracked while its deadline is in the future, so
+        linking a log that is already older than the threshold does not
+        breach at once.
+        """
+        if self._update(event_id, timestamp, site, call_type):
+            self._schedule(event_id, now or datetime.now(), report_overdue=False)
+
+    def discard(self, event_id) -> None:
+        """Stop tracking a chain, e.g. once it was closed or deleted."""
+        self._chains.pop(event_id, None)
+
+    def set_thresholds(self, thresholds, now=None) -> None:
+        """Apply new thresholds and reschedule every open chain."""
+        self.thresholds = thresholds
+        self._heap = []
+        now = now or datetime.now()
+        for event_id in list(self._chains):
+            self._schedule(event_id, now)
+
+    def next_deadline(self) -> datetime | None:
+        """Return the earliest live deadline, or ``None`` if idle."""
+        while self._heap:
+            deadline, event_id, version = self._heap[0]
+            state = self._chains.get(event_id)
+            if state is not None and state.version == version:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def check(self, now=None) -> list[dict]:
+        """Pop and return every chain whose deadline has passed.
+
+        Returns
+        -------
+        list of dict
+            One breach per chain with ``event_id``, ``last_ts``,
+            ``deadline``, ``threshold_minutes``, ``overdue_minutes``,
+            ``sites`` and ``call_types``.
+        """
+        now = now or datetime.now()
+        breaches = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, event_id, version = heapq.heappop(self._heap)
+            state = self._chains.get(event_id)
+            if state is None or state.version != version:
+                continue
+            del self._chains[event_id]
+            threshold = (deadline - state.last_ts).total_seconds() / 60
+            breaches.append({
+                "event_id": event_id,
+                "last_ts": state.last_ts.strftime(TIMESTAMP_FORMAT),
+                "deadline": deadline.strftime(TIMESTAMP_FORMAT),
+                "threshold_minutes": threshold,
+                "overdue_minutes": (now - deadline).total_seconds() / 60,
+                "sites": sorted(state.sites),
+                "call_types": sorted(state.call_types),
+            })
+        return breaches
+
+    def _update(self, event_id, timestamp, site, call_type) -> bool:
+        moment = _parse(timestamp)
+        if moment is None:
+            return False
+        state = self._chains.get(event_id)
+        if state is None:
+            state = self._chains[event_id] = _ChainState(moment)
+        elif moment > state.last_ts:
+            state.last_ts = moment
+        site, call_type = _clean(site), _clean(call_type)
+        if site:
+            state.sites.add(site)
+        if call_type:
+            state.call_types.add(call_type)
+        return True
+
+    def _schedule(self, event_id, now, report_overdue=True) -> None:
+        state = self._chains[event_id]
+        if now - state.last_ts > self.horizon:
+            # Too old to be an open incident
+            del self._chains[event_id]
+            return
+        minutes = self.thresholds.minutes_for(state.sites, state.call_types)
+        deadline = state.last_ts + timedelta(minutes=minutes)
+        if not report_overdue and deadline <= now:
+            del self._chains[event_id]
+            return
+        state.deadline = deadline
+        state.version += 1
+        heapq.heappush(self._heap, (state.deadline, event_id, state.version))
+
+
+def load_open_chains(horizon=OPEN_HORIZON) -> list[tuple]:
+    """Return seed rows for ``SlaEngine.seed`` for recently active chains."""
+    since = (datetime.now() - horizon).strftime(TIMESTAMP_FORMAT)
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            return conn.execute(_OPEN_CHAINS_QUERY, (since,)).fetchall()
+    except Exception:
+        logger.exception("Failed to load open event chains for SLA monitoring")
+        return []
+
+
+def get_log_keys(table: str, source_id: int) -> tuple[str | None, str | None]:
+    """Return the ``(site, call_type)`` of one log; a primary-key lookup."""
+    columns = SLA_KEY_COLUMNS.get(table)
+    if columns is None:
+        return None, None
+    select = ", ".join(column or "NULL" for column in columns)
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            row = conn.execute(f"SELECT {select} FROM {table} WHERE id = ?", (source_id,)).fetchone()
+    except Exception:
+        logger.exception("Failed to read SLA keys for %s id %s", table, source_id)
+        return None, None
+    return tuple(row) if row else (None, None)
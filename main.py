@@ -1,15 +1,20 @@
-from PyQt6.QtWidgets import QApplication, QLabel, QMessageBox
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
-from ui.home import HomeWindow
-from database import init_db
-from app_settings import apply_display_scaling, app_settings
-from logger import get_logger
+import time
+
+# Taken before anything else is imported so startup is measured from here
+STARTUP_STARTED = time.perf_counter()
+
+from startup_profiler import StartupProfiler
+import multiprocessing
 import sys
 import os
 
+# Command line flag that prints startup timings once the window is up
+PROFILE_FLAG = "--profile-startup"
+
 def show_splash():
     """Show splash screen while loading"""
+    from PyQt6.QtWidgets import QApplication, QLabel
+    from PyQt6.QtCore import Qt
     splash_widget = QLabel("Security Operations Logger")
     splash_widget.setWindowFlags(Qt.WindowType.SplashScreen | Qt.WindowType.FramelessWindowHint)
     splash_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -24,22 +29,36 @@ def show_splash():
         }
     """)
     splash_widget.setMinimumSize(600, 400)
-    
+
     # Center on screen
-    from PyQt6.QtWidgets import QApplication
     screen = QApplication.primaryScreen()
     if screen:
         screen_geometry = screen.geometry()
         x = (screen_geometry.width() - splash_widget.width()) // 2
         y = (screen_geometry.height() - splash_widget.height()) // 2
         splash_widget.move(x, y)
-    
+
     splash_widget.show()
-    
+
     return splash_widget
 
 def main():
+    # Time every phase and first import when asked to
+    profile = PROFILE_FLAG in sys.argv
+    if profile:
+        sys.argv.remove(PROFILE_FLAG)
+    profiler = StartupProfiler(STARTUP_STARTED)
+    if profile:
+        profiler.track_imports()
+
+    started = time.perf_counter()
+    from PyQt6.QtWidgets import QApplication, QMessageBox
+    from app_settings import apply_display_scaling, app_settings
+    from logger import get_logger
+    profiler.phase("Import Qt and settings", started)
+
     # Create application
+    started = time.perf_counter()
     app = QApplication(sys.argv)
 
     # Initialize logger and log application start
@@ -57,58 +76,87 @@ def main():
         # Log the exception with full traceback
         logger.exception("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
         # Show a user-friendly error dialog
-        from PyQt6.QtWidgets import QMessageBox
         QMessageBox.critical(None, "Application Error",
                              f"An unexpected error occurred:\n\n{exc_value}")
     sys.excepthook = handle_exception
-    
+
     # Set application properties
     app.setApplicationName("Security Ops Logger")
     app.setOrganizationName("Security Operations")
-    
+
     # Apply display scaling
     apply_display_scaling(app)
-    
+
     # Set global application style FIRST
     app.setStyle("Fusion")  # Modern look across platforms
-    
+
     # Show splash screen
     splash = show_splash()
     app.processEvents()
-    
-    # Apply theme AFTER style is set and Qt is initialized
-    from ui.themes import get_theme_stylesheet
-    theme = app_settings.get("theme", "dark")
-    stylesheet = get_theme_stylesheet(theme)
-    app.setStyleSheet(stylesheet)
-    
-    # Force processing of style changes
-    app.processEvents()
-    
+    profiler.phase("Create application and splash", started)
+
     # Ensure data directory exists
     if not os.path.exists("data"):
         os.makedirs("data")
-    
-    # Initialize database
-    try:
+
+    # Initialize the database on a worker thread while the theme and
+    # the home window's modules are prepared here
+    from ui.task_runner import task_runner, Priority
+    from database import init_db
+    state = {"window": None}
+    db_started = time.perf_counter()
+
+    def init_database():
         init_db()
-    except Exception as e:
+        profiler.phase("Initialize database (worker)", db_started)
+
+    def on_database_ready(_result):
+        started = time.perf_counter()
+        from ui.home import HomeWindow
+        window = HomeWindow()
+        state["window"] = window
+        # The splash stays up until the window has actually been painted
+        window.ready.connect(lambda: on_window_ready(window))
+        window.show()
+        profiler.phase("Create home window", started)
+
+    def on_window_ready(window):
         splash.close()
-        from PyQt6.QtWidgets import QMessageBox
-        QMessageBox.critical(None, "Database Error", 
-                           f"Failed to initialize database:\n\n{str(e)}")
-        return
-    
-    # Create main window
-    window = HomeWindow()
-    
-    # Close splash and show main window
-    QTimer.singleShot(1000, splash.close)
-    QTimer.singleShot(1100, window.show)
-    
+        if profile:
+            profiler.stop()
+            report = profiler.report()
+            print(report, flush=True)
+            logger.info("Startup profile:\n%s", report)
+        else:
+            logger.info("Home window ready after %.0f ms", profiler.elapsed_ms())
+
+    def on_database_failed(error):
+        splash.close()
+        QMessageBox.critical(None, "Database Error",
+                           f"Failed to initialize database:\n\n{error}")
+        app.quit()
+
+    task_runner().submit(
+        init_database, priority=Priority.HIGH,
+        on_result=on_database_ready, on_error=on_database_failed,
+    )
+
+    # Apply theme AFTER style is set and Qt is initialized
+    started = time.perf_counter()
+    from ui.themes import get_theme_stylesheet
+    theme = app_settings.get("theme", "dark")
+    stylesheet = get_theme_stylesheet(theme)
+    app.setStyleSheet(stylesheet)
+    profiler.phase("Apply theme", started)
+
+    # Load the home window's modules before the database is ready
+    started = time.perf_counter()
+    import ui.home
+    profiler.phase("Import home window", started)
+
     # Handle application exit
-    app.aboutToQuit.connect(lambda: handle_exit(window))
-    
+    app.aboutToQuit.connect(lambda: handle_exit(state["window"]))
+
     sys.exit(app.exec())
 
     # Log shutdown event (this line may never execute if sys.exit terminates)
@@ -116,14 +164,20 @@ def main():
 
 def handle_exit(window):
     """Handle application exit"""
+    from logger import get_logger
     # Save window geometry
-    from app_settings import save_window_geometry
-    save_window_geometry("main", window.geometry())
-    
+    if window is not None:
+        from app_settings import save_window_geometry
+        save_window_geometry("main", window.geometry())
+
     # Any other cleanup
     # Log exit event
     logger = get_logger(__name__)
+    from database import query_cache
+    logger.info("Query cache statistics: %s", query_cache.stats())
     logger.info("Security Ops Logger closed")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Required for the Logs Viewer's process pool in frozen Windows builds
+    multiprocessing.freeze_support()
+    main()
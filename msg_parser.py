@@ -132,4 +132,23 @@ def parse_msg(filepath):
             "sent_time": "",
             "body": f"Error: {str(e)}",
             "error": True
-        }
\ No newline at end of file
+        }
+
+
+def parse_msg_in_thread(filepath):
+    """Parse a .msg file from a worker thread.
+
+    COM must be initialized on every thread that uses it, so this
+    wraps ``parse_msg`` in ``CoInitialize``/``CoUninitialize`` when
+    ``pythoncom`` is available.
+    """
+    try:
+        import pythoncom  # type: ignore
+    except Exception:
+        return parse_msg(filepath)
+
+    pythoncom.CoInitialize()
+    try:
+        return parse_msg(filepath)
+    finally:
+        pythoncom.CoUninitialize()
@@ -0,0 +1,201 @@
+"""
+Process-wide cache of database read results.
+
+Each entry is keyed by the query and its parameters and tagged with
+the tables it reads. Alongside the result, the cache stores the write
+counters of those tables from ``data_versions`` (see
+``database._migrate_data_versions``) as they were before the query
+ran. A lookup is a hit only while the counters are unchanged, so an
+entry goes stale exactly when one of its tables is written to, by
+this process or any other. The total estimated size of the results
+is capped and the least recently used entries are evicted first.
+
+``database.query_cache`` is the shared instance.
+"""
+
+import functools
+import sys
+import threading
+from collections import OrderedDict
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Default cap on the estimated size of all cached results (bytes)
+QUERY_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Rows sampled by ``estimate_size`` to cost a list of rows
+ESTIMATE_SAMPLE_ROWS = 32
+
+# Returned by ``QueryCache.get`` when there is no current entry
+MISS = object()
+
+
+def _walk_size(value, limit: int | None = None) -> int:
+    """Sum ``sys.getsizeof`` over ``value`` and what it contains.
+
+    Follows lists, tuples, sets and dicts; shared objects are counted
+    once. Stops early once the total exceeds ``limit``.
+    """
+    seen = set()
+    total = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if limit is not None and total > limit:
+            break
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+
+def estimate_size(value, limit: int | None = None) -> int:
+    """Approximate the memory held by ``value`` and what it contains.
+
+    A list or tuple of rows is costed as its row count times the mean
+    size of up to ``ESTIMATE_SAMPLE_ROWS`` rows spread over it, so a
+    large result is not walked object by object. Other values are
+    walked in full. Once the estimate exceeds ``limit`` the walk stops
+    and the partial total, already over the limit, is returned.
+    """
+    if not isinstance(value, (list, tuple)) or len(value) <= ESTIMATE_SAMPLE_ROWS:
+        return _walk_size(value, limit)
+    total = sys.getsizeof(value)
+    if limit is not None and total > limit:
+        return total
+    step = len(value) // ESTIMATE_SAMPLE_ROWS
+    sample = value[::step][:ESTIMATE_SAMPLE_ROWS]
+    # Walked together so values shared between rows are counted once
+    per_row = (_walk_size(sample) - sys.getsizeof(sample)) / len(sample)
+    return total + int(per_row * len(value))
+
+
+class QueryCache:
+    """LRU cache of read results invalidated by table write counters.
+
+    Parameters
+    ----------
+    versions: callable
+        ``versions(tables)`` returns the current write counter of each
+        table as a tuple, with ``None`` for unknown counters. Results
+        read while a counter is unknown are not cached.
+    max_bytes: int
+        Cap on the estimated size of all cached results.
+    """
+
+    def __init__(self, versions, max_bytes: int = QUERY_CACHE_MAX_BYTES):
+        self._versions = versions
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def versions(self, tables) -> tuple:
+        """Return the current write counters of ``tables``."""
+        return tuple(self._versions(tuple(tables)))
+
+    def get(self, key, versions: tuple):
+        """Return the result cached under ``key`` at ``versions``, or ``MISS``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return MISS
+            if entry[0] != versions:
+                # A tagged table was written to since the result was read
+                self._stale += 1
+                self._misses += 1
+                self._drop(key)
+                return MISS
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key, versions: tuple, value) -> None:
+        """Cache ``value`` read while the tables were at ``versions``."""
+        if None in versions:
+            return
+        size = estimate_size(value, self.max_bytes)
+        with self._lock:
+            self._drop(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (versions, value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def get_or_load(self, key, tables, loader):
+        """Return the cached result for ``key`` or store ``loader()``.
+
+        ``tables`` are the tables ``loader`` reads. Exceptions from
+        ``loader`` propagate and nothing is cached.
+        """
+        versions = self.versions(tables)
+        value = self.get(key, versions)
+        if value is MISS:
+            value = loader()
+            self.put(key, versions, value)
+        return value
+
+    def cached(self, *tables):
+        """Decorate a read function whose result depends on ``tables``.
+
+        Calls are keyed by the function and its arguments, which must
+        be hashable. Results are shared between callers and must be
+        treated as read-only.
+        """
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+                return self.get_or_load(key, tables, lambda: fn(*args, **kwargs))
+            return wrapper
+        return decorator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Return counters for diagnostics.
+
+        ``hits``, ``misses`` (including ``stale`` lookups whose
+        tables had changed), ``evictions``, ``entries``, ``bytes``
+        and ``hit_rate`` (0 to 1).
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale": self._stale,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def _drop(self, key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
@@ -0,0 +1,99 @@
+"""
+Timings of application startup for ``main.py --profile-startup``.
+
+``StartupProfiler`` records how long each startup phase took and, once
+``track_imports()`` is called, how long every module took to import
+the first time. Import times are inclusive of the modules a module
+imports itself; the self time excludes them, as with Python's
+``-X importtime``. ``report()`` formats both next to the time to first
+window and the ``STARTUP_BUDGET_MS`` budget.
+
+Only the standard library is imported here so the profiler can be set
+up before anything else is loaded.
+"""
+
+import builtins
+import sys
+import threading
+import time
+
+# Target time from process start to the home window on screen (ms)
+STARTUP_BUDGET_MS = 1500
+# Slowest imports listed in the report
+REPORT_IMPORTS = 25
+
+
+class StartupProfiler:
+    """Phase and import timings of one startup.
+
+    Parameters
+    ----------
+    start: float or None
+        ``time.perf_counter()`` at process start; defaults to now.
+    """
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.phases = []
+        # name -> [inclusive ms, self ms]
+        self.imports = {}
+        self._lock = threading.Lock()
+        self._stack = []
+        self._thread = None
+        self._original_import = None
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000
+
+    def phase(self, name: str, started: float) -> None:
+        """Record phase ``name`` that began at ``started`` (perf_counter)."""
+        with self._lock:
+            self.phases.append((name, (time.perf_counter() - started) * 1000))
+
+    def track_imports(self) -> None:
+        """Time first imports made on the calling thread until ``stop()``."""
+        self._thread = threading.get_ident()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if (level or threading.get_ident() != self._thread or name in sys.modules
+                or original is None):
+            return original(name, globals, locals, fromlist, level)
+        # [name, started, time spent in nested first imports]
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            self._stack.pop()
+            total = (time.perf_counter() - frame[1]) * 1000
+            if self._stack:
+                self._stack[-1][2] += total
+            self.imports.setdefault(name, [total, total - frame[2]])
+
+    def report(self, budget_ms: float = STARTUP_BUDGET_MS,
+               limit: int = REPORT_IMPORTS) -> str:
+        """Return the timings as text, slowest imports first."""
+        total = self.elapsed_ms()
+        verdict = "within" if total <= budget_ms else "OVER"
+        lines = [
+            f"Time to first window: {total:.0f} ms ({verdict} the {budget_ms:.0f} ms budget)",
+            "",
+            "Phases (ms):",
+        ]
+        with self._lock:
+            phases = list(self.phases)
+        lines += [f"  {ms:8.1f}  {name}" for name, ms in phases]
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        lines += ["", f"Slowest imports (ms, {len(self.imports)} modules):",
+                  "  inclusive      self  module"]
+        lines += [f"  {inclusive:9.1f} {own:9.1f}  {name}"
+                  for name, (inclusive, own) in slowest[:limit]]
+        return "\n".join(lines)
@@ -0,0 +1,209 @@
+"""
+Lightweight QPainter time-series chart.
+
+``TimeSeriesChart`` draws one or more line series over a shared time
+axis. Before painting, each series is cut to the visible range with a
+binary search and downsampled to the plot's pixel width (see
+``logic.downsample``), so the cost of a repaint depends on the width
+of the widget rather than on the length of the series. That keeps
+zooming (mouse wheel) and panning (drag) smooth on multi-year ranges.
+Double-click resets the view.
+"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt6.QtWidgets import QSizePolicy, QWidget
+
+from logic.downsample import lttb, minmax_decimate
+
+# Plot margins in pixels: left, top, right, bottom
+MARGINS = (60, 30, 20, 40)
+BACKGROUND = QColor("#1a1a1a")
+GRID = QColor("#333333")
+TEXT = QColor("#e0e0e0")
+MUTED = QColor("#808080")
+
+# Shortest visible span when zooming in, in seconds
+MIN_SPAN = 3600.0
+
+
+def to_seconds(times) -> np.ndarray:
+    """Convert ``datetime64`` values to float seconds since the epoch."""
+    return np.asarray(times).astype("datetime64[s]").astype(np.int64).astype(float)
+
+
+def _format_time(seconds: float, span: float) -> str:
+    moment = datetime.fromtimestamp(seconds, tz=timezone.utc)
+    if span <= 3 * 86400:
+        return moment.strftime("%m-%d %H:%M")
+    if span <= 2 * 365 * 86400:
+        return moment.strftime("%Y-%m-%d")
+    return moment.strftime("%Y-%m")
+
+
+class TimeSeriesChart(QWidget):
+    """Zoomable line chart of time series.
+
+    Parameters
+    ----------
+    method: str
+        ``"minmax"`` (keeps spikes; for counts) or ``"lttb"`` (keeps
+        shape; for smooth measures) downsampling.
+    """
+
+    def __init__(self, method="minmax", parent=None):
+        super().__init__(parent)
+        self.method = method
+        self.series = []
+        self.y_label = ""
+        self.empty_text = "No data"
+        self._extent = None
+        self._view = None
+        self._drag_x = None
+        self.setMinimumHeight(300)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setMouseTracking(False)
+
+    def set_series(self, series, y_label="", method=None):
+        """Show ``series``, a list of ``(name, times, values, QColor)``.
+
+        ``times`` is an array of ``datetime64`` sorted ascending.
+        """
+        if method is not None:
+            self.method = method
+        self.y_label = y_label
+        self.series = [
+            (name, to_seconds(times), np.asarray(values, dtype=float), QColor(color))
+            for name, times, values, color in series
+            if len(times)
+        ]
+        if self.series:
+            lo = min(x[0] for _n, x, _y, _c in self.series)
+            hi = max(x[-1] for _n, x, _y, _c in self.series)
+            self._extent = (lo, max(hi, lo + MIN_SPAN))
+        else:
+            self._extent = None
+        self._view = self._extent
+        self.update()
+
+    def clear(self):
+        self.set_series([])
+
+    def plot_rect(self) -> QRectF:
+        left, top, right, bottom = MARGINS
+        return QRectF(left, top, max(1, self.width() - left - right), max(1, self.height() - top - bottom))
+
+    def visible_points(self, x, y, width):
+        """Slice a series to the view and downsample it to ``width`` pixels."""
+        x0, x1 = self._view
+        # One point beyond each edge keeps the line running off the plot
+        i0 = max(int(np.searchsorted(x, x0, side="left")) - 1, 0)
+        i1 = min(int(np.searchsorted(x, x1, side="right")) + 1, len(x))
+        xs, ys = x[i0:i1], y[i0:i1]
+        if self.method == "lttb":
+            return lttb(xs, ys, max(3, width))
+        return minmax_decimate(xs, ys, max(1, width))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), BACKGROUND)
+        rect = self.plot_rect()
+
+        if not self.series or self._view is None:
+            painter.setPen(MUTED)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.empty_text)
+            return
+
+        width = int(rect.width())
+        points = [
+            (name, color, *self.visible_points(x, y, width))
+            for name, x, y, color in self.series
+        ]
+        y_max = max((float(ys.max()) for _n, _c, _x, ys in points if len(ys)), default=0.0)
+        y_max = y_max * 1.1 if y_max > 0 else 1.0
+        x0, x1 = self._view
+        x_scale = rect.width() / (x1 - x0)
+        y_scale = rect.height() / y_max
+
+        # Grid and axis labels
+        painter.setPen(QPen(GRID, 1))
+        for i in range(5):
+            gy = rect.bottom() - rect.height() * i / 4
+            painter.drawLine(QPointF(rect.left(), gy), QPointF(rect.right(), gy))
+            painter.setPen(MUTED)
+            painter.drawText(
+                QRectF(0, gy - 8, MARGINS[0] - 6, 16),
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                f"{y_max * i / 4:.1f}" if y_max < 10 else f"{y_max * i / 4:.0f}",
+            )
+            painter.setPen(QPen(GRID, 1))
+        span = x1 - x0
+        for i in range(5):
+            gx = rect.left() + rect.width() * i / 4
+            painter.setPen(MUTED)
+            painter.drawText(
+                QRectF(gx - 60, rect.bottom() + 6, 120, 16),
+                Qt.AlignmentFlag.AlignCenter,
+                _format_time(x0 + span * i / 4, span),
+            )
+        if self.y_label:
+            painter.drawText(QRectF(rect.left(), 4, rect.width(), 20), Qt.AlignmentFlag.AlignLeft, self.y_label)
+
+        # Series
+        painter.setClipRect(rect)
+        for name, color, xs, ys in points:
+            px = rect.left() + (xs - x0) * x_scale
+            py = rect.bottom() - ys * y_scale
+            painter.setPen(QPen(color, 1.5))
+            painter.drawPolyline(QPolygonF([QPointF(a, b) for a, b in zip(px.tolist(), py.tolist())]))
+        painter.setClipping(False)
+
+        # Legend
+        lx = rect.right()
+        for name, color, _xs, _ys in reversed(points):
+            text_width = painter.fontMetrics().horizontalAdvance(name)
+            lx -= text_width + 28
+            painter.fillRect(QRectF(lx, 10, 12, 4), color)
+            painter.setPen(TEXT)
+            painter.drawText(QPointF(lx + 16, 16), name)
+
+    def wheelEvent(self, event):
+        if self._view is None:
+            return
+        rect = self.plot_rect()
+        x0, x1 = self._view
+        # Zoom around the pointer
+        anchor = x0 + (event.position().x() - rect.left()) / rect.width() * (x1 - x0)
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        span = min(max((x1 - x0) * factor, MIN_SPAN), self._extent[1] - self._extent[0])
+        ratio = (anchor - x0) / (x1 - x0)
+        self._set_view(anchor - ratio * span, span)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_x = event.position().x()
+
+    def mouseMoveEvent(self, event):
+        if self._drag_x is None or self._view is None:
+            return
+        x0, x1 = self._view
+        dx = (event.position().x() - self._drag_x) / self.plot_rect().width() * (x1 - x0)
+        self._drag_x = event.position().x()
+        self._set_view(x0 - dx, x1 - x0)
+
+    def mouseReleaseEvent(self, event):
+        self._drag_x = None
+
+    def mouseDoubleClickEvent(self, event):
+        self._view = self._extent
+        self.update()
+
+    def _set_view(self, start, span):
+        lo, hi = self._extent
+        start = min(max(start, lo), hi - span)
+        self._view = (start, start + span)
+        self.update()
@@ -0,0 +1,116 @@
+"""
+Item delegates shared by the table views.
+
+``ButtonDelegate`` paints a push button inside a table cell and reports
+clicks through a signal. Unlike ``setIndexWidget``/``setCellWidget`` it
+creates no widget per row, so a column of actions costs the same for a
+chain of ten logs as for a chain of ten thousand.
+"""
+
+from PyQt6.QtCore import Qt, QEvent, QModelIndex, QPersistentModelIndex, QRectF, pyqtSignal
+from PyQt6.QtGui import QColor, QFontMetrics, QPainter, QPen
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+# Colours matching ``styles.get_button_style``
+BUTTON_BACKGROUND = QColor("#1a1a1a")
+BUTTON_HOVER = QColor("#262626")
+BUTTON_PRESSED = QColor("#333333")
+BUTTON_BORDER = QColor("#333333")
+BUTTON_HOVER_BORDER = QColor("#4a4a4a")
+BUTTON_TEXT = QColor("#e0e0e0")
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paint a clickable button in every cell of a column.
+
+    Parameters
+    ----------
+    text: str
+        The button label.
+    font: QFont or None
+        Font for the label; the view's font when ``None``.
+    margin: int
+        Gap in pixels between the cell edge and the button.
+
+    The owning view should have mouse tracking enabled for the hover
+    highlight to follow the pointer.
+    """
+
+    clicked = pyqtSignal(QModelIndex)
+
+    def __init__(self, text, font=None, margin=4, parent=None):
+        super().__init__(parent)
+        self.text = text
+        self.font = font
+        self.margin = margin
+        self._hovered = QPersistentModelIndex()
+        self._pressed = QPersistentModelIndex()
+
+    def _button_rect(self, option):
+        return QRectF(option.rect.adjusted(self.margin, self.margin, -self.margin, -self.margin))
+
+    def paint(self, painter, option, index):
+        # Paint the cell's selection/alternating background only
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if self._pressed == QPersistentModelIndex(index):
+            background, border = BUTTON_PRESSED, BUTTON_HOVER_BORDER
+        elif self._hovered == QPersistentModelIndex(index):
+            background, border = BUTTON_HOVER, BUTTON_HOVER_BORDER
+        else:
+            background, border = BUTTON_BACKGROUND, BUTTON_BORDER
+        rect = self._button_rect(option)
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setPen(BUTTON_TEXT)
+        painter.setFont(self.font or option.font)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.text)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        metrics = QFontMetrics(self.font) if self.font is not None else option.fontMetrics
+        size.setWidth(metrics.horizontalAdvance(self.text) + 32 + 2 * self.margin)
+        return size
+
+    def editorEvent(self, event, model, option, index):
+        kind = event.type()
+        view = self.parent()
+        if kind == QEvent.Type.MouseMove:
+            inside = self._button_rect(option).contains(event.position())
+            target = QPersistentModelIndex(index) if inside else QPersistentModelIndex()
+            if target != self._hovered:
+                previous = QModelIndex(self._hovered)
+                self._hovered = target
+                self._update(view, previous, index)
+            return False
+        if kind == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+            if self._button_rect(option).contains(event.position()):
+                self._pressed = QPersistentModelIndex(index)
+                self._update(view, index)
+                return True
+            return False
+        if kind == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            pressed = QModelIndex(self._pressed)
+            self._pressed = QPersistentModelIndex()
+            self._update(view, pressed)
+            if pressed.isValid() and pressed == index and self._button_rect(option).contains(event.position()):
+                self.clicked.emit(QModelIndex(index))
+                return True
+            return False
+        return super().editorEvent(event, model, option, index)
+
+    @staticmethod
+    def _update(view, *indexes):
+        if view is None or not hasattr(view, "viewport"):
+            return
+        for index in indexes:
+            if index is not None and index.isValid():
+                view.viewport().update(view.visualRect(index))
@@ -1,16 +1,19 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QTabWidget,
     QFileDialog, QLineEdit, QTextEdit, QMessageBox, QMainWindow,
-    QStatusBar, QComboBox, QTableWidget, QTableWidgetItem,
+    QStatusBar, QComboBox, QTableView,
     QSplitter, QHeaderView, QHBoxLayout
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QFont, QShortcut, QKeySequence
 from ui.help_utils import HelpButton, get_help_training_id
-from msg_parser import parse_msg
+from msg_parser import parse_msg_in_thread
 from database import insert_email_log
 from datetime import datetime
 from log_manager import log_manager
+from ui.search_controller import SearchController
+from ui.recent_logs import recent_logs_model, RecentLogsFilter
+from ui.task_runner import task_runner, install_busy_indicator, Priority
 from app_settings import app_settings
 from config import SITE_CODES as DEFAULT_SITE_CODES
 
@@ -95,7 +98,7 @@ class EmailPanel(QMainWindow):
         super().__init__()
         self.setWindowTitle("Email Log Entry")
         self.setMinimumSize(800, 700)
-        self.showMaximized()
+        self.setWindowState(Qt.WindowState.WindowMaximized)
         
         self.current_tab = "Data Request"
         self.msg_path = None
@@ -105,6 +108,7 @@ class EmailPanel(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready to log email")
+        self.busy_indicator = install_busy_indicator(self)
 
         self.init_ui()
         self.setup_shortcuts()
@@ -248,7 +252,6 @@ class EmailPanel(QMainWindow):
         controls_layout.addWidget(QLabel("Filter:"))
         self.log_filter = QLineEdit()
         self.log_filter.setPlaceholderText("Search logs...")
-        self.log_filter.textChanged.connect(self.filter_logs)
         self.log_filter.setStyleSheet("""
             QLineEdit {
                 padding: 8px;
@@ -261,6 +264,13 @@ class EmailPanel(QMainWindow):
         """)
         controls_layout.addWidget(self.log_filter)
         
+        # Search off the GUI thread once typing pauses
+        self.search_controller = SearchController(self.log_filter, self.search_logs, parent=self)
+        self.search_controller.results_ready.connect(self.filter_logs)
+        self.search_controller.search_failed.connect(
+            lambda _query, error: self.status_bar.showMessage(f"Error searching logs: {error}")
+        )
+        
         controls_layout.addStretch()
         
         # Refresh button
@@ -302,18 +312,23 @@ class EmailPanel(QMainWindow):
         log_layout.addLayout(controls_layout)
         
         # Table for logs
-        self.log_table = QTableWidget()
+        # Newest logs, shared with every other panel showing email logs
+        self.log_model = recent_logs_model("email_logs")
+        self.log_proxy = RecentLogsFilter(self)
+        self.log_proxy.setSourceModel(self.log_model)
+        self.log_table = QTableView()
+        self.log_table.setModel(self.log_proxy)
         self.log_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #141414;
                 color: #e0e0e0;
                 gridline-color: #262626;
                 alternate-background-color: #1a1a1a;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #333333;
             }
             QHeaderView::section {
@@ -326,7 +341,7 @@ class EmailPanel(QMainWindow):
         """)
         self.log_table.setAlternatingRowColors(True)
         self.log_table.horizontalHeader().setStretchLastSection(True)
-        self.log_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.log_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         log_layout.addWidget(self.log_table)
         
         log_widget.setLayout(log_layout)
@@ -338,67 +353,27 @@ class EmailPanel(QMainWindow):
         main_layout.addWidget(self.main_tabs)
         central_widget.setLayout(main_layout)
         
-        # Load initial logs
-        self.load_recent_logs()
+        # The shared model is already loaded; fit the columns to it
+        self.log_table.resizeColumnsToContents()
 
     def load_recent_logs(self):
-        """Load recent email logs into the table"""
-        try:
-            df = log_manager.get_recent_logs('email', limit=50)
-            self.current_df = df  # Store for filtering
-            if not df.empty:
-                self.log_table.setRowCount(len(df))
-                self.log_table.setColumnCount(len(df.columns))
-                self.log_table.setHorizontalHeaderLabels(df.columns.tolist())
-                
-                for row in range(len(df)):
-                    for col in range(len(df.columns)):
-                        value = str(df.iloc[row, col])
-                        item = QTableWidgetItem(value)
-                        self.log_table.setItem(row, col, item)
-                
-                # Adjust column widths
-                self.log_table.resizeColumnsToContents()
-                
-                # Update status
-                self.status_bar.showMessage(f"Loaded {len(df)} email log entries")
-            else:
-                self.log_table.setRowCount(0)
-                self.log_table.setColumnCount(5)
-                self.log_table.setHorizontalHeaderLabels(["Date", "Time", "From", "Subject", "Category"])
-                self.status_bar.showMessage("No email logs found")
-        except Exception as e:
-            print(f"Error loading logs: {e}")
-            self.status_bar.showMessage("Error loading logs")
+        """Reload the recent email logs from the database"""
+        self.log_model.reload()
+        self.log_table.resizeColumnsToContents()
+        self.status_bar.showMessage(f"Loaded {self.log_model.rowCount()} email log entries")
     
-    def filter_logs(self):
-        """Filter logs based on search text"""
-        if not hasattr(self, 'current_df') or self.current_df.empty:
-            return
-        
-        search_text = self.log_filter.text().lower()
-        if not search_text:
-            # Show all if no filter
-            self.load_recent_logs()
-            return
-        
-        # Filter dataframe
-        filtered_df = self.current_df[
-            self.current_df.apply(
-                lambda row: any(search_text in str(cell).lower() for cell in row),
-                axis=1
+    def search_logs(self, search_text):
+        """Filter the loaded logs; runs on the search worker thread"""
+        # Every search term must match
+        return self.log_model.search(search_text)
+    
+    def filter_logs(self, search_text, log_ids):
+        """Show the result of the latest search"""
+        self.log_proxy.set_ids(log_ids)
+        if log_ids is not None:
+            self.status_bar.showMessage(
+                f"Showing {self.log_proxy.rowCount()} of {self.log_model.rowCount()} entries"
             )
-        ]
-        
-        # Update table
-        self.log_table.setRowCount(len(filtered_df))
-        for row in range(len(filtered_df)):
-            for col in range(len(filtered_df.columns)):
-                value = str(filtered_df.iloc[row, col])
-                item = QTableWidgetItem(value)
-                self.log_table.setItem(row, col, item)
-        
-        self.status_bar.showMessage(f"Showing {len(filtered_df)} of {len(self.current_df)} entries")
     
     def export_logs(self):
         """Export logs to file"""
@@ -409,12 +384,8 @@ class EmailPanel(QMainWindow):
         )
         if file_path:
             try:
-                if hasattr(self, 'current_df'):
-                    if file_path.endswith('.csv'):
-                        self.current_df.to_csv(file_path, index=False)
-                    else:
-                        self.current_df.to_excel(file_path, index=False)
-                    QMessageBox.information(self, "Success", f"Logs exported to {file_path}")
+                self.log_model.export(file_path)
+                QMessageBox.information(self, "Success", f"Logs exported to {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
     
@@ -425,6 +396,19 @@ class EmailPanel(QMainWindow):
         QShortcut(QKeySequence("Escape"), self, self.close)
         QShortcut(QKeySequence("F5"), self, self.load_recent_logs)
 
+    def reset_form(self):
+        """Forget the last email when the panel is reopened"""
+        self.msg_path = None
+        self.email_meta = {}
+        self.save_btn.setEnabled(False)
+        if self.tabs.currentIndex() == 0:
+            self.switch_tab(0)
+        else:
+            self.tabs.setCurrentIndex(0)
+        self.log_filter.clear()
+        self.main_tabs.setCurrentIndex(0)
+        self.status_bar.showMessage("Ready to log email")
+
     def switch_tab(self, index):
         self.current_tab = EMAIL_TABS[index]
         self.clear_fields()
@@ -602,10 +586,21 @@ class EmailPanel(QMainWindow):
             self.load_msg_file(path)
 
     def load_msg_file(self, path):
+        # Outlook COM can take seconds to answer, so parse on a worker thread
+        self.msg_path = path
+        self.drop_label.setText(f"⏳ Loading: {path.split('/')[-1]}")
+        self.status_bar.showMessage("Reading email...")
+        task_runner().submit(
+            parse_msg_in_thread, path,
+            owner=self, key="msg", priority=Priority.HIGH,
+            on_result=lambda meta: self.on_msg_parsed(path, meta),
+            on_error=self.on_msg_failed
+        )
+
+    def on_msg_parsed(self, path, meta):
         try:
-            self.msg_path = path
             self.drop_label.setText(f"✅ Loaded: {path.split('/')[-1]}")
-            self.email_meta = parse_msg(path)
+            self.email_meta = meta
             
             # Check if there was an error parsing
             if self.email_meta.get("error", False):
@@ -625,14 +620,17 @@ class EmailPanel(QMainWindow):
                 self.save_btn.setEnabled(True)
                 self.status_bar.showMessage("Email loaded successfully")
         except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to load file: {str(e)}\n\n"
-                "You can use 'Enter Email Info Manually' instead."
-            )
-            self.drop_label.setText("❌ Error loading file - try manual entry")
-            self.status_bar.showMessage("Error loading file")
+            self.on_msg_failed(str(e))
+
+    def on_msg_failed(self, error):
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to load file: {error}\n\n"
+            "You can use 'Enter Email Info Manually' instead."
+        )
+        self.drop_label.setText("❌ Error loading file - try manual entry")
+        self.status_bar.showMessage("Error loading file")
 
     def fill_meta_fields(self):
         # Only fill fields if we have valid data (no error)
@@ -717,8 +715,6 @@ class EmailPanel(QMainWindow):
         
         try:
             log_manager.add_email_log(email_data)
-            # Refresh the log display
-            self.load_recent_logs()
         except Exception as e:
             print(f"Error saving to Excel: {e}")
 
@@ -751,5 +747,4 @@ class EmailPanel(QMainWindow):
                 everbridge_panel.show()
         
         # Switch to logs tab to show the new entry
-        self.main_tabs.setCurrentIndex(1)
-        self.load_recent_logs()
\ No newline at end of file
+        self.main_tabs.setCurrentIndex(1)
\ No newline at end of file
@@ -3,15 +3,22 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QTextEdit, QLineEdit, QInputDialog, QMessageBox,
     QTableWidget, QTableWidgetItem, QSplitter, QGroupBox,
     QComboBox, QDialog, QDialogButtonBox, QListWidgetItem,
-    QMainWindow, QStatusBar, QHeaderView
+    QMainWindow, QStatusBar, QHeaderView, QTableView
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QShortcut, QKeySequence
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QColor, QFont, QShortcut, QKeySequence
+from datetime import datetime, timedelta
 from logic.event_handler import (
-    get_event_chains, get_event_chain_logs, get_log_summary,
-    create_event_chain, load_all_logs, link_log_to_event,
+    get_event_chains, get_event_timeline, prefetch_event_timeline,
+    create_event_chain, get_available_logs, link_logs_to_event,
+    LINK_FILTER_ALL, LINK_FILTER_UNLINKED, LINK_FILTER_NOT_IN_CHAIN,
     update_event_chain
 )
+from logic.correlation import suggest_links
+from ui.table_models import PagedTableModel, list_fetch
+from ui.delegates import ButtonDelegate
+from ui.search_controller import SearchController
+from ui.task_runner import task_runner, Priority
 from database import get_log_details
 import sqlite3
 from database import DB_PATH
@@ -141,12 +148,44 @@ class LogDetailDialog(QDialog):
         
         self.setLayout(layout)
 
+# Rows fetched per page of the Available Logs and timeline tables
+AVAILABLE_LOGS_PAGE_SIZE = 200
+TIMELINE_PAGE_SIZE = 100
+
+# Colour of the Type column for each log table
+LOG_TYPE_COLORS = {
+    "email_logs": QColor(Qt.GlobalColor.blue),
+    "phone_logs": QColor(Qt.GlobalColor.darkGreen),
+    "radio_logs": QColor(Qt.GlobalColor.darkYellow),
+    "everbridge_logs": QColor(Qt.GlobalColor.red),
+}
+
+# Link state choices for the Available Logs table
+LINK_MODES = [
+    ("Not in any chain", LINK_FILTER_UNLINKED),
+    ("Not in this chain", LINK_FILTER_NOT_IN_CHAIN),
+    ("All logs", LINK_FILTER_ALL),
+]
+
+# Time window choices for the Available Logs table
+TIME_WINDOWS = [
+    ("Last 24 hours", timedelta(days=1)),
+    ("Last 7 days", timedelta(days=7)),
+    ("Last 30 days", timedelta(days=30)),
+    ("All time", None),
+]
+
+# Idle time before neighboring chain timelines are prefetched (ms)
+PREFETCH_IDLE_MS = 800
+# Number of chains above and below the selection to prefetch
+PREFETCH_NEIGHBORS = 2
+
 class EventManager(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Event Chain Manager")
         self.setMinimumSize(1400, 800)
-        self.showMaximized()
+        self.setWindowState(Qt.WindowState.WindowMaximized)
         self.current_event_id = None
         
         # Status bar
@@ -154,6 +193,13 @@ class EventManager(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready to manage event chains")
         
+        # Prefetch neighboring timelines once the operator pauses, one
+        # chain at a time on the task runner behind interactive work
+        self.prefetch_queue = []
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.timeout.connect(self.prefetch_next_timeline)
+        
         self.init_ui()
         self.setup_shortcuts()
 
@@ -244,16 +290,29 @@ class EventManager(QMainWindow):
         self.timeline_label.setFont(Fonts.SUBTITLE)
         middle_panel.addWidget(self.timeline_label)
         
-        # Timeline table for better display
-        self.timeline_table = QTableWidget()
+        # Timeline table, filled page by page from the cached timeline
+        self.timeline_model = PagedTableModel(
+            [("Time", "timestamp"), ("Type", "source"), ("Summary", "summary"), ("Actions", None)],
+            page_size=TIMELINE_PAGE_SIZE,
+            fonts={0: QFont("Arial", 12), 1: Fonts.LABEL},
+            foreground=lambda log, column: LOG_TYPE_COLORS.get(log.table) if column == 1 else None,
+            parent=self,
+        )
+        self.timeline_table = QTableView()
+        self.timeline_table.setModel(self.timeline_model)
         self.timeline_table.setFont(Fonts.NORMAL)
         self.timeline_table.setStyleSheet(TABLE_STYLE)
-        self.timeline_table.setColumnCount(4)
-        self.timeline_table.setHorizontalHeaderLabels([
-            "Time", "Type", "Summary", "Actions"
-        ])
+        self.timeline_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.timeline_table.setAlternatingRowColors(True)
         self.timeline_table.verticalHeader().setVisible(False)
+        self.timeline_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.timeline_table.verticalHeader().setDefaultSectionSize(45)
+        
+        # The View action is painted by a delegate rather than a widget per row
+        self.timeline_table.setMouseTracking(True)
+        self.view_delegate = ButtonDelegate("👁️ View", Fonts.BUTTON, parent=self.timeline_table)
+        self.view_delegate.clicked.connect(self.on_timeline_view_clicked)
+        self.timeline_table.setItemDelegateForColumn(3, self.view_delegate)
         
         # Set column widths
         header = self.timeline_table.horizontalHeader()
@@ -263,6 +322,40 @@ class EventManager(QMainWindow):
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
         
         middle_panel.addWidget(self.timeline_table)
+        
+        # Suggested logs from the correlation engine
+        suggestions_label = QLabel("💡 Suggested Logs")
+        suggestions_label.setFont(Fonts.SUBTITLE)
+        middle_panel.addWidget(suggestions_label)
+        
+        self.suggestions_table = QTableWidget()
+        self.suggestions_table.setFont(Fonts.NORMAL)
+        self.suggestions_table.setStyleSheet(TABLE_STYLE)
+        self.suggestions_table.setColumnCount(4)
+        self.suggestions_table.setHorizontalHeaderLabels([
+            "Time", "Type", "Summary", "Why"
+        ])
+        self.suggestions_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.suggestions_table.setAlternatingRowColors(True)
+        self.suggestions_table.verticalHeader().setVisible(False)
+        self.suggestions_table.setMaximumHeight(220)
+        self.suggestions_table.doubleClicked.connect(self.attach_selected_suggestion)
+        
+        header = self.suggestions_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        
+        middle_panel.addWidget(self.suggestions_table)
+        
+        self.add_suggestion_btn = QPushButton("➕ Add Suggested Log")
+        self.add_suggestion_btn.setFont(Fonts.BUTTON)
+        self.add_suggestion_btn.setStyleSheet(get_button_style(Colors.SUCCESS, 45))
+        self.add_suggestion_btn.clicked.connect(self.attach_selected_suggestion)
+        make_accessible(self.add_suggestion_btn, "Add the selected suggestion to the current event chain")
+        middle_panel.addWidget(self.add_suggestion_btn)
+        
         middle_widget.setLayout(middle_panel)
         
         # Right Panel: Available Logs
@@ -282,40 +375,82 @@ class EventManager(QMainWindow):
         self.log_type_filter.addItems(["All", "Email", "Phone", "Radio", "Everbridge"])
         self.log_type_filter.currentTextChanged.connect(self.filter_logs)
         filter_layout.addWidget(self.log_type_filter)
+        
+        filter_layout.addWidget(QLabel("Show:"))
+        self.link_mode_filter = QComboBox()
+        self.link_mode_filter.setFont(Fonts.NORMAL)
+        self.link_mode_filter.setStyleSheet(DROPDOWN_STYLE)
+        for label, mode in LINK_MODES:
+            self.link_mode_filter.addItem(label, mode)
+        self.link_mode_filter.currentIndexChanged.connect(self.filter_logs)
+        filter_layout.addWidget(self.link_mode_filter)
+        
+        filter_layout.addWidget(QLabel("When:"))
+        self.time_window_filter = QComboBox()
+        self.time_window_filter.setFont(Fonts.NORMAL)
+        self.time_window_filter.setStyleSheet(DROPDOWN_STYLE)
+        for label, window in TIME_WINDOWS:
+            self.time_window_filter.addItem(label, window)
+        self.time_window_filter.setCurrentIndex(1)
+        self.time_window_filter.currentIndexChanged.connect(self.filter_logs)
+        filter_layout.addWidget(self.time_window_filter)
         filter_layout.addStretch()
         
         filter_group.setLayout(filter_layout)
         right_panel.addWidget(filter_group)
         
+        self.log_search = QLineEdit()
+        self.log_search.setFont(Fonts.NORMAL)
+        self.log_search.setStyleSheet(INPUT_STYLE)
+        self.log_search.setPlaceholderText("Search available logs...")
+        right_panel.addWidget(self.log_search)
+        
+        # Query the first page off the GUI thread once typing pauses
+        self.search_controller = SearchController(
+            self.log_search, self.search_available_logs, parent=self
+        )
+        self.search_controller.results_ready.connect(self.show_available_logs)
+        self.search_controller.search_failed.connect(
+            lambda _query, error: self.status_bar.showMessage(f"Error searching logs: {error}")
+        )
+        
         logs_label = QLabel("📝 Available Logs")
         logs_label.setFont(Fonts.SUBTITLE)
         right_panel.addWidget(logs_label)
         
-        # Available logs table
-        self.available_logs_table = QTableWidget()
+        # Available logs table; further pages are fetched as it scrolls
+        self.available_logs_model = PagedTableModel(
+            [("Time", "timestamp"), ("Type", "source"), ("Summary", "summary")],
+            page_size=AVAILABLE_LOGS_PAGE_SIZE,
+            fonts={0: QFont("Arial", 12), 1: Fonts.LABEL},
+            parent=self,
+        )
+        self.available_logs_table = QTableView()
+        self.available_logs_table.setModel(self.available_logs_model)
         self.available_logs_table.setFont(Fonts.NORMAL)
         self.available_logs_table.setStyleSheet(TABLE_STYLE)
-        self.available_logs_table.setColumnCount(3)
-        self.available_logs_table.setHorizontalHeaderLabels([
-            "Time", "Type", "Summary"
-        ])
-        self.available_logs_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.available_logs_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.available_logs_table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
         self.available_logs_table.setAlternatingRowColors(True)
+        self.available_logs_table.setWordWrap(False)
         self.available_logs_table.verticalHeader().setVisible(False)
+        self.available_logs_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
-        # Set column widths
+        # Set column widths; fixed widths avoid measuring every fetched row
         header = self.available_logs_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        self.available_logs_table.setColumnWidth(0, 190)
+        self.available_logs_table.setColumnWidth(1, 110)
         
         right_panel.addWidget(self.available_logs_table)
         
-        self.attach_btn = QPushButton("⬅️ Add Selected Log to Event Chain")
+        self.attach_btn = QPushButton("⬅️ Add Selected Logs to Event Chain")
         self.attach_btn.setFont(Fonts.BUTTON)
         self.attach_btn.setStyleSheet(get_button_style(Colors.PRIMARY, 50))
         self.attach_btn.clicked.connect(self.attach_selected_log)
-        make_accessible(self.attach_btn, "Add the selected log to the current event chain")
+        make_accessible(self.attach_btn, "Add the selected logs to the current event chain")
         right_panel.addWidget(self.attach_btn)
         
         right_widget.setLayout(right_panel)
@@ -339,20 +474,19 @@ class EventManager(QMainWindow):
         QShortcut(QKeySequence("F5"), self, self.refresh_events)
         QShortcut(QKeySequence("Ctrl+L"), self, self.attach_selected_log)
 
+    def reset_form(self):
+        """Show current chains when the panel is reopened"""
+        self.refresh_events()
+
     def refresh_events(self):
         self.event_list.clear()
         chains = get_event_chains()
         
         for chain in chains:
-            # Get log count for this chain
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            c.execute("SELECT COUNT(*) FROM event_links WHERE event_id = ?", (chain['id'],))
-            log_count = c.fetchone()[0]
-            conn.close()
+            log_count = chain.link_count
             
             # Create list item with icon
-            item_text = f"[ID: {chain['id']}] {chain['title']} ({log_count} logs)"
+            item_text = f"[ID: {chain.id}] {chain.title} ({log_count} logs)"
             item = QListWidgetItem(item_text)
             item.setData(Qt.ItemDataRole.UserRole, chain)
             
@@ -373,168 +507,203 @@ class EventManager(QMainWindow):
             return
         
         chain = selected_item.data(Qt.ItemDataRole.UserRole)
-        self.current_event_id = chain['id']
+        chain_changed = chain.id != self.current_event_id
+        self.current_event_id = chain.id
         self.edit_btn.setEnabled(True)
         
         # Update timeline label
-        self.timeline_label.setText(f"📅 Event Timeline: {chain['title']}")
+        self.timeline_label.setText(f"📅 Event Timeline: {chain.title}")
+        
+        # The "not in this chain" view depends on the selected chain
+        if chain_changed and self.link_mode_filter.currentData() == LINK_FILTER_NOT_IN_CHAIN:
+            self.refresh_available_logs()
         
         # Load timeline
-        logs = get_event_chain_logs(self.current_event_id)
+        logs = get_event_timeline(self.current_event_id)
+        self.timeline_model.set_fetch(list_fetch(logs))
         
-        self.timeline_table.setRowCount(0)
-        for entry in logs:
-            table, source_id, timestamp = entry
-            
-            # Get detailed info
-            details = get_log_details(table, source_id)
-            if details:
-                row = self.timeline_table.rowCount()
-                self.timeline_table.insertRow(row)
-                
-                # Time
-                time_item = QTableWidgetItem(timestamp)
-                time_item.setFont(QFont("Arial", 12))
-                self.timeline_table.setItem(row, 0, time_item)
-                
-                # Type with color
-                log_type = table.replace("_logs", "").title()
-                type_item = QTableWidgetItem(log_type)
-                type_item.setFont(Fonts.LABEL)
-                
-                # Color code by type
-                if "email" in table:
-                    type_item.setForeground(Qt.GlobalColor.blue)
-                elif "phone" in table:
-                    type_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif "radio" in table:
-                    type_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif "everbridge" in table:
-                    type_item.setForeground(Qt.GlobalColor.red)
-                
-                self.timeline_table.setItem(row, 1, type_item)
-                
-                # Summary
-                summary = self.create_log_summary(table, details)
-                summary_item = QTableWidgetItem(summary)
-                self.timeline_table.setItem(row, 2, summary_item)
-                
-                # Actions button
-                view_btn = QPushButton("👁️ View")
-                view_btn.setFont(Fonts.BUTTON)
-                view_btn.setStyleSheet(get_button_style(Colors.INFO, 35))
-                view_btn.clicked.connect(lambda checked, t=table, i=source_id: self.view_log_details(t, i))
-                self.timeline_table.setCellWidget(row, 3, view_btn)
-        
-        self.timeline_table.resizeRowsToContents()
+        self.load_suggestions()
         self.status_bar.showMessage(f"Loaded {len(logs)} logs in timeline")
+        self.schedule_prefetch()
 
-    def create_log_summary(self, table, details):
-        """Create a meaningful summary based on log type"""
-        if table == "email_logs":
-            return f"{details.get('log_type', 'Email')}: {details.get('subject', 'No subject')} from {details.get('sender', 'Unknown')}"
-        elif table == "phone_logs":
-            caller = details.get('caller_name', 'Unknown caller')
-            call_type = details.get('call_type', 'Phone')
-            if call_type == "Facilities" and details.get('issue_type'):
-                return f"{call_type}: {caller} - {details['issue_type']}/{details.get('issue_subtype', '')}"
-            elif details.get('site_code'):
-                return f"{call_type}: {caller} - Site {details['site_code']}"
-            else:
-                return f"{call_type}: {caller}"
-        elif table == "radio_logs":
-            return f"Radio: {details.get('unit', 'Unknown')} to {details.get('location', 'Unknown')} - {details.get('reason', '')}"
-        elif table == "everbridge_logs":
-            return f"Everbridge: Site {details.get('site_code', 'Unknown')} - {details.get('message', '')[:50]}..."
-        else:
-            return f"{table} #{details.get('id', '')}"
-
-    def refresh_available_logs(self):
-        all_logs = load_all_logs()
-        self.all_logs_cache = all_logs  # Cache for filtering
-        self.populate_logs_table(all_logs)
-
-    def populate_logs_table(self, logs):
-        self.available_logs_table.setRowCount(0)
-        
-        for log in logs:
-            # Get detailed info
-            details = get_log_details(log['table'], log['id'])
-            if details:
-                row = self.available_logs_table.rowCount()
-                self.available_logs_table.insertRow(row)
-                
-                # Time
-                time_item = QTableWidgetItem(log['timestamp'])
-                time_item.setFont(QFont("Arial", 12))
-                self.available_logs_table.setItem(row, 0, time_item)
-                
-                # Type
-                log_type = log['source']
-                type_item = QTableWidgetItem(log_type)
-                type_item.setFont(Fonts.LABEL)
-                self.available_logs_table.setItem(row, 1, type_item)
-                
-                # Summary
-                summary = self.create_log_summary(log['table'], details)
-                summary_item = QTableWidgetItem(summary)
-                self.available_logs_table.setItem(row, 2, summary_item)
-                
-                # Store log info in row
-                self.available_logs_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, log)
-        
-        self.available_logs_table.resizeRowsToContents()
+    def on_timeline_view_clicked(self, index):
+        log = self.timeline_model.row_data(index.row())
+        self.view_log_details(log.table, log.id)
 
-    def filter_logs(self):
-        if not hasattr(self, 'all_logs_cache'):
+    def load_suggestions(self):
+        """Correlate logs for the current chain on a worker thread"""
+        self.suggestions_table.setRowCount(0)
+        if not self.current_event_id:
+            task_runner().cancel(self, "suggestions")
             return
         
-        log_type = self.log_type_filter.currentText()
-        
-        filtered_logs = []
-        for log in self.all_logs_cache:
-            if log_type != "All" and log['source'] != log_type:
-                continue
-            filtered_logs.append(log)
+        # A newer selection cancels the previous correlation
+        event_id = self.current_event_id
+        task_runner().submit(
+            suggest_links, event_id,
+            owner=self, key="suggestions",
+            on_result=lambda suggestions: self.show_suggestions(event_id, suggestions),
+            on_error=lambda error: self.status_bar.showMessage(f"Error loading suggestions: {error}"),
+        )
+
+    def show_suggestions(self, event_id, suggestions):
+        """Show correlated logs for a chain, best match first"""
+        if event_id != self.current_event_id:
+            return
+        self.suggestions_table.setRowCount(0)
+        for suggestion in suggestions:
+            row = self.suggestions_table.rowCount()
+            self.suggestions_table.insertRow(row)
+            
+            time_item = QTableWidgetItem(suggestion['timestamp'])
+            time_item.setData(Qt.ItemDataRole.UserRole, suggestion)
+            time_item.setToolTip(f"Score: {suggestion['score']:.2f}")
+            self.suggestions_table.setItem(row, 0, time_item)
+            
+            type_item = QTableWidgetItem(suggestion['source'])
+            type_item.setFont(Fonts.LABEL)
+            self.suggestions_table.setItem(row, 1, type_item)
+            
+            self.suggestions_table.setItem(row, 2, QTableWidgetItem(suggestion['summary']))
+            self.suggestions_table.setItem(row, 3, QTableWidgetItem(", ".join(suggestion['reasons'])))
         
-        self.populate_logs_table(filtered_logs)
-        self.status_bar.showMessage(f"Showing {len(filtered_logs)} {log_type} logs")
+        self.suggestions_table.resizeRowsToContents()
 
-    def attach_selected_log(self):
+    def attach_selected_suggestion(self):
         if not self.current_event_id:
             show_error(self, "Please select an event chain first")
             return
         
-        selected_row = self.available_logs_table.currentRow()
+        selected_row = self.suggestions_table.currentRow()
         if selected_row < 0:
-            show_error(self, "Please select a log to attach")
+            show_error(self, "Please select a suggested log to add")
             return
         
-        # Get log info from selected row
-        log = self.available_logs_table.item(selected_row, 0).data(Qt.ItemDataRole.UserRole)
+        log = self.suggestions_table.item(selected_row, 0).data(Qt.ItemDataRole.UserRole)
+        added = link_logs_to_event(
+            self.current_event_id, [(log['table'], log['id'], log['timestamp'])]
+        )
         
-        # Check if already linked
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute("""
-            SELECT COUNT(*) FROM event_links 
-            WHERE event_id = ? AND source_table = ? AND source_id = ?
-        """, (self.current_event_id, log['table'], log['id']))
-        
-        if c.fetchone()[0] > 0:
-            conn.close()
-            show_error(self, "This log is already part of the event chain")
+        self.on_logs_linked(added)
+        self.status_bar.showMessage(f"Added suggested {log['source']} log to event chain")
+
+    def schedule_prefetch(self):
+        """Queue the chains around the selection for idle prefetching"""
+        current = self.event_list.currentRow()
+        self.prefetch_queue = []
+        for offset in range(1, PREFETCH_NEIGHBORS + 1):
+            for row in (current + offset, current - offset):
+                item = self.event_list.item(row) if row >= 0 else None
+                if item is not None:
+                    self.prefetch_queue.append(item.data(Qt.ItemDataRole.UserRole).id)
+        task_runner().cancel(self, "prefetch")
+        self.prefetch_timer.start(PREFETCH_IDLE_MS)
+
+    def prefetch_next_timeline(self):
+        """Warm the next queued timeline on the task runner, one at a time"""
+        if not self.prefetch_queue:
+            return
+        task_runner().submit(
+            prefetch_event_timeline, self.prefetch_queue.pop(0),
+            owner=self, key="prefetch", priority=Priority.LOW,
+            on_result=lambda _queried: self.prefetch_next_timeline()
+        )
+
+    def available_logs_filters(self):
+        """Snapshot the Available Logs filters as get_available_logs arguments"""
+        log_type = self.log_type_filter.currentText()
+        window = self.time_window_filter.currentData()
+        return {
+            "sources": [f"{log_type.lower()}_logs"] if log_type != "All" else None,
+            "since": (datetime.now() - window).strftime("%Y-%m-%d %H:%M:%S") if window else None,
+            "link_filter": self.link_mode_filter.currentData(),
+            "event_id": self.current_event_id,
+            "search": self.log_search.text(),
+        }
+
+    def refresh_available_logs(self):
+        """Point the Available Logs table at the current filters.
+        
+        Type, time window, link state and search terms are SQL
+        predicates, so each page the view fetches is already filtered.
+        """
+        self.search_controller.cancel()
+        self.available_logs_query = self.available_logs_filters()
+        self.show_available_logs(self.log_search.text(), None)
+
+    def search_available_logs(self, search_text):
+        """Load the first page for a new search; runs on the search worker thread"""
+        filters = dict(self.available_logs_query, search=search_text)
+        return filters, get_available_logs(limit=AVAILABLE_LOGS_PAGE_SIZE, **filters)
+
+    def show_available_logs(self, search_text, result):
+        """Reset the Available Logs model, reusing a prefetched first page"""
+        if result is None:
+            filters, first_page = self.available_logs_query, None
+        else:
+            filters, first_page = result
+            self.available_logs_query = filters
+        
+        self.available_logs_model.set_fetch(
+            lambda limit, after: get_available_logs(limit=limit, after=after, **filters),
+            first_page=first_page,
+        )
+        shown = self.available_logs_model.rowCount()
+        more = "+" if self.available_logs_model.canFetchMore() else ""
+        self.status_bar.showMessage(f"Showing {shown}{more} {self.log_type_filter.currentText()} logs")
+
+    def filter_logs(self):
+        self.refresh_available_logs()
+
+    def attach_selected_log(self):
+        if not self.current_event_id:
+            show_error(self, "Please select an event chain first")
             return
         
-        conn.close()
+        selected_rows = sorted(
+            index.row() for index in self.available_logs_table.selectionModel().selectedRows()
+        )
+        if not selected_rows:
+            show_error(self, "Please select one or more logs to attach")
+            return
         
-        # Link the log
-        link_log_to_event(self.current_event_id, log['table'], log['id'], log['timestamp'])
+        logs = [self.available_logs_model.row_data(row) for row in selected_rows]
+        added = link_logs_to_event(
+            self.current_event_id,
+            [(log.table, log.id, log.timestamp) for log in logs],
+        )
         
-        show_success(self, "Log successfully added to event chain!")
+        skipped = len(logs) - added
+        if added == 0:
+            show_error(self, "The selected logs are already part of the event chain")
+            return
+        message = f"Added {added} log{'s' if added != 1 else ''} to the event chain"
+        if skipped:
+            message += f" ({skipped} already linked)"
+        
+        # Linked logs no longer match the unlinked views
+        if self.link_mode_filter.currentData() != LINK_FILTER_ALL:
+            self.available_logs_model.remove_rows(selected_rows)
+        self.on_logs_linked(added)
+        show_success(self, message)
+
+    def on_logs_linked(self, added):
+        """Update the views after logs were linked to the current chain.
+        
+        Only the current chain's list entry and timeline change, so they
+        are updated in place instead of reloading every panel.
+        """
+        item = self.event_list.currentItem()
+        if item is not None:
+            chain = item.data(Qt.ItemDataRole.UserRole)
+            chain = chain._replace(link_count=chain.link_count + added)
+            item.setData(Qt.ItemDataRole.UserRole, chain)
+            item.setText(f"[ID: {chain.id}] {chain.title} ({chain.link_count} logs)")
+            if chain.link_count >= 3:
+                item.setBackground(Qt.GlobalColor.transparent)
+            elif chain.link_count > 0:
+                item.setBackground(Qt.GlobalColor.yellow)
         self.load_event_details()
-        self.refresh_available_logs()
-        self.refresh_events()
 
     def view_log_details(self, table, log_id):
         dialog = LogDetailDialog(table, log_id, self)
@@ -560,7 +729,7 @@ class EventManager(QMainWindow):
             # Select the new event
             for i in range(self.event_list.count()):
                 item = self.event_list.item(i)
-                if item.data(Qt.ItemDataRole.UserRole)['id'] == event_id:
+                if item.data(Qt.ItemDataRole.UserRole).id == event_id:
                     self.event_list.setCurrentItem(item)
                     break
             
@@ -585,7 +754,7 @@ class EventManager(QMainWindow):
         # Show edit dialog
         dialog = EventChainEditDialog(
             self.current_event_id, 
-            chain['title'], 
+            chain.title, 
             current_desc,
             self
         )
@@ -2,14 +2,15 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QTextEdit,
     QPushButton, QMessageBox, QMainWindow, QStatusBar,
     QHBoxLayout, QComboBox, QGroupBox,
-    QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView
+    QTabWidget, QTableView, QHeaderView
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QShortcut, QKeySequence
 from datetime import datetime
 from database import insert_everbridge_log
 from log_manager import log_manager
-import pandas as pd
+from ui.search_controller import SearchController
+from ui.recent_logs import recent_logs_model, RecentLogsFilter
 from ui.help_utils import HelpButton, get_help_training_id
 from ui.styles import (
     Fonts, Colors,
@@ -42,7 +43,7 @@ class EverbridgePanel(QMainWindow):
         super().__init__()
         self.setWindowTitle("Everbridge Alert Log Entry")
         self.setMinimumSize(900, 700)
-        self.showMaximized()
+        self.setWindowState(Qt.WindowState.WindowMaximized)
         
         # Status bar - initialize BEFORE init_ui
         self.status_bar = QStatusBar()
@@ -273,7 +274,6 @@ class EverbridgePanel(QMainWindow):
         controls_layout.addWidget(QLabel("Filter:"))
         self.log_filter = QLineEdit()
         self.log_filter.setPlaceholderText("Search logs...")
-        self.log_filter.textChanged.connect(self.filter_logs)
         self.log_filter.setStyleSheet("""
             QLineEdit {
                 padding: 8px;
@@ -286,6 +286,13 @@ class EverbridgePanel(QMainWindow):
         """)
         controls_layout.addWidget(self.log_filter)
         
+        # Search off the GUI thread once typing pauses
+        self.search_controller = SearchController(self.log_filter, self.search_logs, parent=self)
+        self.search_controller.results_ready.connect(self.filter_logs)
+        self.search_controller.search_failed.connect(
+            lambda _query, error: self.status_bar.showMessage(f"Error searching logs: {error}")
+        )
+        
         controls_layout.addStretch()
         
         # Refresh button
@@ -327,18 +334,23 @@ class EverbridgePanel(QMainWindow):
         log_layout.addLayout(controls_layout)
         
         # Table for logs
-        self.log_table = QTableWidget()
+        # Newest logs, shared with every other panel showing Everbridge logs
+        self.log_model = recent_logs_model("everbridge_logs")
+        self.log_proxy = RecentLogsFilter(self)
+        self.log_proxy.setSourceModel(self.log_model)
+        self.log_table = QTableView()
+        self.log_table.setModel(self.log_proxy)
         self.log_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #141414;
                 color: #e0e0e0;
                 gridline-color: #262626;
                 alternate-background-color: #1a1a1a;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #333333;
             }
             QHeaderView::section {
@@ -351,7 +363,7 @@ class EverbridgePanel(QMainWindow):
         """)
         self.log_table.setAlternatingRowColors(True)
         self.log_table.horizontalHeader().setStretchLastSection(True)
-        self.log_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.log_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         log_layout.addWidget(self.log_table)
         
         log_widget.setLayout(log_layout)
@@ -363,8 +375,8 @@ class EverbridgePanel(QMainWindow):
         main_layout.addWidget(self.main_tabs)
         central_widget.setLayout(main_layout)
         
-        # Load initial logs
-        self.load_recent_logs()
+        # The shared model is already loaded; fit the columns to it
+        self.log_table.resizeColumnsToContents()
 
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -374,6 +386,19 @@ class EverbridgePanel(QMainWindow):
         QShortcut(QKeySequence("Ctrl+Shift+C"), self, self.clear_message)
         QShortcut(QKeySequence("F5"), self, self.load_recent_logs)
 
+    def reset_form(self):
+        """Clear the entry form for a new alert when the panel is reopened"""
+        self.site_code_field.setCurrentIndex(0)
+        self.template_dropdown.setCurrentIndex(0)
+        self.message_box.clear()
+        if app_settings.get("auto_timestamp", True):
+            self.timestamp_field.setText(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        else:
+            self.timestamp_field.clear()
+        self.log_filter.clear()
+        self.main_tabs.setCurrentIndex(0)
+        self.status_bar.showMessage("Ready to log Everbridge alert")
+
     def set_current_time(self):
         """Set timestamp to current time"""
         self.timestamp_field.setText(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
@@ -448,8 +473,6 @@ class EverbridgePanel(QMainWindow):
             
             try:
                 log_manager.add_everbridge_log(everbridge_data)
-                # Refresh the log display
-                self.load_recent_logs()
             except Exception as e:
                 print(f"Error saving to Excel: {e}")
             
@@ -479,69 +502,28 @@ class EverbridgePanel(QMainWindow):
             
             # Switch to logs tab to show the new entry
             self.main_tabs.setCurrentIndex(1)
-            self.load_recent_logs()
         except Exception as e:
             show_error(self, f"Error saving log: {str(e)}")
             self.status_bar.showMessage("Error saving log")
     
     def load_recent_logs(self):
-        """Load recent Everbridge logs into the table"""
-        try:
-            df = log_manager.get_recent_logs('everbridge', limit=50)
-            self.current_df = df  # Store for filtering
-            if not df.empty:
-                self.log_table.setRowCount(len(df))
-                self.log_table.setColumnCount(len(df.columns))
-                self.log_table.setHorizontalHeaderLabels(df.columns.tolist())
-                
-                for row in range(len(df)):
-                    for col in range(len(df.columns)):
-                        value = str(df.iloc[row, col])
-                        item = QTableWidgetItem(value)
-                        self.log_table.setItem(row, col, item)
-                
-                # Adjust column widths
-                self.log_table.resizeColumnsToContents()
-                
-                # Update status
-                self.status_bar.showMessage(f"Loaded {len(df)} Everbridge log entries")
-            else:
-                self.log_table.setRowCount(0)
-                self.log_table.setColumnCount(5)
-                self.log_table.setHorizontalHeaderLabels(["Date", "Time", "Alert Type", "Subject", "Message"])
-                self.status_bar.showMessage("No Everbridge logs found")
-        except Exception as e:
-            print(f"Error loading logs: {e}")
-            self.status_bar.showMessage("Error loading logs")
+        """Reload the recent Everbridge logs from the database"""
+        self.log_model.reload()
+        self.log_table.resizeColumnsToContents()
+        self.status_bar.showMessage(f"Loaded {self.log_model.rowCount()} Everbridge log entries")
     
-    def filter_logs(self):
-        """Filter logs based on search text"""
-        if not hasattr(self, 'current_df') or self.current_df.empty:
-            return
-        
-        search_text = self.log_filter.text().lower()
-        if not search_text:
-            # Show all if no filter
-            self.load_recent_logs()
-            return
-        
-        # Filter dataframe
-        filtered_df = self.current_df[
-            self.current_df.apply(
-                lambda row: any(search_text in str(cell).lower() for cell in row),
-                axis=1
+    def search_logs(self, search_text):
+        """Filter the loaded logs; runs on the search worker thread"""
+        # Every search term must match
+        return self.log_model.search(search_text)
+    
+    def filter_logs(self, search_text, log_ids):
+        """Show the result of the latest search"""
+        self.log_proxy.set_ids(log_ids)
+        if log_ids is not None:
+            self.status_bar.showMessage(
+                f"Showing {self.log_proxy.rowCount()} of {self.log_model.rowCount()} entries"
             )
-        ]
-        
-        # Update table
-        self.log_table.setRowCount(len(filtered_df))
-        for row in range(len(filtered_df)):
-            for col in range(len(filtered_df.columns)):
-                value = str(filtered_df.iloc[row, col])
-                item = QTableWidgetItem(value)
-                self.log_table.setItem(row, col, item)
-        
-        self.status_bar.showMessage(f"Showing {len(filtered_df)} of {len(self.current_df)} entries")
     
     def export_logs(self):
         """Export logs to file"""
@@ -552,11 +534,7 @@ class EverbridgePanel(QMainWindow):
         )
         if file_path:
             try:
-                if hasattr(self, 'current_df'):
-                    if file_path.endswith('.csv'):
-                        self.current_df.to_csv(file_path, index=False)
-                    else:
-                        self.current_df.to_excel(file_path, index=False)
-                    QMessageBox.information(self, "Success", f"Logs exported to {file_path}")
+                self.log_model.export(file_path)
+                QMessageBox.information(self, "Success", f"Logs exported to {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
\ No newline at end of file
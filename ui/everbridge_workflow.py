@@ -12,6 +12,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QShortcut, QKeySequence
 from datetime import datetime
 from database import insert_email_log
+from logic.event_handler import event_unit_of_work
 from ui.styles import (
     Fonts, Colors,
     INPUT_STYLE, get_button_style,
@@ -234,16 +235,20 @@ class EverbridgeEmailDialog(QDialog):
                 self.message_text.setFocus()
                 return
             
-            # Save email log entry (as Everbridge Alert type)
-            insert_email_log(
-                log_type="Everbridge Alert",
-                sender=sender,
-                recipient=None,
-                subject=subject,
-                timestamp=timestamp,
-                extra_field=message[:500],  # Store first 500 chars in extra field
-                msg_path="Email"
-            )
+            # Save email log entry (as Everbridge Alert type) and link it
+            # to the workflow's event chain in the same transaction
+            with event_unit_of_work() as uow:
+                log_id = uow.insert_email_log(
+                    log_type="Everbridge Alert",
+                    sender=sender,
+                    recipient=None,
+                    subject=subject,
+                    timestamp=timestamp,
+                    extra_field=message[:500],  # Store first 500 chars in extra field
+                    msg_path="Email"
+                )
+                if self.event_chain_id:
+                    uow.link_log(self.event_chain_id, "email_logs", log_id, timestamp)
             
             # Also save to Excel
             email_data = {
@@ -10,7 +10,6 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QShortcut, QKeySequence
 from datetime import datetime
-from database import insert_phone_log  # We'll track this as a phone log type
 from ui.styles import (
     Fonts, Colors,
     INPUT_STYLE, get_button_style,
@@ -18,7 +17,7 @@ from ui.styles import (
 )
 from app_settings import app_settings
 from log_manager import log_manager
-from logic.event_handler import link_log_to_event
+from logic.event_handler import event_unit_of_work
 import random
 import string
 
@@ -474,31 +473,28 @@ class FacilitiesTicketDialog(QDialog):
                 self.issue_type_field.setFocus()
                 return
             
-            # Save as a phone log entry with type "Facilities Ticket"
-            log_id = insert_phone_log(
-                call_type="Facilities Ticket",
-                caller_name=ticket_data['requestor'],
-                site_code=ticket_data['site_code'],
-                ticket_number=ticket_data['ticket_number'],
-                address=ticket_data['location'],
-                alarm_type=None,
-                issue_type=ticket_data['issue_type'],
-                issue_subtype=ticket_data['issue_subtype'],
-                message=ticket_data['description'],
-                timestamp=ticket_data['timestamp']
-            )
-            
-            # Link to event chain if we have one
-            if self.event_chain_id and log_id:
-                try:
-                    link_log_to_event(
+            # Save as a phone log entry with type "Facilities Ticket" and
+            # link it to the event chain in the same transaction
+            with event_unit_of_work() as uow:
+                log_id = uow.insert_phone_log(
+                    call_type="Facilities Ticket",
+                    caller_name=ticket_data['requestor'],
+                    site_code=ticket_data['site_code'],
+                    ticket_number=ticket_data['ticket_number'],
+                    address=ticket_data['location'],
+                    alarm_type=None,
+                    issue_type=ticket_data['issue_type'],
+                    issue_subtype=ticket_data['issue_subtype'],
+                    message=ticket_data['description'],
+                    timestamp=ticket_data['timestamp']
+                )
+                if self.event_chain_id:
+                    uow.link_log(
                         self.event_chain_id,
                         "phone_logs",
                         log_id,
                         ticket_data['timestamp']
                     )
-                except Exception as e:
-                    print(f"Error linking to event chain: {e}")
             
             # Also save to Excel log
             phone_data = {
@@ -1,21 +1,20 @@
 from PyQt6.QtWidgets import (
     QWidget, QPushButton, QVBoxLayout, QLabel,
-    QMessageBox, QMainWindow, QStatusBar, QMenu
+    QMessageBox, QMainWindow, QStatusBar, QMenu, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QFont, QAction, QShortcut
 from ui.help_utils import HelpButton, get_help_training_id
-from ui.email_ui import EmailPanel
-from ui.phone_ui import PhonePanel
-from ui.radio_ui import RadioPanel
-from ui.everbridge_ui import EverbridgePanel
-from ui.event_manager_ui import EventManager
-from ui.stats_ui import StatsPanel
 from ui.launcher_config import LauncherButton
+from ui.sla_monitor import SlaMonitor
+from ui.panel_registry import PanelRegistry, lazy_panel
 from datetime import datetime
 import json
 
 class HomeWindow(QMainWindow):
+    # Emitted once, after the window has been shown for the first time
+    ready = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Security Operations Logger")
@@ -23,8 +22,8 @@ class HomeWindow(QMainWindow):
         # Set minimum size for 1080p displays
         self.setMinimumSize(800, 600)
         
-        # Start maximized
-        self.showMaximized()
+        # Start maximized once shown
+        self.setWindowState(Qt.WindowState.WindowMaximized)
         
         # Load launcher configurations
         self.launcher_configs = self.load_launcher_configs()
@@ -43,6 +42,36 @@ class HomeWindow(QMainWindow):
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_status)
         self.timer.start(1000)  # Update every second
+        
+        # Watch open event chains for missed response deadlines
+        self.sla_label = QLabel("")
+        self.sla_label.setStyleSheet("color: #F44336; font-weight: bold; padding: 0 10px;")
+        self.status_bar.addPermanentWidget(self.sla_label)
+        self.sla_breaches = 0
+        self.sla_monitor = SlaMonitor(self)
+        self.sla_monitor.breach.connect(self.on_sla_breach)
+
+        # Panels are built once and reused; the most used ones are
+        # built in the background shortly after startup. Their modules
+        # are only imported then, so they don't slow down startup.
+        self.panels = PanelRegistry({
+            "email": lazy_panel("ui.email_ui", "EmailPanel"),
+            "phone": lazy_panel("ui.phone_ui", "PhonePanel"),
+            "radio": lazy_panel("ui.radio_ui", "RadioPanel"),
+            "everbridge": lazy_panel("ui.everbridge_ui", "EverbridgePanel"),
+            "event_manager": lazy_panel("ui.event_manager_ui", "EventManager"),
+            "stats": lazy_panel("ui.stats_ui", "StatsPanel"),
+            "logs": lazy_panel("ui.logs_viewer_ui", "LogsViewerPanel"),
+        }, parent=self)
+        self.panels.prebuild()
+        self._shown = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._shown:
+            self._shown = True
+            # Queued so the first frame is painted before ``ready``
+            QTimer.singleShot(0, self.ready.emit)
 
     def setup_ui(self):
         # Central widget
@@ -309,21 +338,32 @@ class HomeWindow(QMainWindow):
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.status_bar.showMessage(f"Ready | Current Time: {current_time}")
 
+    def on_sla_breach(self, breach):
+        """Flag an event chain that has gone too long without a new log"""
+        self.sla_breaches += 1
+        where = ", ".join(breach["sites"]) or "unknown site"
+        self.sla_label.setText(
+            f"⚠️ SLA: chain #{breach['event_id']} ({where}) has had no update for "
+            f"{breach['threshold_minutes'] + breach['overdue_minutes']:.0f} min"
+            + (f" | {self.sla_breaches} breaches" if self.sla_breaches > 1 else "")
+        )
+        self.sla_label.setToolTip(
+            f"Last log: {breach['last_ts']}\nDeadline: {breach['deadline']} "
+            f"({breach['threshold_minutes']:.0f} min threshold)"
+        )
+        QApplication.alert(self)
+
     def open_email_panel(self):
-        self.email_window = EmailPanel()
-        self.email_window.show()
+        self.panels.open("email")
 
     def open_phone_panel(self):
-        self.phone_window = PhonePanel()
-        self.phone_window.show()
+        self.panels.open("phone")
 
     def open_radio_panel(self):
-        self.radio_window = RadioPanel()
-        self.radio_window.show()
+        self.panels.open("radio")
 
     def open_everbridge_panel(self):
-        self.everbridge_window = EverbridgePanel()
-        self.everbridge_window.show()
+        self.panels.open("everbridge")
     
     def open_facilities_ticket(self):
         from ui.facilities_ticket_ui import FacilitiesTicketDialog
@@ -331,17 +371,13 @@ class HomeWindow(QMainWindow):
         dialog.exec()
 
     def open_event_manager(self):
-        self.event_manager_window = EventManager()
-        self.event_manager_window.show()
+        self.panels.open("event_manager")
 
     def open_stats_panel(self):
-        self.stats_window = StatsPanel()
-        self.stats_window.show()
+        self.panels.open("stats")
     
     def open_logs_panel(self):
-        from ui.logs_viewer_ui import LogsViewerPanel
-        self.logs_window = LogsViewerPanel()
-        self.logs_window.show()
+        self.panels.open("logs")
     
     def open_training_panel(self):
         from ui.training_ui import TrainingPanel
@@ -1,23 +1,70 @@
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTableWidget, QTableWidgetItem, QComboBox,
+    QPushButton, QTableView, QComboBox,
     QFileDialog, QMessageBox, QHeaderView, QTabWidget,
     QGroupBox, QDateEdit, QLineEdit, QGridLayout
 )
-from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtCore import Qt, QDate, QItemSelection, QItemSelectionModel
 from PyQt6.QtGui import QFont, QShortcut, QKeySequence
 from ui.styles import Fonts, get_button_style, TABLE_STYLE, DROPDOWN_STYLE
 from ui.help_utils import HelpButton, get_help_training_id
+from ui.table_models import (
+    DataFrameTableModel, configure_large_table, resize_columns_from_sample
+)
+from ui.search_controller import SearchController
+from ui.task_runner import task_runner, BusyIndicator, Priority
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
 import os
 from datetime import datetime, timedelta
-import pandas as pd
+
+# Pseudo log type that merges every workbook into one view
+ALL_LOGS = "All Logs"
+
+
+def load_workbooks(context, log_files, start=None, end=None):
+    """Parse several log workbooks concurrently in a process pool.
+
+    Runs as a ``TaskRunner`` task. Each workbook is read and normalized
+    in its own worker process, and each result is reported through
+    ``context.progress`` as ``(label, frame, error)`` as soon as that
+    file completes, so the view can fill in progressively instead of
+    waiting for the slowest one.
+
+    Workers are spawned rather than forked: this runs on a worker
+    thread of a multithreaded Qt process, which is unsafe to fork.
+    """
+    from logic.log_loader import read_normalized_workbook
+    workers = max(1, min(len(log_files), os.cpu_count() or 1))
+    pool = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    handled = 0
+    try:
+        pending = {
+            pool.submit(read_normalized_workbook, label, path, start, end): label
+            for label, path in log_files.items()
+        }
+        while pending and not context.token.cancelled:
+            done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in done:
+                label = pending.pop(future)
+                handled += 1
+                percent = 100 * handled // len(log_files)
+                try:
+                    context.progress(percent, label, (label, future.result(), None))
+                except Exception as e:
+                    context.progress(percent, label, (label, None, str(e)))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 class LogsViewerPanel(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Logs Viewer")
         self.setMinimumSize(1200, 800)
-        self.showMaximized()
+        self.setWindowState(Qt.WindowState.WindowMaximized)
         
         # Log types and their file paths
         self.log_types = {
@@ -34,6 +81,10 @@ class LogsViewerPanel(QMainWindow):
         }
         
         self.current_log_data = None
+        self.search_index = None
+        self.loaded_parts = []
+        # True while All Logs parts are still arriving
+        self.streaming = False
         self.init_ui()
         self.setup_shortcuts()
     
@@ -135,6 +186,7 @@ class LogsViewerPanel(QMainWindow):
         
         self.log_combo = QComboBox()
         self.log_combo.addItems(self.log_types.keys())
+        self.log_combo.addItem(ALL_LOGS)
         self.log_combo.setStyleSheet(DROPDOWN_STYLE)
         self.log_combo.currentTextChanged.connect(self.load_log_file)
         layout.addWidget(self.log_combo, 0, 1)
@@ -195,9 +247,15 @@ class LogsViewerPanel(QMainWindow):
                 border: 1px solid #5a5a5a;
             }
         """)
-        self.search_field.textChanged.connect(self.filter_logs)
         layout.addWidget(self.search_field, 1, 1, 1, 2)
         
+        # Search off the GUI thread once typing pauses
+        self.search_controller = SearchController(self.search_field, self.search_logs, parent=self)
+        self.search_controller.results_ready.connect(self.filter_logs)
+        self.search_controller.search_failed.connect(
+            lambda _query, error: self.status_label.setText(f"Error searching logs: {error}")
+        )
+        
         # Action buttons
         self.refresh_btn = QPushButton("Refresh")
         self.refresh_btn.setStyleSheet(get_button_style())
@@ -222,17 +280,25 @@ class LogsViewerPanel(QMainWindow):
         widget = QWidget()
         layout = QVBoxLayout()
         
-        # Status label
+        # Status label, with a progress bar while workbooks load
+        status_layout = QHBoxLayout()
         self.status_label = QLabel("No log file loaded")
         self.status_label.setStyleSheet("color: #808080; padding: 10px;")
-        layout.addWidget(self.status_label)
-        
-        # Table widget
-        self.table = QTableWidget()
+        status_layout.addWidget(self.status_label)
+        status_layout.addStretch()
+        self.busy_indicator = BusyIndicator(self, widget)
+        status_layout.addWidget(self.busy_indicator)
+        layout.addLayout(status_layout)
+        
+        # Table view; cells are formatted on demand by the model
+        self.table_model = DataFrameTableModel(parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         self.table.setStyleSheet(TABLE_STYLE)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(True)
+        configure_large_table(self.table)
         layout.addWidget(self.table)
         
         widget.setLayout(layout)
@@ -330,64 +396,189 @@ class LogsViewerPanel(QMainWindow):
         if not log_type:
             log_type = self.log_combo.currentText()
         
+        self.stop_loader()
+        if log_type == ALL_LOGS:
+            self.load_all_logs()
+            return
+        
         file_path = self.log_types.get(log_type)
         if not file_path or not os.path.exists(file_path):
             self.status_label.setText(f"Log file not found: {file_path}")
-            self.table.clear()
+            self.table_model.set_frame(None)
             self.current_log_data = None
             return
         
-        try:
-            # Load the Excel file
-            self.current_log_data = pd.read_excel(file_path)
-            self.display_data(self.current_log_data)
-            self.update_statistics()
-            self.status_label.setText(f"Loaded {len(self.current_log_data)} records from {log_type}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load log file: {str(e)}")
-            self.status_label.setText(f"Error loading {log_type}")
+        # Load the Excel file off the GUI thread
+        import pandas as pd
+        self.status_label.setText(f"Loading {log_type}...")
+        task_runner().submit(
+            pd.read_excel, file_path,
+            owner=self, key="load", priority=Priority.HIGH,
+            on_result=lambda data: self.on_log_file_loaded(log_type, data),
+            on_error=lambda error: self.on_log_file_failed(log_type, error)
+        )
+    
+    def on_log_file_loaded(self, log_type, data):
+        """Show a single workbook once it has been read"""
+        self.current_log_data = data
+        self.display_data(self.current_log_data)
+        self.update_statistics()
+        self.status_label.setText(f"Loaded {len(self.current_log_data)} records from {log_type}")
     
-    def display_data(self, data):
-        """Display data in the table"""
-        if data is None or data.empty:
-            self.table.clear()
+    def on_log_file_failed(self, log_type, error):
+        QMessageBox.critical(self, "Error", f"Failed to load log file: {error}")
+        self.status_label.setText(f"Error loading {log_type}")
+    
+    def load_all_logs(self):
+        """Load every log workbook concurrently and merge them by date and time"""
+        from logic.log_loader import merge_log_frames
+        self.stop_loader()
+        log_files = {
+            label: path for label, path in self.log_types.items() if os.path.exists(path)
+        }
+        self.loaded_parts = []
+        self.current_log_data = merge_log_frames([])
+        self.display_data(self.current_log_data)
+        if not log_files:
+            self.status_label.setText("No log files found")
             return
         
-        # Set up table
-        self.table.setRowCount(len(data))
-        self.table.setColumnCount(len(data.columns))
-        self.table.setHorizontalHeaderLabels(data.columns.tolist())
-        
-        # Populate table
-        for row in range(len(data)):
-            for col in range(len(data.columns)):
-                value = str(data.iloc[row, col])
-                item = QTableWidgetItem(value)
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.table.setItem(row, col, item)
-        
-        # Adjust column widths
-        self.table.resizeColumnsToContents()
+        start = self.start_date.date().toString("yyyy-MM-dd")
+        end = self.end_date.date().toString("yyyy-MM-dd")
+        self.expected_parts = len(log_files)
+        self.status_label.setText(f"Loading {len(log_files)} logs from {start} to {end}...")
+        
+        task_runner().submit(
+            load_workbooks, log_files, start, end,
+            owner=self, key="load", priority=Priority.HIGH, context=True,
+            on_progress=self.on_workbook_progress,
+            on_result=lambda _result: self.on_all_logs_finished(),
+            on_error=lambda error: self.status_label.setText(f"Error loading logs: {error}")
+        )
+        self.streaming = True
+    
+    def on_workbook_progress(self, percent, message, data):
+        label, frame, error = data
+        if error is not None:
+            self.on_workbook_failed(label, error)
+        else:
+            self.on_workbook_loaded(label, frame)
+    
+    def on_workbook_loaded(self, label, frame):
+        """Merge a newly parsed workbook into the All Logs view"""
+        from logic.log_loader import merge_sorted_frames
+        # Parts arrive sorted; only the new rows are placed, nothing is re-sorted
+        self.loaded_parts.append(label)
+        self.current_log_data = merge_sorted_frames(self.current_log_data, frame)
+        if self.search_field.text().strip():
+            # Keep the active search; filter_logs shows its result
+            self.search_controller.search_now()
+        else:
+            self.display_data(self.current_log_data, keep_view=True)
+        self.status_label.setText(
+            f"Loaded {len(self.loaded_parts)} of {self.expected_parts} logs "
+            f"({len(self.current_log_data)} records)..."
+        )
+    
+    def on_workbook_failed(self, label, error):
+        """Record a workbook that could not be parsed"""
+        self.expected_parts -= 1
+        self.export_status.setText(f"Skipped {label}: {error}")
+    
+    def on_all_logs_finished(self):
+        """Finalize the All Logs view once every workbook has been handled"""
+        self.streaming = False
+        self.update_statistics()
+        self.status_label.setText(
+            f"Loaded {len(self.current_log_data)} records from {len(self.loaded_parts)} logs"
+        )
     
-    def filter_logs(self):
-        """Filter logs based on search term"""
-        search_term = self.search_field.text().lower()
-        if not search_term or self.current_log_data is None:
-            self.display_data(self.current_log_data)
+    def stop_loader(self):
+        """Cancel an in-flight load; its results are discarded"""
+        self.streaming = False
+        task_runner().cancel(self, "load")
+    
+    def closeEvent(self, event):
+        self.stop_loader()
+        super().closeEvent(event)
+    
+    def display_data(self, data, keep_view=False):
+        """Display data in the table
+        
+        With ``keep_view`` (used while All Logs parts stream in) the
+        column sort, the selected rows and the scroll position are
+        kept instead of being reset.
+        """
+        if not keep_view:
+            self.table_model.set_frame(data)
+            # A new frame starts unsorted; clear any stale sort indicator
+            self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+            resize_columns_from_sample(self.table)
             return
         
-        # Filter data
-        filtered_data = self.current_log_data[
-            self.current_log_data.apply(
-                lambda row: any(search_term in str(cell).lower() for cell in row),
-                axis=1
-            )
+        header = self.table.horizontalHeader()
+        column, order = header.sortIndicatorSection(), header.sortIndicatorOrder()
+        scroll = self.table.verticalScrollBar().value()
+        # Rows are found again by their index label, which merging keeps
+        old = self.table_model.frame()
+        selected = [] if old is None else [
+            old.index[index.row()] for index in self.table.selectionModel().selectedRows()
         ]
-        self.display_data(filtered_data)
+        first_fill = self.table_model.rowCount() == 0
+        
+        self.table_model.set_frame(data)
+        if 0 <= column < self.table_model.columnCount():
+            self.table_model.sort(column, order)
+        frame = self.table_model.frame()
+        if selected and frame is not None:
+            selection = QItemSelection()
+            last_column = self.table_model.columnCount() - 1
+            for row in frame.index.get_indexer(selected):
+                if row >= 0:
+                    selection.select(self.table_model.index(row, 0),
+                                     self.table_model.index(row, last_column))
+            self.table.selectionModel().select(
+                selection, QItemSelectionModel.SelectionFlag.ClearAndSelect
+            )
+        self.table.verticalScrollBar().setValue(scroll)
+        if first_fill:
+            resize_columns_from_sample(self.table)
+    
+    def search_logs(self, search_term):
+        """Filter the loaded data; runs on the search worker thread"""
+        data = self.current_log_data
+        if not search_term.strip() or data is None:
+            return data, None
+        
+        # Index the loaded data once; later keystrokes reuse it
+        index = self.search_index
+        if index is None or index.frame is not data:
+            from logic.search_index import SearchIndex
+            index = SearchIndex(data)
+            self.search_index = index
+        return data, index.filter(search_term)
+    
+    def filter_logs(self, search_term, result):
+        """Show the result of the latest search"""
+        data, filtered_data = result
+        if data is not self.current_log_data:
+            # The data was reloaded while searching; search it again
+            self.search_controller.search_now()
+            return
+        if filtered_data is None:
+            self.display_data(self.current_log_data, keep_view=self.streaming)
+            return
+        
+        self.display_data(filtered_data, keep_view=self.streaming)
         self.status_label.setText(f"Showing {len(filtered_data)} of {len(self.current_log_data)} records")
     
     def apply_filters(self):
         """Apply date range filters"""
+        if self.log_combo.currentText() == ALL_LOGS:
+            # The date range is applied while the workbooks are parsed
+            self.load_all_logs()
+            return
+        
         if self.current_log_data is None:
             return
         
@@ -403,6 +594,7 @@ class LogsViewerPanel(QMainWindow):
                 break
         
         if date_col:
+            import pandas as pd
             filtered_data = self.current_log_data[
                 (pd.to_datetime(self.current_log_data[date_col]).dt.date >= start) &
                 (pd.to_datetime(self.current_log_data[date_col]).dt.date <= end)
@@ -441,6 +633,7 @@ class LogsViewerPanel(QMainWindow):
         if 'Date' in self.current_log_data.columns or 'Timestamp' in self.current_log_data.columns:
             date_col = 'Date' if 'Date' in self.current_log_data.columns else 'Timestamp'
             try:
+                import pandas as pd
                 dates = pd.to_datetime(self.current_log_data[date_col])
                 stats_text += f"""
                 <p><b>Date Range:</b> {dates.min().date()} to {dates.max().date()}</p>
@@ -453,7 +646,7 @@ class LogsViewerPanel(QMainWindow):
     
     def export_current_view(self):
         """Export the current table view"""
-        if self.table.rowCount() == 0:
+        if self.table_model.rowCount() == 0:
             QMessageBox.warning(self, "Warning", "No data to export")
             return
         
@@ -482,21 +675,8 @@ class LogsViewerPanel(QMainWindow):
     
     def export_to_excel(self, file_path):
         """Export table to Excel"""
-        # Get data from table
-        data = []
-        headers = []
-        for col in range(self.table.columnCount()):
-            headers.append(self.table.horizontalHeaderItem(col).text())
-        
-        for row in range(self.table.rowCount()):
-            row_data = []
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                row_data.append(item.text() if item else "")
-            data.append(row_data)
-        
-        df = pd.DataFrame(data, columns=headers)
-        df.to_excel(file_path, index=False)
+        # Export exactly what the view shows, in its current sort order
+        self.table_model.frame().to_excel(file_path, index=False)
         self.export_status.setText(f"Exported to {file_path}")
     
     def export_to_csv(self, file_path):
@@ -5,7 +5,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QShortcut, QKeySequence
 from datetime import datetime
-from database import insert_phone_log
+from logic.event_handler import event_unit_of_work
 from ui.styles import (
     Fonts, Colors,
     INPUT_STYLE, get_button_style,
@@ -301,19 +301,22 @@ class OnCallTechDialog(QDialog):
             tech_phone = self.tech_phone_field.text()
             site_code = self.site_field.text()
             
-            # Save to database
-            insert_phone_log(
-                call_type="On-Call Tech",
-                caller_name=tech_name,  # This is the tech's name
-                site_code=site_code,
-                ticket_number=ticket_number,
-                address=None,
-                alarm_type=None,
-                issue_type=self.facilities_info.get("issue_type") if self.facilities_info else None,
-                issue_subtype=self.facilities_info.get("issue_subtype") if self.facilities_info else None,
-                message=notes,
-                timestamp=timestamp
-            )
+            # Save to database, linked to the workflow's event chain
+            with event_unit_of_work() as uow:
+                log_id = uow.insert_phone_log(
+                    call_type="On-Call Tech",
+                    caller_name=tech_name,  # This is the tech's name
+                    site_code=site_code,
+                    ticket_number=ticket_number,
+                    address=None,
+                    alarm_type=None,
+                    issue_type=self.facilities_info.get("issue_type") if self.facilities_info else None,
+                    issue_subtype=self.facilities_info.get("issue_subtype") if self.facilities_info else None,
+                    message=notes,
+                    timestamp=timestamp
+                )
+                if self.event_chain_id:
+                    uow.link_log(self.event_chain_id, "phone_logs", log_id, timestamp)
             
             # Also save to Excel log
             phone_data = {
@@ -0,0 +1,134 @@
+"""
+Warm pool of the panels opened from the home window.
+
+``PanelRegistry`` builds each panel once and keeps it after the
+operator closes it (closing a ``QMainWindow`` only hides it), so
+reopening a panel is a ``show()`` rather than a rebuild of its widget
+tree, stylesheets and data. A reopened panel's ``reset_form()``, when
+it has one, clears what the last use left behind.
+
+Shortly after startup the most used panels are built ahead of time,
+one per turn of the event loop so the home window stays responsive.
+At most ``MAX_WARM_PANELS`` panels are kept; past that the least
+recently used hidden panel is destroyed.
+
+Panel modules are imported only when their panel is first built (see
+``lazy_panel``), which keeps them and what they import off the
+startup path.
+"""
+
+import importlib
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, QTimer
+
+from app_settings import app_settings
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Most panels kept built at once
+MAX_WARM_PANELS = 5
+# Panels built ahead of time after startup
+PREBUILD_COUNT = 3
+# Wait after startup before prebuilding (ms)
+PREBUILD_DELAY_MS = 2000
+# Prebuilt until usage has been recorded
+DEFAULT_PREBUILD = ("phone", "email", "radio")
+
+
+def lazy_panel(module: str, class_name: str):
+    """Return a factory that imports ``module`` and builds ``class_name``."""
+    def build():
+        return getattr(importlib.import_module(module), class_name)()
+    return build
+
+
+class PanelRegistry(QObject):
+    """Keep one instance of each panel and show it on demand.
+
+    Parameters
+    ----------
+    factories: dict
+        Panel name mapped to a callable that builds the panel.
+    max_panels: int
+        Most panels kept built at once.
+    """
+
+    def __init__(self, factories, max_panels=MAX_WARM_PANELS, parent=None):
+        super().__init__(parent)
+        self.factories = dict(factories)
+        self.max_panels = max_panels
+        # Least recently used first
+        self._panels: OrderedDict = OrderedDict()
+        self._prebuild_queue = []
+
+    def __contains__(self, name) -> bool:
+        return name in self._panels
+
+    def open(self, name):
+        """Show the panel called ``name``, building it if needed."""
+        panel = self._panels.get(name)
+        if panel is None:
+            panel = self._build(name)
+        elif not panel.isVisible() and hasattr(panel, "reset_form"):
+            panel.reset_form()
+        self._panels.move_to_end(name)
+
+        panel.show()
+        panel.raise_()
+        panel.activateWindow()
+        self._record_use(name)
+        return panel
+
+    def most_used(self, count=PREBUILD_COUNT) -> list[str]:
+        """Return the names of the ``count`` most opened panels."""
+        usage = app_settings.get("panel_usage") or {}
+        names = sorted(
+            (name for name in usage if name in self.factories),
+            key=lambda name: usage[name], reverse=True,
+        )
+        names += [name for name in DEFAULT_PREBUILD if name not in names]
+        return names[:count]
+
+    def prebuild(self, names=None, delay_ms=PREBUILD_DELAY_MS) -> None:
+        """Build ``names`` (default: ``most_used()``) once the app is idle."""
+        self._prebuild_queue = list(names if names is not None else self.most_used())
+        QTimer.singleShot(delay_ms, self._prebuild_next)
+
+    def _prebuild_next(self):
+        while self._prebuild_queue:
+            name = self._prebuild_queue.pop(0)
+            if name in self._panels or name not in self.factories:
+                continue
+            if len(self._panels) >= self.max_panels:
+                self._prebuild_queue.clear()
+                return
+            try:
+                self._build(name)
+            except Exception:
+                logger.exception("Failed to prebuild the %s panel", name)
+            break
+        if self._prebuild_queue:
+            # Let pending input run before building the next one
+            QTimer.singleShot(0, self._prebuild_next)
+
+    def _build(self, name):
+        panel = self.factories[name]()
+        self._panels[name] = panel
+        self._evict(keep=name)
+        return panel
+
+    def _evict(self, keep):
+        while len(self._panels) > self.max_panels:
+            victim = next(
+                (n for n, p in self._panels.items() if n != keep and not p.isVisible()), None
+            )
+            if victim is None:
+                return
+            self._panels.pop(victim).deleteLater()
+
+    def _record_use(self, name):
+        usage = dict(app_settings.get("panel_usage") or {})
+        usage[name] = usage.get(name, 0) + 1
+        app_settings.set("panel_usage", usage)
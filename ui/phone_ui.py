@@ -2,14 +2,15 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QComboBox,
     QLineEdit, QTextEdit, QPushButton, QHBoxLayout, 
     QMessageBox, QMainWindow, QStatusBar, QScrollArea,
-    QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView
+    QTabWidget, QTableView, QHeaderView
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QShortcut, QKeySequence
 from datetime import datetime
-from database import insert_phone_log
+from logic.event_handler import event_unit_of_work
 from log_manager import log_manager
-import pandas as pd
+from ui.search_controller import SearchController
+from ui.recent_logs import recent_logs_model, RecentLogsFilter
 from ui.help_utils import HelpButton, get_help_training_id
 from ui.styles import (
     Fonts, Colors,
@@ -57,7 +58,7 @@ class PhonePanel(QMainWindow):
         super().__init__()
         self.setWindowTitle("Phone Call Log Entry")
         self.setMinimumSize(900, 800)
-        self.showMaximized()
+        self.setWindowState(Qt.WindowState.WindowMaximized)
         
         self.call_types = get_call_types()  # Get from settings
         self.current_call_type = self.call_types[0]
@@ -194,7 +195,6 @@ class PhonePanel(QMainWindow):
         controls_layout.addWidget(QLabel("Filter:"))
         self.log_filter = QLineEdit()
         self.log_filter.setPlaceholderText("Search logs...")
-        self.log_filter.textChanged.connect(self.filter_logs)
         self.log_filter.setStyleSheet("""
             QLineEdit {
                 padding: 8px;
@@ -207,6 +207,13 @@ class PhonePanel(QMainWindow):
         """)
         controls_layout.addWidget(self.log_filter)
         
+        # Search off the GUI thread once typing pauses
+        self.search_controller = SearchController(self.log_filter, self.search_logs, parent=self)
+        self.search_controller.results_ready.connect(self.filter_logs)
+        self.search_controller.search_failed.connect(
+            lambda _query, error: self.status_bar.showMessage(f"Error searching logs: {error}")
+        )
+        
         controls_layout.addStretch()
         
         # Refresh button
@@ -248,18 +255,23 @@ class PhonePanel(QMainWindow):
         log_layout.addLayout(controls_layout)
         
         # Table for logs
-        self.log_table = QTableWidget()
+        # Newest logs, shared with every other panel showing phone logs
+        self.log_model = recent_logs_model("phone_logs")
+        self.log_proxy = RecentLogsFilter(self)
+        self.log_proxy.setSourceModel(self.log_model)
+        self.log_table = QTableView()
+        self.log_table.setModel(self.log_proxy)
         self.log_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #141414;
                 color: #e0e0e0;
                 gridline-color: #262626;
                 alternate-background-color: #1a1a1a;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #333333;
             }
             QHeaderView::section {
@@ -272,7 +284,7 @@ class PhonePanel(QMainWindow):
         """)
         self.log_table.setAlternatingRowColors(True)
         self.log_table.horizontalHeader().setStretchLastSection(True)
-        self.log_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.log_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         log_layout.addWidget(self.log_table)
         
         log_widget.setLayout(log_layout)
@@ -288,8 +300,8 @@ class PhonePanel(QMainWindow):
         new_central.setLayout(main_layout)
         scroll_area.setWidget(new_central)
         
-        # Load initial logs
-        self.load_recent_logs()
+        # The shared model is already loaded; fit the columns to it
+        self.log_table.resizeColumnsToContents()
 
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -298,6 +310,20 @@ class PhonePanel(QMainWindow):
         QShortcut(QKeySequence("Ctrl+T"), self, self.set_current_time)
         QShortcut(QKeySequence("F5"), self, self.load_recent_logs)
 
+    def reset_form(self):
+        """Clear the entry form for a new call when the panel is reopened"""
+        if self.call_type_dropdown.currentIndex() == 0:
+            self.switch_call_type(0)
+        else:
+            self.call_type_dropdown.setCurrentIndex(0)
+        if app_settings.get("auto_timestamp", True):
+            self.timestamp_field.setText(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        else:
+            self.timestamp_field.clear()
+        self.log_filter.clear()
+        self.main_tabs.setCurrentIndex(0)
+        self.status_bar.showMessage("Ready to log phone call")
+
     def set_current_time(self):
         """Set timestamp to current time"""
         self.timestamp_field.setText(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
@@ -450,19 +476,60 @@ class PhonePanel(QMainWindow):
         else:
             message = data.get("Message") or data.get("Additional Info") or data.get("Description")
 
-        try:
-            phone_log_id = insert_phone_log(
-                call_type=call_type,
-                caller_name=data.get("Caller Name"),
-                site_code=data.get("Site Code"),
-                ticket_number=data.get("Incident Report Number") or data.get("Facilities Ticket Number"),
-                address=data.get("Address"),
-                alarm_type=data.get("Alarm Type"),
-                issue_type=data.get("Issue Type"),
-                issue_subtype=data.get("Issue Subtype"),
-                message=message,
-                timestamp=timestamp
+        # Facilities and Everbridge calls can start an event chain. Ask
+        # before saving so the call, the chain and the link between them
+        # are committed together.
+        chain_title = None
+        chain_description = ""
+        if call_type == "Facilities":
+            chain_reply = QMessageBox.question(
+                self,
+                "Create Event Chain",
+                "Would you like to auto-create an event chain for these related events?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes
+            )
+            if chain_reply == QMessageBox.StandardButton.Yes:
+                # Create event chain with proper naming: SITE Date Time Type
+                site = data.get("Site Code", "UNKNOWN")
+                chain_date = datetime.now().strftime("%m-%d-%Y")
+                chain_time = datetime.now().strftime("%H%M")
+                chain_title = f"{site} {chain_date} {chain_time} Facilities"
+                chain_description = f"Facilities issue at {site} - {data.get('Issue Subtype', '')}"
+        elif call_type == "Everbridge":
+            chain_reply = QMessageBox.question(
+                self,
+                "Create Event Chain", 
+                "Would you like to auto-create an event chain for the Everbridge workflow?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes
             )
+            if chain_reply == QMessageBox.StandardButton.Yes:
+                # Create event chain with proper naming: SITE Date Time Type
+                # For Everbridge, we might not have site yet, use ALERT
+                chain_date = datetime.now().strftime("%m-%d-%Y")
+                chain_time = datetime.now().strftime("%H%M")
+                chain_title = f"ALERT {chain_date} {chain_time} Everbridge"
+                chain_description = f"Everbridge alert request from {data.get('Caller Name', 'Unknown')}"
+
+        try:
+            event_chain_id = None
+            with event_unit_of_work() as uow:
+                phone_log_id = uow.insert_phone_log(
+                    call_type=call_type,
+                    caller_name=data.get("Caller Name"),
+                    site_code=data.get("Site Code"),
+                    ticket_number=data.get("Incident Report Number") or data.get("Facilities Ticket Number"),
+                    address=data.get("Address"),
+                    alarm_type=data.get("Alarm Type"),
+                    issue_type=data.get("Issue Type"),
+                    issue_subtype=data.get("Issue Subtype"),
+                    message=message,
+                    timestamp=timestamp
+                )
+                if chain_title:
+                    event_chain_id = uow.create_event_chain(chain_title, chain_description)
+                    uow.link_log(event_chain_id, "phone_logs", phone_log_id, timestamp)
 
             # Also save to Excel log
             phone_data = {
@@ -477,55 +544,13 @@ class PhonePanel(QMainWindow):
             
             try:
                 log_manager.add_phone_log(phone_data)
-                # Refresh the log display
-                self.load_recent_logs()
             except Exception as e:
                 print(f"Error saving to Excel: {e}")
             
             show_success(self, "Phone call log saved successfully!")
             
-            # Note: Would need to get actual log ID for proper linking
-            # For now event chain will track by timestamp
-            
             # Check if this was a facilities call and prompt for on-call tech
             if call_type == "Facilities":
-                from PyQt6.QtWidgets import QMessageBox
-                from logic.event_handler import create_event_chain, link_log_to_event
-                
-                # Ask about creating event chain
-                chain_reply = QMessageBox.question(
-                    self,
-                    "Create Event Chain",
-                    "Would you like to auto-create an event chain for these related events?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.Yes
-                )
-                
-                event_chain_id = None
-                if chain_reply == QMessageBox.StandardButton.Yes:
-                    # Create event chain with proper naming: SITE Date Time Type
-                    site = data.get("Site Code", "UNKNOWN")
-                    chain_date = datetime.now().strftime("%m-%d-%Y")
-                    chain_time = datetime.now().strftime("%H%M")
-                    chain_title = f"{site} {chain_date} {chain_time} Facilities"
-                    
-                    event_chain_id = create_event_chain(
-                        title=chain_title,
-                        description=f"Facilities issue at {site} - {data.get('Issue Subtype', '')}"
-                    )
-                    
-                    # Link the phone log to the event chain
-                    if event_chain_id and phone_log_id:
-                        try:
-                            link_log_to_event(
-                                event_chain_id, 
-                                "phone_logs",
-                                phone_log_id,
-                                timestamp
-                            )
-                        except Exception as e:
-                            print(f"Error linking phone log to event chain: {e}")
-                
                 reply = QMessageBox.question(
                     self, 
                     "On-Call Tech",
@@ -586,45 +611,8 @@ class PhonePanel(QMainWindow):
                         )
                         dialog.exec()
             
-            # Check if this was an Everbridge call and start the chain
+            # Continue the Everbridge workflow with the chain created above
             if call_type == "Everbridge":
-                from PyQt6.QtWidgets import QMessageBox
-                from logic.event_handler import create_event_chain, link_log_to_event
-                
-                # Ask about creating event chain
-                chain_reply = QMessageBox.question(
-                    self,
-                    "Create Event Chain", 
-                    "Would you like to auto-create an event chain for the Everbridge workflow?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.Yes
-                )
-                
-                event_chain_id = None
-                if chain_reply == QMessageBox.StandardButton.Yes:
-                    # Create event chain with proper naming: SITE Date Time Type
-                    # For Everbridge, we might not have site yet, use ALERT
-                    chain_date = datetime.now().strftime("%m-%d-%Y")
-                    chain_time = datetime.now().strftime("%H%M")
-                    chain_title = f"ALERT {chain_date} {chain_time} Everbridge"
-                    
-                    event_chain_id = create_event_chain(
-                        title=chain_title,
-                        description=f"Everbridge alert request from {data.get('Caller Name', 'Unknown')}"
-                    )
-                    
-                    # Link the phone log to the event chain
-                    if event_chain_id and phone_log_id:
-                        try:
-                            link_log_to_event(
-                                event_chain_id,
-                                "phone_logs",
-                                phone_log_id,
-                                timestamp
-                            )
-                        except Exception as e:
-                            print(f"Error linking phone log to event chain: {e}")
-                
                 reply = QMessageBox.question(
                     self,
                     "Everbridge Email", 
@@ -660,69 +648,28 @@ class PhonePanel(QMainWindow):
             
             # Switch to logs tab to show the new entry
             self.main_tabs.setCurrentIndex(1)
-            self.load_recent_logs()
         except Exception as e:
             show_error(self, f"Error saving log: {str(e)}")
             self.status_bar.showMessage("Error saving log")
     
     def load_recent_logs(self):
-        """Load recent phone logs into the table"""
-        try:
-            df = log_manager.get_recent_logs('phone', limit=50)
-            self.current_df = df  # Store for filtering
-            if not df.empty:
-                self.log_table.setRowCount(len(df))
-                self.log_table.setColumnCount(len(df.columns))
-                self.log_table.setHorizontalHeaderLabels(df.columns.tolist())
-                
-                for row in range(len(df)):
-                    for col in range(len(df.columns)):
-                        value = str(df.iloc[row, col])
-                        item = QTableWidgetItem(value)
-                        self.log_table.setItem(row, col, item)
-                
-                # Adjust column widths
-                self.log_table.resizeColumnsToContents()
-                
-                # Update status
-                self.status_bar.showMessage(f"Loaded {len(df)} phone log entries")
-            else:
-                self.log_table.setRowCount(0)
-                self.log_table.setColumnCount(5)
-                self.log_table.setHorizontalHeaderLabels(["Date", "Time", "Caller", "Type", "Summary"])
-                self.status_bar.showMessage("No phone logs found")
-        except Exception as e:
-            print(f"Error loading logs: {e}")
-            self.status_bar.showMessage("Error loading logs")
+        """Reload the recent phone logs from the database"""
+        self.log_model.reload()
+        self.log_table.resizeColumnsToContents()
+        self.status_bar.showMessage(f"Loaded {self.log_model.rowCount()} phone log entries")
     
-    def filter_logs(self):
-        """Filter logs based on search text"""
-        if not hasattr(self, 'current_df') or self.current_df.empty:
-            return
-        
-        search_text = self.log_filter.text().lower()
-        if not search_text:
-            # Show all if no filter
-            self.load_recent_logs()
-            return
-        
-        # Filter dataframe
-        filtered_df = self.current_df[
-            self.current_df.apply(
-                lambda row: any(search_text in str(cell).lower() for cell in row),
-                axis=1
+    def search_logs(self, search_text):
+        """Filter the loaded logs; runs on the search worker thread"""
+        # Every search term must match
+        return self.log_model.search(search_text)
+    
+    def filter_logs(self, search_text, log_ids):
+        """Show the result of the latest search"""
+        self.log_proxy.set_ids(log_ids)
+        if log_ids is not None:
+            self.status_bar.showMessage(
+                f"Showing {self.log_proxy.rowCount()} of {self.log_model.rowCount()} entries"
             )
-        ]
-        
-        # Update table
-        self.log_table.setRowCount(len(filtered_df))
-        for row in range(len(filtered_df)):
-            for col in range(len(filtered_df.columns)):
-                value = str(filtered_df.iloc[row, col])
-                item = QTableWidgetItem(value)
-                self.log_table.setItem(row, col, item)
-        
-        self.status_bar.showMessage(f"Showing {len(filtered_df)} of {len(self.current_df)} entries")
     
     def continue_everbridge_alert(self, alert_data, event_chain_id=None):
         """Continue the Everbridge workflow with alert"""
@@ -804,11 +751,7 @@ class PhonePanel(QMainWindow):
         )
         if file_path:
             try:
-                if hasattr(self, 'current_df'):
-                    if file_path.endswith('.csv'):
-                        self.current_df.to_csv(file_path, index=False)
-                    else:
-                        self.current_df.to_excel(file_path, index=False)
-                    QMessageBox.information(self, "Success", f"Logs exported to {file_path}")
+                self.log_model.export(file_path)
+                QMessageBox.information(self, "Success", f"Logs exported to {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
\ No newline at end of file
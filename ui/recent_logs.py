@@ -0,0 +1,221 @@
+"""
+Shared table model of the newest logs of one type.
+
+``recent_logs_model(table)`` returns the one ``RecentLogsModel`` for a
+log table, so every panel showing that log type shares its rows. The
+model loads the newest ``RECENT_LOG_LIMIT`` rows with a single query on
+the table's timestamp index and then keeps itself current: a committed
+insert adds just the new row at its place near the top and an edited
+log refreshes just its row, so saving a log never reloads the table.
+"""
+
+import sqlite3
+
+from PyQt6.QtCore import (
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt, pyqtSignal
+)
+
+from database import DB_PATH, add_log_insert_listener, add_row_change_listener
+from logger import get_logger
+from logic.rows import CELL_SEPARATOR, RowSet, parse_query
+
+logger = get_logger(__name__)
+
+# Rows kept per log type
+RECENT_LOG_LIMIT = 50
+
+_DATE = ("Date", "date(timestamp)")
+_TIME = ("Time", "time(timestamp)")
+
+# Displayed columns of each log table as ``(header, SQL expression)``
+RECENT_LOG_COLUMNS = {
+    "email_logs": [
+        _DATE, _TIME,
+        ("Category", "log_type"),
+        ("From", "sender"),
+        ("To", "recipient"),
+        ("Subject", "subject"),
+        ("Details", "extra_field"),
+    ],
+    "phone_logs": [
+        _DATE, _TIME,
+        ("Type", "call_type"),
+        ("Caller", "caller_name"),
+        ("Site", "site_code"),
+        ("Ticket", "ticket_number"),
+        ("Message", "message"),
+    ],
+    "radio_logs": [
+        _DATE, _TIME,
+        ("Unit", "unit"),
+        ("Location", "location"),
+        ("Reason", "reason"),
+        ("Arrived", "CASE WHEN arrived THEN 'Yes' ELSE 'No' END"),
+        ("Departed", "CASE WHEN departed THEN 'Yes' ELSE 'No' END"),
+    ],
+    "everbridge_logs": [
+        _DATE, _TIME,
+        ("Site", "site_code"),
+        ("Message", "message"),
+    ],
+}
+
+
+class RecentLogsModel(QAbstractTableModel):
+    """The newest logs of ``table``, newest first.
+
+    Rows are immutable ``(id, timestamp, values, haystack)`` tuples in
+    a list that is replaced rather than modified, so ``search`` can
+    read it from a worker thread.
+    """
+
+    # Internal: carry commit notifications from the writing thread to ours
+    _inserted = pyqtSignal(int)
+    _changed = pyqtSignal(int)
+
+    def __init__(self, table, limit=RECENT_LOG_LIMIT, parent=None):
+        super().__init__(parent)
+        self.table = table
+        self.limit = limit
+        columns = RECENT_LOG_COLUMNS[table]
+        self.headers = [header for header, _expr in columns]
+        self._select = (
+            f"SELECT id, timestamp, {', '.join(expr for _header, expr in columns)} FROM {table}"
+        )
+        self._rows = []
+
+        self._inserted.connect(self.add_log)
+        self._changed.connect(self.refresh_log)
+        add_log_insert_listener(self._on_log_inserted)
+        add_row_change_listener(self._on_row_changed)
+        self.reload()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._rows[index.row()][2][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def log_id(self, row: int) -> int:
+        return self._rows[row][0]
+
+    def reload(self) -> None:
+        """Replace every row with the newest ``limit`` logs."""
+        rows = self._fetch(" ORDER BY timestamp DESC, id DESC LIMIT ?", (self.limit,))
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def add_log(self, log_id: int) -> None:
+        """Insert one log at its place by timestamp, dropping the oldest row."""
+        if any(row[0] == log_id for row in self._rows):
+            return
+        fetched = self._fetch(" WHERE id = ?", (log_id,))
+        if not fetched:
+            return
+        new = fetched[0]
+        key = (new[1] or "", new[0])
+        # Almost always 0: new logs are the newest
+        position = next(
+            (i for i, row in enumerate(self._rows) if (row[1] or "", row[0]) < key),
+            len(self._rows),
+        )
+        if position >= self.limit:
+            return
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows = self._rows[:position] + [new] + self._rows[position:]
+        self.endInsertRows()
+        if len(self._rows) > self.limit:
+            self.beginRemoveRows(QModelIndex(), self.limit, len(self._rows) - 1)
+            self._rows = self._rows[:self.limit]
+            self.endRemoveRows()
+
+    def refresh_log(self, log_id: int) -> None:
+        """Re-read one shown log after it was edited."""
+        position = next((i for i, row in enumerate(self._rows) if row[0] == log_id), None)
+        if position is None:
+            return
+        fetched = self._fetch(" WHERE id = ?", (log_id,))
+        if not fetched or fetched[0][1] != self._rows[position][1]:
+            # Deleted or moved in time; place it again
+            self.beginRemoveRows(QModelIndex(), position, position)
+            self._rows = self._rows[:position] + self._rows[position + 1:]
+            self.endRemoveRows()
+            if fetched:
+                self.add_log(log_id)
+            return
+        self._rows = self._rows[:position] + fetched + self._rows[position + 1:]
+        self.dataChanged.emit(self.index(position, 0), self.index(position, len(self.headers) - 1))
+
+    def search(self, query: str) -> set | None:
+        """Return the IDs of the rows matching every term of ``query``.
+
+        Safe to call from a worker thread. Returns ``None`` for an
+        empty query.
+        """
+        terms = parse_query(query)
+        if not terms:
+            return None
+        rows = self._rows
+        return {row[0] for row in rows if all(term in row[3] for term in terms)}
+
+    def export(self, path: str) -> None:
+        """Write the shown rows to ``path`` as CSV or, otherwise, Excel."""
+        RowSet(self.headers, (row[2] for row in self._rows)).export(path)
+
+    def _fetch(self, clause: str, params: tuple) -> list[tuple]:
+        try:
+            with sqlite3.connect(DB_PATH) as conn:
+                fetched = conn.execute(self._select + clause, params).fetchall()
+        except Exception:
+            logger.exception("Failed to load recent %s", self.table)
+            return []
+        rows = []
+        for log_id, timestamp, *values in fetched:
+            values = tuple("" if value is None else str(value) for value in values)
+            rows.append((log_id, timestamp, values, CELL_SEPARATOR.join(values).lower()))
+        return rows
+
+    def _on_log_inserted(self, table, log_id):
+        if table == self.table:
+            self._inserted.emit(log_id)
+
+    def _on_row_changed(self, table, log_id):
+        if table == self.table:
+            self._changed.emit(log_id)
+
+
+class RecentLogsFilter(QSortFilterProxyModel):
+    """Show only the rows whose log ID is in the last search result."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = None
+
+    def set_ids(self, ids) -> None:
+        """Show the rows with these IDs, or every row for ``None``."""
+        self._ids = ids
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._ids is None or self.sourceModel().log_id(source_row) in self._ids
+
+
+_models: dict[str, RecentLogsModel] = {}
+
+
+def recent_logs_model(table: str) -> RecentLogsModel:
+    """Return the shared model of ``table``, loading it on first use."""
+    if table not in _models:
+        _models[table] = RecentLogsModel(table)
+    return _models[table]
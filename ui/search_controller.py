@@ -0,0 +1,125 @@
+"""
+Debounced, asynchronous search-as-you-type for the log panels.
+
+``SearchController`` watches a ``QLineEdit``. Once the operator pauses
+typing for the debounce interval, it runs the panel's search function
+on a worker thread and emits the result back on the GUI thread. A
+newer query removes any queued search that has not started yet, and
+results from superseded queries are dropped, so only the latest query
+is ever applied to the table.
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Default pause in typing before a search runs (ms)
+DEFAULT_DEBOUNCE_MS = 250
+
+
+class _SearchSignals(QObject):
+    finished = pyqtSignal(int, str, object)
+    failed = pyqtSignal(int, str, str)
+
+
+class _SearchTask(QRunnable):
+    def __init__(self, generation, query, search_fn, is_current, signals):
+        super().__init__()
+        self.generation = generation
+        self.query = query
+        self.search_fn = search_fn
+        self.is_current = is_current
+        self.signals = signals
+
+    def run(self):
+        # Skip the work entirely if a newer query arrived while queued
+        if not self.is_current(self.generation):
+            return
+        try:
+            result = self.search_fn(self.query)
+        except Exception as exc:
+            logger.exception("Search for '%s' failed", self.query)
+            self.signals.failed.emit(self.generation, self.query, str(exc))
+            return
+        self.signals.finished.emit(self.generation, self.query, result)
+
+
+class SearchController(QObject):
+    """Run ``search_fn(query)`` off the GUI thread as the user types.
+
+    Parameters
+    ----------
+    line_edit: QLineEdit
+        The search box to watch.
+    search_fn: callable
+        Called with the query text on a worker thread. It must not
+        touch widgets; its return value is passed to ``results_ready``.
+    debounce_ms: int
+        Pause in typing before a search is started.
+
+    Signals
+    -------
+    results_ready(str, object)
+        The query and the result of the latest search.
+    search_failed(str, str)
+        The query and error message when ``search_fn`` raised.
+    """
+
+    results_ready = pyqtSignal(str, object)
+    search_failed = pyqtSignal(str, str)
+
+    def __init__(self, line_edit, search_fn, debounce_ms=DEFAULT_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.line_edit = line_edit
+        self.search_fn = search_fn
+        self.generation = 0
+
+        # One worker per controller keeps searches serialized, so a
+        # search function may keep state (such as a SearchIndex cache)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.signals = _SearchSignals(self)
+        self.signals.finished.connect(self._on_finished)
+        self.signals.failed.connect(self._on_failed)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(debounce_ms)
+        self.timer.timeout.connect(self.search_now)
+        line_edit.textChanged.connect(self.timer.start)
+
+    def _is_current(self, generation):
+        return generation == self.generation
+
+    def search_now(self):
+        """Start a search for the current text without waiting."""
+        self.timer.stop()
+        self.generation += 1
+        # Drop queued searches that have not started yet
+        self.pool.clear()
+        self.pool.start(
+            _SearchTask(
+                self.generation,
+                self.line_edit.text(),
+                self.search_fn,
+                self._is_current,
+                self.signals,
+            )
+        )
+
+    def cancel(self):
+        """Discard pending and running searches, e.g. when data reloads."""
+        self.timer.stop()
+        self.generation += 1
+        self.pool.clear()
+
+    def _on_finished(self, generation, query, result):
+        if generation == self.generation:
+            self.results_ready.emit(query, result)
+
+    def _on_failed(self, generation, query, error):
+        if generation == self.generation:
+            self.search_failed.emit(query, error)
@@ -0,0 +1,86 @@
+"""
+Qt driver for the SLA breach detector.
+
+``SlaMonitor`` owns a ``logic.sla.SlaEngine``, seeds it on the task
+runner, feeds it every new event link and sleeps on a timer until the
+next deadline. Breaches are announced through the ``breach`` signal.
+"""
+
+import copy
+from datetime import datetime
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from app_settings import app_settings
+from logic.event_handler import add_link_listener
+from logic.sla import SlaEngine, SlaThresholds, get_log_keys, load_open_chains
+from ui.task_runner import task_runner, Priority
+
+# Longest sleep between checks, so new settings apply within seconds (ms)
+MAX_CHECK_INTERVAL_MS = 5000
+
+
+class SlaMonitor(QObject):
+    """Raise ``breach(dict)`` when an open chain misses its deadline.
+
+    See ``SlaEngine.check`` for the keys of the breach dict.
+    """
+
+    breach = pyqtSignal(dict)
+    # Internal: carries new links from the committing thread to ours
+    _link_added = pyqtSignal(int, object, object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.engine = SlaEngine(self.load_thresholds())
+        self._settings = copy.deepcopy(app_settings.get("sla_thresholds"))
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.check)
+
+        self._link_added.connect(self._on_link_added)
+        add_link_listener(self._on_links_committed)
+
+        task_runner().submit(
+            load_open_chains,
+            owner=self, key="seed", priority=Priority.LOW,
+            on_result=self._on_seeded
+        )
+
+    @staticmethod
+    def load_thresholds():
+        return SlaThresholds.from_settings(app_settings.get("sla_thresholds"))
+
+    def _on_seeded(self, rows):
+        self.engine.seed(rows)
+        self.check()
+
+    def _on_links_committed(self, event_id, refs):
+        # Runs on the committing thread; only primary-key lookups here
+        for table, source_id, timestamp in refs:
+            site, call_type = get_log_keys(table, source_id)
+            self._link_added.emit(event_id, timestamp, site, call_type)
+
+    def _on_link_added(self, event_id, timestamp, site, call_type):
+        self.engine.on_link(event_id, timestamp, site, call_type)
+        self.check()
+
+    def check(self):
+        """Report due breaches and sleep until the next deadline."""
+        settings = app_settings.get("sla_thresholds")
+        if settings != self._settings:
+            self._settings = copy.deepcopy(settings)
+            self.engine.set_thresholds(self.load_thresholds())
+
+        now = datetime.now()
+        for breach in self.engine.check(now):
+            self.breach.emit(breach)
+
+        deadline = self.engine.next_deadline()
+        if deadline is None:
+            # Nothing open; links and setting changes wake us up
+            self.timer.start(MAX_CHECK_INTERVAL_MS)
+            return
+        delay = int((deadline - now).total_seconds() * 1000)
+        self.timer.start(max(0, min(delay, MAX_CHECK_INTERVAL_MS)))
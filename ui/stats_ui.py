@@ -9,6 +9,15 @@ from PyQt6.QtGui import QFont, QColor, QShortcut, QKeySequence
 import sqlite3
 from datetime import datetime, timedelta
 from database import DB_PATH
+from logic.event_handler import get_event_chains
+from logic.analytics import (
+    get_response_gaps, summarize_minutes, response_time_report, response_time_trend
+)
+from logic.activity import detect_anomalies, activity_series
+from ui.charts import TimeSeriesChart
+from database import LOG_TABLES, query_cache
+from query_cache import MISS
+from ui.task_runner import task_runner, install_busy_indicator, Priority
 from ui.styles import (
     Fonts, Colors,
     INPUT_STYLE, TABLE_STYLE, LIST_STYLE, DROPDOWN_STYLE, TAB_STYLE,
@@ -16,6 +25,169 @@ from ui.styles import (
     show_error, show_success
 )
 
+# Log tables shown on the Activity Summary tab
+SUMMARY_LOG_TYPES = [
+    ("Email Logs", "email_logs", Colors.EMAIL),
+    ("Phone Logs", "phone_logs", Colors.PHONE),
+    ("Radio Logs", "radio_logs", Colors.RADIO),
+    ("Everbridge Logs", "everbridge_logs", Colors.EVERBRIDGE)
+]
+
+
+# Tables read by each tab, by tab index. A tab's cached result is
+# reused until one of these tables is written to.
+TAB_TABLES = {
+    0: ("event_chains",),
+    1: tuple(LOG_TABLES),
+    2: ("event_chains", "event_links"),
+    3: ("event_links", *LOG_TABLES),
+    4: tuple(LOG_TABLES),
+    5: ("event_links", *LOG_TABLES),
+}
+# Tables read by the analysis of the selected chain on the first tab
+CHAIN_RESPONSE_TABLES = ("event_links", *LOG_TABLES)
+
+
+# Groupings offered on the Response Percentiles tab
+PERCENTILE_GROUPINGS = [
+    ("By Transition", "by_transition"),
+    ("By Site", "by_site"),
+    ("By Event Chain", "by_chain"),
+]
+
+
+# Periods offered on the Anomalies tab, in hours
+ANOMALY_WINDOWS = [
+    ("Last 24 hours", 24),
+    ("Last 7 days", 7 * 24),
+    ("Last 30 days", 30 * 24),
+]
+
+# Series groupings offered on the Anomalies tab
+ANOMALY_GROUPINGS = [
+    ("By Site", ("site",)),
+    ("By Site and Log Type", ("site", "source")),
+    ("By Site and Category", ("site", "source", "category")),
+]
+
+
+# Charts offered on the Trends tab
+TREND_METRICS = [
+    ("Daily Log Volume", "day"),
+    ("Hourly Log Volume", "hour"),
+    ("Response Times", "response"),
+]
+
+# Ranges offered on the Trends tab, in days; None is all history
+TREND_RANGES = [
+    ("Last 30 days", 30),
+    ("Last 90 days", 90),
+    ("Last year", 365),
+    ("All time", None),
+]
+
+# Line colour of each log type on the Trends chart
+TREND_COLORS = {
+    "email_logs": "#4a90d9",
+    "phone_logs": "#4CAF50",
+    "radio_logs": "#FFC107",
+    "everbridge_logs": "#F44336",
+}
+
+
+def fetch_trend(metric, days):
+    """Load the series for one Trends chart from pre-aggregated buckets"""
+    start = datetime.now() - timedelta(days=days) if days else None
+    if metric == "response":
+        since = start.strftime("%Y-%m-%d") if start else ""
+        times, means, maxes = response_time_trend(since)
+        return [
+            ("Average", times, means, "#4CAF50"),
+            ("Slowest", times, maxes, "#F44336"),
+        ]
+    times, counts = activity_series(start, None, bucket=metric)
+    return [
+        (LOG_TABLES.get(source, source), times, values, TREND_COLORS.get(source, "#e0e0e0"))
+        for source, values in sorted(counts.items())
+    ]
+
+
+def fetch_anomalies(hours, group_by):
+    """Score the last ``hours`` hours of activity against their baseline"""
+    end = datetime.now()
+    return detect_anomalies(end - timedelta(hours=hours - 1), end, group_by=group_by)
+
+
+def format_minutes(minutes):
+    """Format a duration in minutes as minutes or hours"""
+    if minutes < 60:
+        return f"{minutes:.1f} min"
+    return f"{minutes / 60:.1f} hrs"
+
+
+def response_time_color(minutes):
+    """Green for fast, orange for moderate and red for slow responses"""
+    if minutes < 5:
+        return QColor("#4CAF50")
+    elif minutes < 15:
+        return QColor("#FF9800")
+    return QColor("#F44336")
+
+
+def fetch_chain_titles():
+    """Return ``(id, title)`` for every event chain, newest first"""
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute("SELECT id, title FROM event_chains ORDER BY created_at DESC")
+        return c.fetchall()
+
+
+def fetch_chain_response(event_id):
+    """Return the response gaps of one chain and their summary"""
+    gaps = get_response_gaps(event_id)
+    return gaps, summarize_minutes([g["minutes"] for g in gaps])
+
+
+def fetch_chain_analysis():
+    """Return every chain with its response-time summary keyed by event id"""
+    return get_event_chains(), response_time_report()["by_chain"]
+
+
+def fetch_summary_counts():
+    """Return per-table activity counts for the Activity Summary tab.
+
+    Returns
+    -------
+    dict
+        Maps each table in ``SUMMARY_LOG_TYPES`` to a tuple of
+        ``(total, today, this_week, avg_per_day)``.
+    """
+    counts = {}
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        for _display_name, table_name, _color in SUMMARY_LOG_TYPES:
+            c.execute(f"""
+                SELECT COUNT(*),
+                       SUM(DATE(created_at) = DATE('now', 'localtime')),
+                       SUM(DATE(created_at) >= DATE('now', '-7 days', 'localtime')),
+                       MIN(created_at), MAX(created_at)
+                FROM {table_name}
+            """)
+            total_count, today_count, week_count, first, last = c.fetchone()
+
+            avg_per_day = "N/A"
+            if first and last:
+                try:
+                    start = datetime.strptime(first, "%Y-%m-%d %H:%M:%S")
+                    end = datetime.strptime(last, "%Y-%m-%d %H:%M:%S")
+                    days = (end - start).days + 1
+                    if days > 0:
+                        avg_per_day = f"{total_count / days:.1f}"
+                except:
+                    pass
+            counts[table_name] = (total_count, today_count or 0, week_count or 0, avg_per_day)
+    return counts
+
 
 
 class StatsPanel(QMainWindow):
@@ -23,16 +195,24 @@ class StatsPanel(QMainWindow):
         super().__init__()
         self.setWindowTitle("Statistics & Reports")
         self.setMinimumSize(1200, 800)
-        self.showMaximized()
         
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Loading statistics...")
+        self.chain_titles = []
+        # Queries run on the shared task runner; this shows while they do
+        self.busy_indicator = install_busy_indicator(self)
         
         self.init_ui()
         self.setup_shortcuts()
 
+        # Tabs load when first shown; only the visible one loads now
+        self.tabs.currentChanged.connect(self.load_tab)
+        self.load_tab(self.tabs.currentIndex())
+        # Maximized once shown, after the UI is built
+        self.setWindowState(Qt.WindowState.WindowMaximized)
+
     def init_ui(self):
         # Central widget
         central_widget = QWidget()
@@ -69,6 +249,21 @@ class StatsPanel(QMainWindow):
         self.setup_event_analysis_tab()
         self.tabs.addTab(self.event_tab, "🔍 Event Analysis")
 
+        # Cross-chain response percentiles
+        self.percentiles_tab = QWidget()
+        self.setup_percentiles_tab()
+        self.tabs.addTab(self.percentiles_tab, "📐 Response Percentiles")
+
+        # Unusually busy hours per site
+        self.anomaly_tab = QWidget()
+        self.setup_anomaly_tab()
+        self.tabs.addTab(self.anomaly_tab, "🚨 Anomalies")
+
+        # Volume and response time charts
+        self.trends_tab = QWidget()
+        self.setup_trends_tab()
+        self.tabs.addTab(self.trends_tab, "📉 Trends")
+
         layout.addWidget(self.tabs)
         self.setLayout(layout)
         
@@ -92,13 +287,13 @@ class StatsPanel(QMainWindow):
         self.chain_combo.setFont(Fonts.NORMAL)
         self.chain_combo.setStyleSheet(DROPDOWN_STYLE)
         self.chain_combo.setMinimumHeight(45)
-        self.chain_combo.currentIndexChanged.connect(self.analyze_chain)
+        self.chain_combo.currentIndexChanged.connect(lambda _index: self.analyze_chain())
         chain_layout.addWidget(self.chain_combo)
         
         refresh_btn = QPushButton("🔄 Refresh")
         refresh_btn.setFont(Fonts.BUTTON)
         refresh_btn.setStyleSheet(get_button_style(Colors.INFO, 45))
-        refresh_btn.clicked.connect(self.load_event_chains)
+        refresh_btn.clicked.connect(self.refresh_current_tab)
         chain_layout.addWidget(refresh_btn)
         
         chain_layout.addStretch()
@@ -175,7 +370,6 @@ class StatsPanel(QMainWindow):
         layout.addWidget(self.stats_group)
 
         self.response_tab.setLayout(layout)
-        self.load_event_chains()
 
     def setup_summary_tab(self):
         layout = QVBoxLayout()
@@ -234,11 +428,10 @@ class StatsPanel(QMainWindow):
         refresh_btn = QPushButton("🔄 Refresh Summary")
         refresh_btn.setFont(Fonts.BUTTON)
         refresh_btn.setStyleSheet(get_button_style(Colors.INFO, 50))
-        refresh_btn.clicked.connect(self.load_summary_stats)
+        refresh_btn.clicked.connect(self.refresh_current_tab)
         layout.addWidget(refresh_btn)
 
         self.summary_tab.setLayout(layout)
-        self.load_summary_stats()
 
     def create_stat_card(self, title, value, color):
         """Create a visual statistics card"""
@@ -284,9 +477,9 @@ class StatsPanel(QMainWindow):
         self.analysis_table = QTableWidget()
         self.analysis_table.setFont(Fonts.NORMAL)
         self.analysis_table.setStyleSheet(TABLE_STYLE)
-        self.analysis_table.setColumnCount(6)
+        self.analysis_table.setColumnCount(7)
         self.analysis_table.setHorizontalHeaderLabels([
-            "Event Chain", "Total Logs", "Duration", "Avg Response", "Status", "Created"
+            "Event Chain", "Total Logs", "Duration", "Avg Response", "P90 Response", "Status", "Created"
         ])
         self.analysis_table.setAlternatingRowColors(True)
         self.analysis_table.verticalHeader().setVisible(False)
@@ -294,7 +487,7 @@ class StatsPanel(QMainWindow):
         # Set column stretching
         header = self.analysis_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        for i in range(1, 6):
+        for i in range(1, 7):
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
         
         layout.addWidget(self.analysis_table)
@@ -303,27 +496,352 @@ class StatsPanel(QMainWindow):
         refresh_btn = QPushButton("🔄 Refresh Analysis")
         refresh_btn.setFont(Fonts.BUTTON)
         refresh_btn.setStyleSheet(get_button_style(Colors.INFO, 50))
-        refresh_btn.clicked.connect(self.load_event_analysis)
+        refresh_btn.clicked.connect(self.refresh_current_tab)
         layout.addWidget(refresh_btn)
 
         self.event_tab.setLayout(layout)
-        self.load_event_analysis()
 
-    def load_event_chains(self):
-        self.chain_combo.clear()
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute("SELECT id, title FROM event_chains ORDER BY created_at DESC")
-        chains = c.fetchall()
-        conn.close()
+    def setup_percentiles_tab(self):
+        layout = QVBoxLayout()
+        layout.setSpacing(15)
+
+        # Grouping selector
+        group_box = QGroupBox("Response Times Across All Chains")
+        group_box.setFont(Fonts.LABEL)
+        group_layout = QHBoxLayout()
+        
+        self.percentile_group_combo = QComboBox()
+        self.percentile_group_combo.setFont(Fonts.NORMAL)
+        self.percentile_group_combo.setStyleSheet(DROPDOWN_STYLE)
+        self.percentile_group_combo.setMinimumHeight(45)
+        for label, key in PERCENTILE_GROUPINGS:
+            self.percentile_group_combo.addItem(label, key)
+        self.percentile_group_combo.currentIndexChanged.connect(self.show_percentile_table)
+        group_layout.addWidget(self.percentile_group_combo)
+        
+        refresh_btn = QPushButton("🔄 Refresh")
+        refresh_btn.setFont(Fonts.BUTTON)
+        refresh_btn.setStyleSheet(get_button_style(Colors.INFO, 45))
+        refresh_btn.clicked.connect(self.refresh_current_tab)
+        group_layout.addWidget(refresh_btn)
+        
+        group_layout.addStretch()
+        group_box.setLayout(group_layout)
+        layout.addWidget(group_box)
+
+        self.overall_label = QLabel("")
+        self.overall_label.setFont(Fonts.NORMAL)
+        self.overall_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.overall_label)
+
+        # Percentile table
+        self.percentile_table = QTableWidget()
+        self.percentile_table.setFont(Fonts.NORMAL)
+        self.percentile_table.setStyleSheet(TABLE_STYLE)
+        self.percentile_table.setColumnCount(7)
+        self.percentile_table.setHorizontalHeaderLabels([
+            "Group", "Responses", "Min", "P50", "P90", "P99", "Max"
+        ])
+        self.percentile_table.setAlternatingRowColors(True)
+        self.percentile_table.verticalHeader().setVisible(False)
+        
+        header = self.percentile_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for i in range(1, 7):
+            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        
+        layout.addWidget(self.percentile_table)
+
+        self.percentiles_tab.setLayout(layout)
+        self.response_report = None
+
+    def setup_anomaly_tab(self):
+        layout = QVBoxLayout()
+        layout.setSpacing(15)
+
+        # Period and grouping selectors
+        options_group = QGroupBox("Unusually Busy Hours")
+        options_group.setFont(Fonts.LABEL)
+        options_layout = QHBoxLayout()
+        
+        self.anomaly_window_combo = QComboBox()
+        self.anomaly_window_combo.setFont(Fonts.NORMAL)
+        self.anomaly_window_combo.setStyleSheet(DROPDOWN_STYLE)
+        self.anomaly_window_combo.setMinimumHeight(45)
+        for label, hours in ANOMALY_WINDOWS:
+            self.anomaly_window_combo.addItem(label, hours)
+        self.anomaly_window_combo.setCurrentIndex(1)
+        self.anomaly_window_combo.currentIndexChanged.connect(lambda: self.load_anomalies())
+        options_layout.addWidget(self.anomaly_window_combo)
+        
+        self.anomaly_group_combo = QComboBox()
+        self.anomaly_group_combo.setFont(Fonts.NORMAL)
+        self.anomaly_group_combo.setStyleSheet(DROPDOWN_STYLE)
+        self.anomaly_group_combo.setMinimumHeight(45)
+        for label, group_by in ANOMALY_GROUPINGS:
+            self.anomaly_group_combo.addItem(label, group_by)
+        self.anomaly_group_combo.setCurrentIndex(1)
+        self.anomaly_group_combo.currentIndexChanged.connect(lambda: self.load_anomalies())
+        options_layout.addWidget(self.anomaly_group_combo)
+        
+        refresh_btn = QPushButton("🔄 Refresh")
+        refresh_btn.setFont(Fonts.BUTTON)
+        refresh_btn.setStyleSheet(get_button_style(Colors.INFO, 45))
+        refresh_btn.clicked.connect(self.refresh_current_tab)
+        options_layout.addWidget(refresh_btn)
+        
+        options_layout.addStretch()
+        options_group.setLayout(options_layout)
+        layout.addWidget(options_group)
+
+        self.hotspot_label = QLabel("")
+        self.hotspot_label.setFont(Fonts.NORMAL)
+        self.hotspot_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.hotspot_label.setWordWrap(True)
+        layout.addWidget(self.hotspot_label)
+
+        # Flagged hours
+        self.anomaly_table = QTableWidget()
+        self.anomaly_table.setFont(Fonts.NORMAL)
+        self.anomaly_table.setStyleSheet(TABLE_STYLE)
+        self.anomaly_table.setColumnCount(7)
+        self.anomaly_table.setHorizontalHeaderLabels([
+            "Hour", "Site", "Log Type", "Category", "Logs", "Usual", "Z-Score"
+        ])
+        self.anomaly_table.setAlternatingRowColors(True)
+        self.anomaly_table.verticalHeader().setVisible(False)
+        
+        header = self.anomaly_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        
+        layout.addWidget(self.anomaly_table)
+
+        self.anomaly_tab.setLayout(layout)
+
+    def load_anomalies(self, force=False):
+        # Only the selected hours and their trailing baseline are read
+        self.load_cached(
+            4, "anomalies", fetch_anomalies,
+            self.anomaly_window_combo.currentData(), self.anomaly_group_combo.currentData(),
+            on_result=self.show_anomalies, error="Error detecting anomalies",
+            clock="%Y-%m-%d %H", force=force
+        )
+
+    def show_anomalies(self, result):
+        anomalies = result["anomalies"]
+        group_by = self.anomaly_group_combo.currentData()
+        self.anomaly_table.setColumnHidden(2, "source" not in group_by)
+        self.anomaly_table.setColumnHidden(3, "category" not in group_by)
+
+        self.anomaly_table.setRowCount(len(anomalies))
+        for row, entry in enumerate(anomalies):
+            source = entry.get("source", "")
+            self.anomaly_table.setItem(row, 0, QTableWidgetItem(entry["hour"]))
+            self.anomaly_table.setItem(row, 1, QTableWidgetItem(entry["site"] or "(none)"))
+            self.anomaly_table.setItem(row, 2, QTableWidgetItem(LOG_TABLES.get(source, source)))
+            self.anomaly_table.setItem(row, 3, QTableWidgetItem(entry.get("category", "")))
+            self.anomaly_table.setItem(row, 4, QTableWidgetItem(str(entry["count"])))
+            self.anomaly_table.setItem(row, 5, QTableWidgetItem(f"{entry['mean']:.1f} ± {entry['std']:.1f}"))
+            z_item = QTableWidgetItem(f"{entry['z']:.1f}")
+            z_item.setForeground(QColor("#F44336") if entry["z"] >= 5 else QColor("#FF9800"))
+            self.anomaly_table.setItem(row, 6, z_item)
+
+        hotspots = result["hotspots"][:5]
+        if hotspots:
+            self.hotspot_label.setText("Hotspots: " + ", ".join(
+                f"{site or '(none)'} (+{excess:.0f} logs)" for site, excess in hotspots
+            ))
+        elif anomalies:
+            self.hotspot_label.setText("")
+        else:
+            self.hotspot_label.setText("No unusually busy hours in this period")
+        self.status_bar.showMessage(f"Found {len(anomalies)} unusually busy hours")
+
+    def setup_trends_tab(self):
+        layout = QVBoxLayout()
+        layout.setSpacing(15)
 
+        options_group = QGroupBox("Trends")
+        options_group.setFont(Fonts.LABEL)
+        options_layout = QHBoxLayout()
+        
+        self.trend_metric_combo = QComboBox()
+        self.trend_metric_combo.setFont(Fonts.NORMAL)
+        self.trend_metric_combo.setStyleSheet(DROPDOWN_STYLE)
+        self.trend_metric_combo.setMinimumHeight(45)
+        for label, metric in TREND_METRICS:
+            self.trend_metric_combo.addItem(label, metric)
+        self.trend_metric_combo.currentIndexChanged.connect(lambda: self.load_trend())
+        options_layout.addWidget(self.trend_metric_combo)
+        
+        self.trend_range_combo = QComboBox()
+        self.trend_range_combo.setFont(Fonts.NORMAL)
+        self.trend_range_combo.setStyleSheet(DROPDOWN_STYLE)
+        self.trend_range_combo.setMinimumHeight(45)
+        for label, days in TREND_RANGES:
+            self.trend_range_combo.addItem(label, days)
+        self.trend_range_combo.setCurrentIndex(1)
+        self.trend_range_combo.currentIndexChanged.connect(lambda: self.load_trend())
+        options_layout.addWidget(self.trend_range_combo)
+        
+        options_layout.addStretch()
+        hint = QLabel("Scroll to zoom, drag to pan, double-click to reset")
+        hint.setFont(Fonts.NORMAL)
+        hint.setStyleSheet("color: #808080;")
+        options_layout.addWidget(hint)
+        options_group.setLayout(options_layout)
+        layout.addWidget(options_group)
+
+        self.trend_chart = TimeSeriesChart()
+        layout.addWidget(self.trend_chart)
+
+        self.trends_tab.setLayout(layout)
+
+    def load_trend(self, force=False):
+        metric = self.trend_metric_combo.currentData()
+        self.trend_chart.empty_text = "Loading..."
+        self.trend_chart.clear()
+        self.load_cached(
+            5, "trend", fetch_trend, metric, self.trend_range_combo.currentData(),
+            on_result=lambda series: self.show_trend(metric, series),
+            error="Error loading trend", clock="%Y-%m-%d", force=force
+        )
+
+    def show_trend(self, metric, series):
+        self.trend_chart.empty_text = "No data for this period"
+        if metric == "response":
+            # Smooth measure: keep the shape rather than every extreme
+            self.trend_chart.set_series(series, "Minutes between linked logs", method="lttb")
+        else:
+            self.trend_chart.set_series(series, f"Logs per {metric}", method="minmax")
+        points = max((len(times) for _n, times, _v, _c in series), default=0)
+        self.status_bar.showMessage(f"Loaded {points} {metric if metric != 'response' else 'day'} buckets")
+
+    def load_response_percentiles(self, force=False):
+        # Chain titles label the "By Event Chain" grouping
+        self.load_event_chains()
+        self.load_cached(
+            3, "percentiles", response_time_report,
+            on_result=self.show_response_percentiles,
+            error="Error loading response percentiles", force=force
+        )
+
+    def show_response_percentiles(self, report):
+        self.response_report = report
+        overall = report["overall"]
+        if overall["count"]:
+            self.overall_label.setText(
+                f"All chains: {overall['count']} responses, "
+                f"p50 {format_minutes(overall['p50'])}, "
+                f"p90 {format_minutes(overall['p90'])}, "
+                f"p99 {format_minutes(overall['p99'])}"
+            )
+        else:
+            self.overall_label.setText("No event chain has two or more linked logs yet")
+        self.show_percentile_table()
+        self.status_bar.showMessage(f"Analyzed {overall['count']} responses across all chains")
+
+    def show_percentile_table(self):
+        self.percentile_table.setRowCount(0)
+        if self.response_report is None:
+            return
+        
+        grouping = self.percentile_group_combo.currentData()
+        groups = self.response_report[grouping]
+        if grouping == "by_chain":
+            titles = {chain_id: title for chain_id, title in self.chain_titles}
+            labels = {key: f"[{key}] {titles.get(key, '')}" for key in groups}
+        else:
+            labels = {key: str(key) for key in groups}
+        
+        # Slowest groups first
+        ordered = sorted(groups.items(), key=lambda item: item[1]["p90"], reverse=True)
+        self.percentile_table.setRowCount(len(ordered))
+        for row, (key, summary) in enumerate(ordered):
+            self.percentile_table.setItem(row, 0, QTableWidgetItem(labels[key]))
+            self.percentile_table.setItem(row, 1, QTableWidgetItem(str(summary["count"])))
+            for column, stat in enumerate(("min", "p50", "p90", "p99", "max"), start=2):
+                item = QTableWidgetItem(format_minutes(summary[stat]))
+                item.setForeground(response_time_color(summary[stat]))
+                self.percentile_table.setItem(row, column, item)
+
+    def load_event_chains(self, force=False):
+        self.load_cached(
+            0, "chains", fetch_chain_titles,
+            on_result=self.show_event_chains,
+            error="Error loading event chains", force=force
+        )
+        if force:
+            # Unchanged titles keep the selection, so recompute its analysis too
+            self.analyze_chain(force=True)
+
+    def show_event_chains(self, chains):
+        if chains == self.chain_titles and self.chain_combo.count():
+            # Unchanged; keep the current selection
+            return
+        self.chain_titles = chains
+        self.chain_combo.clear()
         self.chain_combo.addItem("Select an event chain...", None)
         for chain_id, title in chains:
             self.chain_combo.addItem(f"[{chain_id}] {title}", chain_id)
+        if self.response_report is not None:
+            self.show_percentile_table()
         
         self.status_bar.showMessage(f"Loaded {len(chains)} event chains")
 
-    def analyze_chain(self):
+    def load_cached(self, index, key, fn, *args, on_result, error, clock=None, force=False,
+                    tables=None):
+        """Show ``fn(*args)`` for tab ``index``, computing it on the task runner.
+
+        The result is kept in the shared ``query_cache``, keyed by
+        ``key``, the arguments and, for tabs relative to the current
+        time, the time formatted with ``clock``, and tagged with
+        ``tables`` (by default the tab's ``TAB_TABLES``). Until one of
+        those tables changes the cached result is shown at once;
+        ``force`` recomputes it anyway.
+        """
+        versions = query_cache.versions(TAB_TABLES[index] if tables is None else tables)
+        cache_key = ("stats", key, args, datetime.now().strftime(clock) if clock else None)
+        cached = MISS if force else query_cache.get(cache_key, versions)
+        if cached is not MISS:
+            on_result(cached)
+            return
+
+        def store(result):
+            query_cache.put(cache_key, versions, result)
+            on_result(result)
+
+        task_runner().submit(
+            fn, *args,
+            owner=self, key=key, priority=self.tab_priority(index),
+            on_result=store,
+            on_error=lambda exc: self.status_bar.showMessage(f"{error}: {exc}")
+        )
+
+    def reset_form(self):
+        """Bring the visible tab up to date when the panel is reopened"""
+        self.load_tab(self.tabs.currentIndex())
+
+    def load_tab(self, index, force=False):
+        """Load the tab at ``index``; cached results make this cheap"""
+        loaders = (
+            self.load_event_chains,
+            self.load_summary_stats,
+            self.load_event_analysis,
+            self.load_response_percentiles,
+            self.load_anomalies,
+            self.load_trend,
+        )
+        if 0 <= index < len(loaders):
+            loaders[index](force=force)
+
+    def tab_priority(self, index):
+        """Queue work for the visible tab ahead of the hidden ones"""
+        tabs = getattr(self, 'tabs', None)
+        current = tabs.currentIndex() if tabs is not None and tabs.count() else 0
+        return Priority.HIGH if index == current else Priority.LOW
+
+    def analyze_chain(self, force=False):
         if self.chain_combo.currentIndex() <= 0:
             return
 
@@ -331,106 +849,69 @@ class StatsPanel(QMainWindow):
         if not event_id:
             return
 
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-
         # Get all logs in this chain ordered by timestamp
-        c.execute("""
-            SELECT el.source_table, el.source_id, el.timestamp
-            FROM event_links el
-            WHERE el.event_id = ?
-            ORDER BY el.timestamp
-        """, (event_id,))
-        
-        logs = c.fetchall()
-        conn.close()
-
+        self.load_cached(
+            0, "response", fetch_chain_response, event_id,
+            on_result=self.show_response_times,
+            error="Error analyzing chain", force=force, tables=CHAIN_RESPONSE_TABLES
+        )
+
+    def show_response_times(self, result):
+        gaps, summary = result
         # Clear table
         self.response_table.setRowCount(0)
 
-        if len(logs) < 2:
+        if not gaps:
             self.stats_text.setText("Not enough events to calculate response times.\n\nAt least 2 logs must be linked to calculate response times.")
             self.avg_progress.setValue(0)
             return
 
-        # Calculate response times between consecutive events
-        response_times = []
-        for i in range(len(logs) - 1):
-            from_log = logs[i]
-            to_log = logs[i + 1]
+        # Gaps between consecutive events come precomputed from the analytics query
+        self.response_table.setRowCount(len(gaps))
+        for row, gap in enumerate(gaps):
+            minutes = gap["minutes"]
 
-            # Parse timestamps
-            try:
-                from_time = datetime.strptime(from_log[2], "%Y-%m-%d %H:%M:%S")
-                to_time = datetime.strptime(to_log[2], "%Y-%m-%d %H:%M:%S")
-                
-                # Calculate difference
-                diff = to_time - from_time
-                minutes = diff.total_seconds() / 60
+            # Format the display
+            from_display = f"{gap['from_table'].replace('_logs', '').title()} #{gap['from_id']}"
+            to_display = f"{gap['to_table'].replace('_logs', '').title()} #{gap['to_id']}"
+            
+            self.response_table.setItem(row, 0, QTableWidgetItem(from_display))
+            self.response_table.setItem(row, 1, QTableWidgetItem(to_display))
+            
+            # Response time with color coding
+            time_item = QTableWidgetItem(f"{minutes:.1f} minutes")
+            time_item.setForeground(response_time_color(minutes))
+            
+            self.response_table.setItem(row, 2, time_item)
+            self.response_table.setItem(row, 3, QTableWidgetItem(gap["from_table"].replace("_logs", "")))
+            self.response_table.setItem(row, 4, QTableWidgetItem(gap["to_table"].replace("_logs", "")))
 
-                # Add to table
-                row = self.response_table.rowCount()
-                self.response_table.insertRow(row)
-                
-                # Format the display
-                from_display = f"{from_log[0].replace('_logs', '').title()} #{from_log[1]}"
-                to_display = f"{to_log[0].replace('_logs', '').title()} #{to_log[1]}"
-                
-                self.response_table.setItem(row, 0, QTableWidgetItem(from_display))
-                self.response_table.setItem(row, 1, QTableWidgetItem(to_display))
-                
-                # Response time with color coding
-                time_item = QTableWidgetItem(f"{minutes:.1f} minutes")
-                if minutes < 5:
-                    time_item.setForeground(QColor("#4CAF50"))  # Green for fast
-                elif minutes < 15:
-                    time_item.setForeground(QColor("#FF9800"))  # Orange for moderate
-                else:
-                    time_item.setForeground(QColor("#F44336"))  # Red for slow
-                
-                self.response_table.setItem(row, 2, time_item)
-                self.response_table.setItem(row, 3, QTableWidgetItem(from_log[0].replace("_logs", "")))
-                self.response_table.setItem(row, 4, QTableWidgetItem(to_log[0].replace("_logs", "")))
+        # Calculate statistics
+        avg_response = summary["mean"]
 
-                response_times.append(minutes)
-            except Exception as e:
-                print(f"Error parsing timestamps: {e}")
+        # Update progress bar
+        self.avg_progress.setValue(int(min(avg_response, 60)))
 
-        # Calculate statistics
-        if response_times:
-            avg_response = sum(response_times) / len(response_times)
-            min_response = min(response_times)
-            max_response = max(response_times)
-
-            # Update progress bar
-            self.avg_progress.setValue(int(min(avg_response, 60)))
-
-            # Color code the progress bar
-            if avg_response < 5:
-                self.avg_progress.setStyleSheet("""
-                    QProgressBar::chunk { background-color: #4CAF50; }
-                """)
-            elif avg_response < 15:
-                self.avg_progress.setStyleSheet("""
-                    QProgressBar::chunk { background-color: #FF9800; }
-                """)
-            else:
-                self.avg_progress.setStyleSheet("""
-                    QProgressBar::chunk { background-color: #F44336; }
-                """)
-
-            stats_text = f"""📊 RESPONSE TIME ANALYSIS
+        # Color code the progress bar
+        self.avg_progress.setStyleSheet(f"""
+            QProgressBar::chunk {{ background-color: {response_time_color(avg_response).name()}; }}
+        """)
+
+        stats_text = f"""📊 RESPONSE TIME ANALYSIS
             
 Average Response Time: {avg_response:.1f} minutes
-Fastest Response: {min_response:.1f} minutes
-Slowest Response: {max_response:.1f} minutes
+Median (p50): {summary['p50']:.1f} minutes
+90th Percentile: {summary['p90']:.1f} minutes
+99th Percentile: {summary['p99']:.1f} minutes
+Fastest Response: {summary['min']:.1f} minutes
+Slowest Response: {summary['max']:.1f} minutes
 
-Total Events in Chain: {len(logs)}
-Response Times Calculated: {len(response_times)}
+Total Events in Chain: {summary['count'] + 1}
+Response Times Calculated: {summary['count']}
 
 Performance Rating: {self.get_performance_rating(avg_response)}"""
-            
-            self.stats_text.setText(stats_text)
+        
+        self.stats_text.setText(stats_text)
 
     def get_performance_rating(self, avg_minutes):
         """Get performance rating based on average response time"""
@@ -445,63 +926,18 @@ Performance Rating: {self.get_performance_rating(avg_response)}"""
         else:
             return "⭐ Needs Improvement"
 
-    def load_summary_stats(self):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
+    def load_summary_stats(self, force=False):
+        self.load_cached(
+            1, "summary", fetch_summary_counts,
+            on_result=self.show_summary_stats,
+            error="Error loading summary", clock="%Y-%m-%d", force=force
+        )
 
+    def show_summary_stats(self, counts):
         self.summary_table.setRowCount(0)
-        
-        # Current date for calculations
-        today = datetime.now().date()
-        week_ago = today - timedelta(days=7)
-
-        # Get counts for each log type
-        log_types = [
-            ("Email Logs", "email_logs", Colors.EMAIL),
-            ("Phone Logs", "phone_logs", Colors.PHONE),
-            ("Radio Logs", "radio_logs", Colors.RADIO),
-            ("Everbridge Logs", "everbridge_logs", Colors.EVERBRIDGE)
-        ]
-
-        totals = {"emails": 0, "calls": 0, "radio": 0, "alerts": 0}
-
-        for display_name, table_name, color in log_types:
-            # Total count
-            c.execute(f"SELECT COUNT(*) FROM {table_name}")
-            total_count = c.fetchone()[0]
-
-            # Today's count
-            c.execute(f"""
-                SELECT COUNT(*) FROM {table_name} 
-                WHERE DATE(created_at) = DATE('now', 'localtime')
-            """)
-            today_count = c.fetchone()[0]
-
-            # This week's count
-            c.execute(f"""
-                SELECT COUNT(*) FROM {table_name} 
-                WHERE DATE(created_at) >= DATE('now', '-7 days', 'localtime')
-            """)
-            week_count = c.fetchone()[0]
 
-            # Get date range for average calculation
-            c.execute(f"""
-                SELECT MIN(created_at), MAX(created_at) 
-                FROM {table_name} 
-                WHERE created_at IS NOT NULL
-            """)
-            date_range = c.fetchone()
-
-            avg_per_day = "N/A"
-            if date_range[0] and date_range[1]:
-                try:
-                    start = datetime.strptime(date_range[0], "%Y-%m-%d %H:%M:%S")
-                    end = datetime.strptime(date_range[1], "%Y-%m-%d %H:%M:%S")
-                    days = (end - start).days + 1
-                    if days > 0:
-                        avg_per_day = f"{total_count / days:.1f}"
-                except:
-                    pass
+        for display_name, table_name, color in SUMMARY_LOG_TYPES:
+            total_count, today_count, week_count, avg_per_day = counts[table_name]
 
             row = self.summary_table.rowCount()
             self.summary_table.insertRow(row)
@@ -527,59 +963,52 @@ Performance Rating: {self.get_performance_rating(avg_response)}"""
             elif "Everbridge" in display_name:
                 self.everbridge_card.findChild(QLabel, "⚠️ Alerts_value").setText(str(total_count))
 
-        conn.close()
         self.status_bar.showMessage("Summary statistics updated")
 
-    def load_event_analysis(self):
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-
+    def load_event_analysis(self, force=False):
+        # Chains carry their link count and time span and the analytics
+        # query supplies every chain's gaps, so no per-chain query is needed
+        self.load_cached(
+            2, "analysis", fetch_chain_analysis,
+            on_result=self.show_event_analysis,
+            error="Error analyzing chains", force=force
+        )
+
+    def show_event_analysis(self, result):
+        chains, chain_stats = result
         self.analysis_table.setRowCount(0)
 
-        # Get all event chains
-        c.execute("SELECT id, title, created_at FROM event_chains")
-        chains = c.fetchall()
-
-        for chain_id, title, created_at in chains:
-            # Get log count
-            c.execute("""
-                SELECT COUNT(*), MIN(timestamp), MAX(timestamp)
-                FROM event_links
-                WHERE event_id = ?
-            """, (chain_id,))
-            
-            result = c.fetchone()
-            log_count = result[0]
+        for chain in chains:
+            title = chain.title
+            created_at = chain.created_at
+            log_count = chain.link_count
+            stats = chain_stats.get(chain.id)
             
             duration = "N/A"
             avg_response = "N/A"
+            p90_response = "N/A"
             status = "Empty"
 
-            if log_count > 1 and result[1] and result[2]:
+            if stats and log_count > 1 and chain.first_ts and chain.last_ts:
                 try:
-                    start = datetime.strptime(result[1], "%Y-%m-%d %H:%M:%S")
-                    end = datetime.strptime(result[2], "%Y-%m-%d %H:%M:%S")
-                    duration_mins = (end - start).total_seconds() / 60
-                    
-                    if duration_mins < 60:
-                        duration = f"{duration_mins:.1f} min"
-                    else:
-                        hours = duration_mins / 60
-                        duration = f"{hours:.1f} hrs"
-                    
-                    # Calculate average response time
-                    avg_response_mins = duration_mins / (log_count - 1)
-                    avg_response = f"{avg_response_mins:.1f} min"
-                    
-                    # Determine status
-                    if avg_response_mins < 10:
-                        status = "✅ Excellent"
-                    elif avg_response_mins < 20:
-                        status = "⚠️ Good"
-                    else:
-                        status = "❌ Slow"
+                    start = datetime.strptime(chain.first_ts, "%Y-%m-%d %H:%M:%S")
+                    end = datetime.strptime(chain.last_ts, "%Y-%m-%d %H:%M:%S")
+                    duration = format_minutes((end - start).total_seconds() / 60)
                 except:
                     pass
+                
+                # Measured from the individual gaps between the chain's logs
+                avg_response_mins = stats['mean']
+                avg_response = f"{avg_response_mins:.1f} min"
+                p90_response = f"{stats['p90']:.1f} min"
+                
+                # Determine status
+                if avg_response_mins < 10:
+                    status = "✅ Excellent"
+                elif avg_response_mins < 20:
+                    status = "⚠️ Good"
+                else:
+                    status = "❌ Slow"
             elif log_count == 1:
                 status = "📝 Single Log"
 
@@ -590,6 +1019,7 @@ Performance Rating: {self.get_performance_rating(avg_response)}"""
             self.analysis_table.setItem(row, 1, QTableWidgetItem(str(log_count)))
             self.analysis_table.setItem(row, 2, QTableWidgetItem(duration))
             self.analysis_table.setItem(row, 3, QTableWidgetItem(avg_response))
+            self.analysis_table.setItem(row, 4, QTableWidgetItem(p90_response))
             
             status_item = QTableWidgetItem(status)
             if "Excellent" in status:
@@ -599,21 +1029,14 @@ Performance Rating: {self.get_performance_rating(avg_response)}"""
             elif "Slow" in status:
                 status_item.setForeground(QColor("#F44336"))
             
-            self.analysis_table.setItem(row, 4, status_item)
-            self.analysis_table.setItem(row, 5, QTableWidgetItem(created_at[:10]))  # Date only
+            self.analysis_table.setItem(row, 5, status_item)
+            self.analysis_table.setItem(row, 6, QTableWidgetItem(created_at[:10]))  # Date only
 
-        conn.close()
         self.status_bar.showMessage(f"Analyzed {len(chains)} event chains")
 
     def refresh_current_tab(self):
-        """Refresh the current tab"""
-        current_index = self.tabs.currentIndex()
-        if current_index == 0:
-            self.load_event_chains()
-        elif current_index == 1:
-            self.load_summary_stats()
-        elif current_index == 2:
-            self.load_event_analysis()
+        """Recompute the current tab, bypassing its cached result"""
+        self.load_tab(self.tabs.currentIndex(), force=True)
 
     def print_report(self):
         """Placeholder for print functionality"""
@@ -0,0 +1,276 @@
+"""
+Qt item models shared by the table views.
+
+``DataFrameTableModel`` exposes a pandas DataFrame to a ``QTableView``
+without copying it into per-cell ``QTableWidgetItem`` objects. Each
+column is held as a NumPy array and cells are only formatted when the
+view asks for them, so the cost of showing a log depends on the rows
+on screen rather than on the size of the log. The module itself does
+not import pandas or NumPy, so views that only use ``PagedTableModel``
+don't load them.
+
+``PagedTableModel`` does the same for paginated database queries: the
+view pulls further pages through ``fetchMore`` as the user scrolls.
+"""
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtWidgets import QHeaderView, QTableView
+
+# Rows sampled when estimating column widths
+WIDTH_SAMPLE_ROWS = 200
+# Upper bound for an estimated column width, in pixels
+MAX_COLUMN_WIDTH = 400
+
+
+def format_cell(value) -> str:
+    """Format a single cell value for display."""
+    if value is None:
+        return ""
+    try:
+        # NaN and NaT are the only values not equal to themselves
+        if value != value:
+            return ""
+    except TypeError:
+        # pandas.NA has no truth value
+        return ""
+    return str(value)
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    """Read-only table model backed by the columns of a DataFrame."""
+
+    def __init__(self, frame=None, parent=None):
+        super().__init__(parent)
+        self._frame = None
+        self._headers: list[str] = []
+        self._columns: list = []
+        self._rows = 0
+        if frame is not None:
+            self.set_frame(frame)
+
+    def set_frame(self, frame) -> None:
+        """Replace the displayed data with a DataFrame, or clear it with ``None``."""
+        self.beginResetModel()
+        self._frame = frame
+        if frame is None:
+            self._headers, self._columns, self._rows = [], [], 0
+        else:
+            self._headers = [str(c) for c in frame.columns]
+            self._columns = [frame.iloc[:, i].to_numpy() for i in range(frame.shape[1])]
+            self._rows = len(frame)
+        self.endResetModel()
+
+    def frame(self):
+        """Return the DataFrame in its current (possibly sorted) order, or ``None``."""
+        return self._frame
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return format_cell(self._columns[index.column()][index.row()])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if not 0 <= column < len(self._columns):
+            return
+        name = self._frame.columns[column]
+        ascending = order == Qt.SortOrder.AscendingOrder
+        self.layoutAboutToBeChanged.emit()
+        try:
+            frame = self._frame.sort_values(
+                name, ascending=ascending, kind="mergesort", na_position="last"
+            )
+        except TypeError:
+            # Mixed types in an object column; fall back to text order
+            frame = self._frame.sort_values(
+                name, ascending=ascending, kind="mergesort", na_position="last",
+                key=lambda s: s.astype(str),
+            )
+        self._frame = frame
+        self._columns = [frame.iloc[:, i].to_numpy() for i in range(frame.shape[1])]
+        self.layoutChanged.emit()
+
+
+def resize_columns_from_sample(view: QTableView, sample_rows: int = WIDTH_SAMPLE_ROWS) -> None:
+    """Size the columns of ``view`` from an evenly spaced sample of rows.
+
+    ``resizeColumnsToContents`` measures every cell, which is linear in
+    the row count. Measuring a fixed sample keeps the cost constant.
+    """
+    model = view.model()
+    rows = model.rowCount()
+    if rows == 0 or model.columnCount() == 0:
+        return
+    metrics = view.fontMetrics()
+    count = min(rows, sample_rows)
+    sample = sorted({(rows - 1) * i // max(count - 1, 1) for i in range(count)})
+    padding = 2 * metrics.horizontalAdvance("M")
+    for column in range(model.columnCount()):
+        header = model.headerData(column, Qt.Orientation.Horizontal) or ""
+        width = metrics.horizontalAdvance(str(header))
+        for row in sample:
+            text = model.data(model.index(int(row), column)) or ""
+            width = max(width, metrics.horizontalAdvance(text))
+        view.setColumnWidth(column, min(width + padding, MAX_COLUMN_WIDTH))
+
+
+def configure_large_table(view: QTableView) -> None:
+    """Apply view settings that keep scrolling cheap for large models."""
+    vertical = view.verticalHeader()
+    vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    vertical.setDefaultSectionSize(view.fontMetrics().height() + 10)
+    view.setWordWrap(False)
+    view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+
+
+def list_fetch(rows: list):
+    """Return a ``PagedTableModel`` fetch function serving pages of ``rows``."""
+    positions = {}
+
+    def fetch(limit, after):
+        if after is None:
+            start = 0
+        else:
+            if not positions:
+                positions.update((id(row), i) for i, row in enumerate(rows))
+            start = positions[id(after)] + 1
+        return rows[start:start + limit]
+
+    return fetch
+
+
+class PagedTableModel(QAbstractTableModel):
+    """Read-only table model that pulls rows from a paginated source.
+
+    ``fetch(limit, after)`` must return a list of dicts or of records
+    whose fields are attributes (such as ``NamedTuple`` rows). The view asks
+    for more rows through ``canFetchMore``/``fetchMore`` as the user
+    scrolls, so only the pages that are actually looked at are loaded.
+    ``after`` is the last row fetched so far, or ``None`` for the first
+    page, so a database source can page by its sort key (keyset paging)
+    rather than by an ``OFFSET`` that rescans every earlier row. Use
+    ``list_fetch`` for rows already in memory.
+
+    Parameters
+    ----------
+    columns: list of tuple
+        ``(header, key)`` pairs; ``key`` selects the dict value or
+        record attribute shown in that column.
+    page_size: int
+        Rows requested per ``fetch`` call.
+    fonts: dict or None
+        Optional column index to ``QFont`` mapping.
+    foreground: callable or None
+        Optional ``foreground(row_dict, column)`` returning a colour
+        for the cell, or ``None`` for the default.
+    """
+
+    def __init__(self, columns, page_size=200, fonts=None, foreground=None, parent=None):
+        super().__init__(parent)
+        self._columns = list(columns)
+        self.page_size = page_size
+        self._fonts = fonts or {}
+        self._foreground = foreground
+        self._fetch = None
+        self._rows: list[dict] = []
+        # Last row fetched; kept when rows are removed from the view
+        self._cursor = None
+        self._exhausted = True
+
+    def set_fetch(self, fetch, first_page: list[dict] | None = None) -> None:
+        """Replace the row source and load its first page.
+
+        ``first_page`` may hold rows already fetched elsewhere (for
+        example on a worker thread) to avoid querying them again.
+        """
+        self.beginResetModel()
+        self._fetch = fetch
+        self._rows = list(first_page or [])
+        self._cursor = self._rows[-1] if self._rows else None
+        self._exhausted = fetch is None or (
+            first_page is not None and len(first_page) < self.page_size
+        )
+        self.endResetModel()
+        if first_page is None and self.canFetchMore():
+            self.fetchMore()
+
+    def row_data(self, row: int):
+        """Return the source dict or record for ``row``."""
+        return self._rows[row]
+
+    def remove_rows(self, rows) -> None:
+        """Drop the given row numbers, e.g. after they were linked."""
+        for row in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        page = self._fetch(self.page_size, self._cursor)
+        if len(page) < self.page_size:
+            self._exhausted = True
+        if not page:
+            return
+        self._cursor = page[-1]
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            key = self._columns[column][1]
+            if not key:
+                return None
+            return format_cell(row.get(key) if isinstance(row, dict) else getattr(row, key, None))
+        if role == Qt.ItemDataRole.FontRole:
+            return self._fonts.get(column)
+        if role == Qt.ItemDataRole.ForegroundRole and self._foreground is not None:
+            return self._foreground(row, column)
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._columns[section][0]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
@@ -0,0 +1,358 @@
+"""
+Background task runner shared by every panel.
+
+Database queries, workbook parsing and Outlook COM calls can take far
+longer than a frame, so panels hand them to ``task_runner()`` instead
+of running them on the event loop. The runner executes them on a
+``QThreadPool`` and delivers results, errors and progress back on the
+GUI thread.
+
+Each task belongs to an *owner* (normally the panel that submitted it)
+and may carry a *key*. Submitting a task with the same owner and key
+cancels the previous one, so pressing Refresh twice never applies a
+stale result. Cancelled tasks are taken off the queue if they have not
+started, and their results are dropped if they have. Long tasks can
+poll their ``CancelToken`` to stop early.
+
+``BusyIndicator`` shows a panel's outstanding work in its status bar.
+"""
+
+import itertools
+import threading
+import time
+from enum import IntEnum
+
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+from PyQt6.QtWidgets import QProgressBar
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# GUI-thread callbacks slower than this are logged (ms)
+SLOW_CALLBACK_MS = 50
+# Upper bound on worker threads; SQLite and Excel work is mostly I/O
+MAX_WORKERS = 4
+
+
+class Priority(IntEnum):
+    """Queue priority; higher values start first."""
+
+    LOW = 0
+    NORMAL = 50
+    HIGH = 100
+
+
+class TaskCancelled(Exception):
+    """Raised by ``CancelToken.check`` once the task was cancelled."""
+
+
+class CancelToken:
+    """Thread-safe cancellation flag handed to running tasks."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self):
+        """Raise ``TaskCancelled`` if the task was cancelled."""
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+class TaskContext:
+    """Passed as the first argument to tasks submitted with ``context=True``.
+
+    Attributes
+    ----------
+    token: CancelToken
+        Poll ``token.cancelled`` or call ``token.check()`` between steps.
+    """
+
+    def __init__(self, token, signals):
+        self.token = token
+        self._signals = signals
+
+    def progress(self, percent, message="", data=None):
+        """Report progress; ``data`` may carry a partial result."""
+        if not self.token.cancelled:
+            self._signals.progress.emit(int(percent), message, data)
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    progress = pyqtSignal(int, str, object)
+
+
+class _Task(QRunnable):
+    def __init__(self, task_id, fn, args, kwargs, context, token, signals):
+        super().__init__()
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.context = context
+        self.token = token
+        self.signals = signals
+
+    def run(self):
+        if self.token.cancelled:
+            self.signals.failed.emit("")
+            return
+        try:
+            args = self.args
+            if self.context:
+                args = (TaskContext(self.token, self.signals),) + args
+            result = self.fn(*args, **self.kwargs)
+        except TaskCancelled:
+            self.signals.failed.emit("")
+            return
+        except Exception as exc:
+            logger.exception("Background task %s failed", getattr(self.fn, "__name__", self.fn))
+            self.signals.failed.emit(str(exc) or exc.__class__.__name__)
+            return
+        self.signals.finished.emit(result)
+
+
+class TaskHandle:
+    """Returned by ``TaskRunner.submit``; lets the caller cancel the task."""
+
+    def __init__(self, runner, task_id, token):
+        self._runner = runner
+        self.task_id = task_id
+        self.token = token
+
+    def cancel(self):
+        self._runner._cancel_task(self.task_id)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+
+class TaskRunner(QObject):
+    """Run callables on a thread pool and report back on the GUI thread.
+
+    Signals
+    -------
+    busy_changed(object, bool)
+        An owner started or finished all of its outstanding tasks.
+    progress(object, int, str)
+        An owner's task reported progress as a percentage and message.
+    """
+
+    busy_changed = pyqtSignal(object, bool)
+    progress = pyqtSignal(object, int, str)
+
+    def __init__(self, max_workers=None, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_workers or max(2, min(MAX_WORKERS, QThread.idealThreadCount())))
+        self._ids = itertools.count(1)
+        # task id -> (owner key, task key, runnable, token, signals)
+        self._tasks = {}
+        # (owner key, task key) -> task id of the latest keyed task
+        self._keyed = {}
+        # owner key -> number of outstanding tasks
+        self._active = {}
+        self._owners = {}
+
+    def submit(self, fn, *args, owner=None, key=None, priority=Priority.NORMAL,
+               on_result=None, on_error=None, on_progress=None, context=False, **kwargs):
+        """Run ``fn(*args, **kwargs)`` on a worker thread.
+
+        Parameters
+        ----------
+        fn: callable
+            The work to run. It must not touch widgets.
+        owner: QObject or None
+            The panel the task belongs to. Its tasks are cancelled when
+            it is destroyed and drive its ``BusyIndicator``.
+        key: str or None
+            Cancels the owner's previous task with the same key.
+        priority: Priority
+            Queue priority among tasks that have not started.
+        on_result, on_error, on_progress: callable or None
+            Called on the GUI thread with the return value, the error
+            message, or ``(percent, message, data)`` respectively.
+            None of them are called once the task is cancelled.
+        context: bool
+            Pass a ``TaskContext`` as the first argument so the task can
+            report progress and poll for cancellation.
+
+        Returns
+        -------
+        TaskHandle
+        """
+        owner_key = self._register_owner(owner)
+        if key is not None:
+            previous = self._keyed.get((owner_key, key))
+            if previous is not None:
+                self._cancel_task(previous)
+
+        task_id = next(self._ids)
+        token = CancelToken()
+        signals = _TaskSignals()
+        signals.finished.connect(
+            lambda result: self._on_finished(task_id, on_result, result)
+        )
+        signals.failed.connect(
+            lambda error: self._on_failed(task_id, on_error, error)
+        )
+        signals.progress.connect(
+            lambda percent, message, data: self._on_progress(task_id, on_progress, percent, message, data)
+        )
+        runnable = _Task(task_id, fn, args, kwargs, context, token, signals)
+        runnable.setAutoDelete(False)
+
+        self._tasks[task_id] = (owner_key, key, runnable, token, signals)
+        if key is not None:
+            self._keyed[(owner_key, key)] = task_id
+        self._set_active(owner_key, 1)
+        self.pool.start(runnable, int(priority))
+        return TaskHandle(self, task_id, token)
+
+    def cancel(self, owner, key=None):
+        """Cancel the owner's task with ``key``, or all of its tasks."""
+        owner_key = id(owner)
+        for task_id, (task_owner, task_key, *_rest) in list(self._tasks.items()):
+            if task_owner == owner_key and (key is None or task_key == key):
+                self._cancel_task(task_id)
+
+    def is_busy(self, owner) -> bool:
+        return self._active.get(id(owner), 0) > 0
+
+    def _register_owner(self, owner):
+        owner_key = id(owner)
+        if owner is not None and owner_key not in self._owners:
+            self._owners[owner_key] = owner
+            owner.destroyed.connect(lambda *_args, k=owner_key: self._forget_owner(k))
+        return owner_key
+
+    def _forget_owner(self, owner_key):
+        for task_id, (task_owner, *_rest) in list(self._tasks.items()):
+            if task_owner == owner_key:
+                self._cancel_task(task_id, notify=False)
+        self._owners.pop(owner_key, None)
+        self._active.pop(owner_key, None)
+
+    def _cancel_task(self, task_id, notify=True):
+        entry = self._tasks.get(task_id)
+        if entry is None:
+            return
+        owner_key, key, runnable, token, _signals = entry
+        token.cancel()
+        if self.pool.tryTake(runnable):
+            # Never started, so no signal will arrive to finish it
+            self._finish(task_id, notify)
+
+    def _finish(self, task_id, notify=True):
+        entry = self._tasks.pop(task_id, None)
+        if entry is None:
+            return None
+        owner_key, key, _runnable, token, _signals = entry
+        if key is not None and self._keyed.get((owner_key, key)) == task_id:
+            del self._keyed[(owner_key, key)]
+        if notify:
+            self._set_active(owner_key, -1)
+        return token
+
+    def _set_active(self, owner_key, delta):
+        before = self._active.get(owner_key, 0)
+        after = max(0, before + delta)
+        self._active[owner_key] = after
+        owner = self._owners.get(owner_key)
+        if owner is not None and (before == 0) != (after == 0):
+            self.busy_changed.emit(owner, after > 0)
+
+    def _on_finished(self, task_id, callback, result):
+        token = self._finish(task_id)
+        if token is not None and not token.cancelled and callback is not None:
+            self._call(callback, result)
+
+    def _on_failed(self, task_id, callback, error):
+        token = self._finish(task_id)
+        if token is not None and not token.cancelled and error and callback is not None:
+            self._call(callback, error)
+
+    def _on_progress(self, task_id, callback, percent, message, data):
+        entry = self._tasks.get(task_id)
+        if entry is None or entry[3].cancelled:
+            return
+        owner = self._owners.get(entry[0])
+        if owner is not None:
+            self.progress.emit(owner, percent, message)
+        if callback is not None:
+            self._call(callback, percent, message, data)
+
+    @staticmethod
+    def _call(callback, *args):
+        start = time.perf_counter()
+        try:
+            callback(*args)
+        except Exception:
+            logger.exception("Task callback %s failed", getattr(callback, "__name__", callback))
+        elapsed = (time.perf_counter() - start) * 1000
+        if elapsed > SLOW_CALLBACK_MS:
+            logger.warning(
+                "Task callback %s blocked the event loop for %.0f ms",
+                getattr(callback, "__qualname__", callback), elapsed,
+            )
+
+
+class BusyIndicator(QProgressBar):
+    """Compact progress bar shown while an owner has tasks running.
+
+    It is indeterminate until a task reports a percentage.
+    """
+
+    def __init__(self, owner, parent=None):
+        super().__init__(parent)
+        self.owner = owner
+        self.setMaximumWidth(160)
+        self.setMaximumHeight(14)
+        self.setTextVisible(False)
+        self.setRange(0, 0)
+        self.hide()
+        runner = task_runner()
+        runner.busy_changed.connect(self._on_busy_changed)
+        runner.progress.connect(self._on_progress)
+
+    def _on_busy_changed(self, owner, busy):
+        if owner is not self.owner:
+            return
+        self.setRange(0, 0)
+        self.setToolTip("")
+        self.setVisible(busy)
+
+    def _on_progress(self, owner, percent, message):
+        if owner is not self.owner:
+            return
+        self.setRange(0, 100)
+        self.setValue(max(0, min(100, percent)))
+        self.setToolTip(message)
+
+
+def install_busy_indicator(panel):
+    """Add a ``BusyIndicator`` for ``panel`` to its status bar."""
+    indicator = BusyIndicator(panel, panel)
+    panel.statusBar().addPermanentWidget(indicator)
+    return indicator
+
+
+_runner = None
+
+
+def task_runner() -> TaskRunner:
+    """Return the application-wide ``TaskRunner``."""
+    global _runner
+    if _runner is None:
+        _runner = TaskRunner()
+    return _runner